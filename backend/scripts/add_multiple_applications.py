@@ -1,407 +1,531 @@
 """
 Add Multiple Applications for Existing Candidates
 - Reads existing candidates from database
-- Creates additional applications for 200 random candidates
-- Uses SAME logic as generate_candidates_v2.py for scoring
+- Creates additional applications for 200 random candidates (sampled by id,
+  profiles loaded in batches, so only the sample is held in memory)
+- Scores against each role's real requirements with the shared scoring
+  library (scoring.py), the same code path generate_candidates_v2.py uses
 - Each candidate applies to 1 additional random job
-- Inserts new applications, AI analysis, tests, and decisions into DB
+- Inserts new applications, AI analysis, tests, and decisions into DB,
+  plus their normalized skill/certification rows (skill_tables.py)
+- Folds the new applications into the analytics summary tables (analytics_summary.py)
+- With a live_writer.LiveWriter (generate_candidates_v2.py --live) every
+  chunk is scored with placeholder ids before taking the lock, then written
+  in one BEGIN IMMEDIATE transaction that reads the next ids and drops pairs
+  the backend has added meanwhile
 """
 
+import argparse
 import json
 import random
 import sqlite3
+import time
 from datetime import datetime, timedelta
 import os
 
-# Import core functions from generate_candidates_v2.py
+# Import core functions from generate_candidates_v2.py and scoring.py
 import sys
 sys.path.append(os.path.dirname(__file__))
 
+from generate_candidates_v2 import generate_test_score_and_performance, get_next_ids
+from scoring import (
+    calculate_ai_score,
+    calculate_composite_score,
+    composite_weights,
+    load_role_catalog_from_db,
+)
+import analytics_summary
+import skill_tables
+
 # Database path
 DB_PATH = os.path.join(os.path.dirname(__file__), '../database/recruitment.db')
 
-def calculate_ai_score(candidate, job_role):
-    """
-    Calculate AI score using job-specific weights
-    SAME LOGIC as generate_candidates_v2.py
-    """
-    weights = job_role['weights']
-    required_skills = job_role.get('skillKeywords', [])
-    
-    # 1. Skills match
-    matched_skills = [s for s in candidate['skills'] if s in required_skills]
-    skill_match = len(matched_skills) / max(len(required_skills), 1)
-    skill_score = skill_match * 100 * weights['skills']
-    
-    # 2. Knowledge match (simplified - based on experience)
-    knowledge_score = min(candidate['experience_years'] / 5, 1.0) * 100 * weights['knowledge']
-    
-    # 3. Task capability (based on experience level)
-    task_levels = {'entry': 0.6, 'mid': 0.8, 'senior': 1.0}
-    task_score = task_levels.get(candidate['experience_level'], 0.7) * 100 * weights['tasks']
-    
-    # 4. Certifications match
-    cert_score = (1.0 if candidate['certifications'] else 0.5) * 100 * weights['certifications']
-    
-    # 5. Education match
-    edu_score = (1.0 if 'Bachelor' in candidate['education'] or 'Master' in candidate['education'] else 0.7) * 100 * weights['education']
-    
-    # Total AI score
-    ai_score = skill_score + knowledge_score + task_score + cert_score + edu_score
-    
-    # Store matched/missing skills
-    candidate['matched_skills'] = matched_skills
-    candidate['missing_skills'] = [s for s in required_skills if s not in matched_skills]
-    
-    return round(ai_score, 1)
-
-def generate_test_score(ai_score):
-    """
-    Generate test score with variation from AI score
-    SAME LOGIC as generate_candidates_v2.py
-    """
-    variation = random.uniform(-15, 15)
-    test_score = ai_score + variation
-    test_score = max(40, min(95, test_score))  # Clamp to 40-95
-    return round(test_score, 1)
-
-def generate_skill_performance(matched_skills, test_score):
-    """
-    Generate skill-by-skill performance
-    """
-    skill_performance = {}
-    for skill in matched_skills[:5]:  # Top 5 skills
-        # Base on test score with some variation
-        skill_score = test_score + random.uniform(-10, 10)
-        skill_score = max(40, min(100, skill_score))
-        
-        if skill_score >= 70:
-            level = 'strong'
-        elif skill_score >= 50:
-            level = 'moderate'
-        else:
-            level = 'weak'
-        
-        skill_performance[skill] = {
-            'percentage': round(skill_score, 1),
-            'level': level
-        }
-    
-    return skill_performance
-
-def calculate_composite_score(ai_score, test_score, experience_level):
-    """
-    Calculate composite score with experience-based weighting
-    SAME LOGIC as generate_candidates_v2.py
-    """
-    weights = {
-        'entry': {'ai': 0.7, 'test': 0.3},
-        'mid': {'ai': 0.4, 'test': 0.6},
-        'senior': {'ai': 0.3, 'test': 0.7}
-    }
-    
-    w = weights.get(experience_level, weights['mid'])
-    composite = (ai_score * w['ai']) + (test_score * w['test'])
-    
-    return round(composite, 1)
+# Candidates per profile-loading batch when adding applications
+SAMPLE_BATCH_SIZE = 50000
+
+# Placeholder ids for rows generated before the live transaction assigns real ones
+PLACEHOLDER_IDS = {'applications': 0, 'ai_analysis': 0, 'tests': 0, 'decisions': 0}
+# Candidate ids per lookup of already-taken (candidate, role) pairs
+PAIR_LOOKUP_BATCH = 500
+
+# Single set-based pass over candidates: applied roles via GROUP_CONCAT and
+# each candidate's first AI analysis picked with a window function
+# ({sample} optionally restricts every step to the ids in temp.profile_sample)
+CANDIDATE_PROFILES_SQL = """
+    WITH applied AS (
+        SELECT candidate_id, GROUP_CONCAT(role_id) AS applied_jobs
+        FROM applications
+        {sample_where}
+        GROUP BY candidate_id
+    ),
+    first_analysis AS (
+        SELECT a.candidate_id,
+               an.skills_matched, an.certifications, an.education,
+               an.experience_years, an.experience_level,
+               ROW_NUMBER() OVER (
+                   PARTITION BY a.candidate_id
+                   ORDER BY a.application_id, an.analysis_id
+               ) AS rn
+        FROM applications a
+        JOIN ai_analysis an ON an.application_id = a.application_id
+        {sample_where_a}
+    )
+    SELECT c.candidate_id, c.name, c.email, c.phone,
+           ap.applied_jobs,
+           fa.skills_matched, fa.certifications, fa.education,
+           fa.experience_years, fa.experience_level
+    FROM candidates c
+    LEFT JOIN applied ap ON ap.candidate_id = c.candidate_id
+    LEFT JOIN first_analysis fa ON fa.candidate_id = c.candidate_id AND fa.rn = 1
+    {sample_where_c}
+    ORDER BY c.candidate_id
+"""
 
-print("=" * 60)
-print("Adding Multiple Applications for Existing Candidates")
-print("=" * 60)
+# Named placeholders, so the generated row dicts go straight to executemany
+INSERT_APPLICATION_SQL = """
+    INSERT INTO applications (application_id, candidate_id, role_id, status, applied_at, updated_at)
+    VALUES (:application_id, :candidate_id, :role_id, :status, :applied_at, :updated_at)
+"""
 
-# Connect to database
-conn = sqlite3.connect(DB_PATH)
-conn.row_factory = sqlite3.Row
-cursor = conn.cursor()
+INSERT_ANALYSIS_SQL = """
+    INSERT INTO ai_analysis (
+        analysis_id, application_id, ai_score, skills_matched, skill_gaps,
+        experience_years, experience_level, education, certifications, reasoning, analysis_completed_at
+    ) VALUES (
+        :analysis_id, :application_id, :ai_score, :skills_matched, :skill_gaps,
+        :experience_years, :experience_level, :education, :certifications, :reasoning, :analysis_completed_at
+    )
+"""
 
-# Load job roles from jobRoles.js
-job_roles_path = os.path.join(os.path.dirname(__file__), '../data/jobRoles.js')
-print(f"\n📂 Loading job roles from: {job_roles_path}")
+INSERT_TEST_SQL = """
+    INSERT INTO tests (
+        test_id, application_id, test_token, test_score, started_at, completed_at,
+        duration_minutes, answers, verified_skills, unverified_skills, verification_details
+    ) VALUES (
+        :test_id, :application_id, :test_token, :test_score, :started_at, :completed_at,
+        :duration_minutes, :answers, :verified_skills, :unverified_skills, :verification_details
+    )
+"""
 
-# Parse jobRoles.js (simplified - assumes module.exports = jobRoles)
-with open(job_roles_path, 'r') as f:
-    content = f.read()
-    # Extract the array between 'const jobRoles = [' and '];'
-    start = content.find('const jobRoles = [')
-    end = content.find('];', start)
-    if start == -1 or end == -1:
-        print("❌ Could not parse jobRoles.js")
-        exit(1)
-    
-    # This is a simplified parser - in production, use proper JS parser
-    # For now, we'll load from database instead
-    
-# Load job roles from database
-cursor.execute("SELECT * FROM job_roles")
-job_roles_db = cursor.fetchall()
-print(f"✅ Loaded {len(job_roles_db)} job roles from database")
+INSERT_DECISION_SQL = """
+    INSERT INTO decisions (
+        decision_id, application_id, composite_score, resume_weight, test_weight, decided_by
+    ) VALUES (:decision_id, :application_id, :composite_score, :resume_weight, :test_weight, :decided_by)
+"""
 
-# Load existing candidates
-cursor.execute("""
-    SELECT c.*, 
-           GROUP_CONCAT(a.role_id) as applied_jobs
-    FROM candidates c
-    LEFT JOIN applications a ON c.candidate_id = a.candidate_id
-    GROUP BY c.candidate_id
-""")
-candidates_db = cursor.fetchall()
-print(f"✅ Loaded {len(candidates_db)} existing candidates")
+SAMPLE_FILTER = "WHERE {alias}candidate_id IN (SELECT candidate_id FROM temp.profile_sample)"
 
-# Convert to dict format
-candidates = []
-for row in candidates_db:
-    # Parse skills from existing data (we'll infer from their applications)
-    cursor.execute("""
-        SELECT skills_matched FROM ai_analysis 
-        WHERE application_id IN (
-            SELECT application_id FROM applications WHERE candidate_id = ?
-        )
-        LIMIT 1
-    """, (row['candidate_id'],))
-    
-    skills_row = cursor.fetchone()
-    skills = json.loads(skills_row['skills_matched']) if skills_row and skills_row['skills_matched'] else []
-    
-    # Get certifications and education
-    cursor.execute("""
-        SELECT certifications, education, experience_years, experience_level 
-        FROM ai_analysis 
-        WHERE application_id IN (
-            SELECT application_id FROM applications WHERE candidate_id = ?
-        )
-        LIMIT 1
-    """, (row['candidate_id'],))
-    
-    profile_row = cursor.fetchone()
-    
-    candidate = {
+def build_candidate_profile(row, skills_row, profile_row):
+    """Convert database rows to the candidate profile dict"""
+    return {
         'candidate_id': row['candidate_id'],
         'name': row['name'],
         'email': row['email'],
         'phone': row['phone'],
-        'skills': skills,
+        'skills': json.loads(skills_row['skills_matched']) if skills_row and skills_row['skills_matched'] else [],
         'certifications': json.loads(profile_row['certifications']) if profile_row and profile_row['certifications'] else [],
         'education': profile_row['education'] if profile_row else "Bachelor's in Cybersecurity",
         'experience_years': profile_row['experience_years'] if profile_row else 3,
         'experience_level': profile_row['experience_level'] if profile_row else 'mid',
         'applied_jobs': row['applied_jobs'].split(',') if row['applied_jobs'] else []
     }
-    candidates.append(candidate)
-
-print(f"✅ Processed {len(candidates)} candidates with their profiles")
-
-# Select 200 random candidates to create additional applications
-num_additional = 200
-selected_candidates = random.sample(candidates, min(num_additional, len(candidates)))
-print(f"\n🎯 Selected {len(selected_candidates)} candidates for additional applications")
-
-# Get next IDs
-cursor.execute("SELECT MAX(application_id) FROM applications")
-next_app_id = (cursor.fetchone()[0] or 0) + 1
-
-cursor.execute("SELECT MAX(analysis_id) FROM ai_analysis")
-next_analysis_id = (cursor.fetchone()[0] or 0) + 1
-
-cursor.execute("SELECT MAX(test_id) FROM tests")
-next_test_id = (cursor.fetchone()[0] or 0) + 1
 
-cursor.execute("SELECT MAX(decision_id) FROM decisions")
-next_decision_id = (cursor.fetchone()[0] or 0) + 1
-
-# Generate additional applications
-new_applications = []
-new_analyses = []
-new_tests = []
-new_decisions = []
-
-base_date = datetime.now() - timedelta(days=random.randint(1, 30))
-
-for candidate in selected_candidates:
-    # Find jobs they haven't applied to yet
-    available_jobs = [j for j in job_roles_db if str(j['role_id']) not in candidate['applied_jobs']]
-    
-    if not available_jobs:
-        continue  # Skip if already applied to all jobs
-    
-    # Pick 1 random job
-    job = random.choice(available_jobs)
-    
-    # Convert job row to dict with weights
-    job_role = {
-        'role_id': job['role_id'],
-        'title': job['title'],
-        'thresholdScore': 60,  # Default threshold
-        'skillKeywords': [],  # We'll use a simplified approach
-        'weights': {
-            'skills': 0.40,
-            'knowledge': 0.25,
-            'tasks': 0.20,
-            'certifications': 0.10,
-            'education': 0.05
-        }
-    }
-    
-    # Load actual job requirements from database for better matching
-    cursor.execute("SELECT * FROM job_roles WHERE role_id = ?", (job['role_id'],))
-    job_full = cursor.fetchone()
+def load_candidate_profiles(cursor, candidate_ids=None):
+    """
+    Load every candidate (or only candidate_ids) with their applied roles
+    and first analysis profile
+    One query; rows are streamed from the cursor straight into profile dicts
+    """
+    if candidate_ids is None:
+        cursor.execute(CANDIDATE_PROFILES_SQL.format(sample_where='', sample_where_a='', sample_where_c=''))
+    else:
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS profile_sample (candidate_id INTEGER PRIMARY KEY)")
+        cursor.execute("DELETE FROM temp.profile_sample")
+        cursor.executemany("INSERT OR IGNORE INTO temp.profile_sample VALUES (?)",
+                           ((candidate_id,) for candidate_id in candidate_ids))
+        cursor.execute(CANDIDATE_PROFILES_SQL.format(
+            sample_where=SAMPLE_FILTER.format(alias=''),
+            sample_where_a=SAMPLE_FILTER.format(alias='a.'),
+            sample_where_c=SAMPLE_FILTER.format(alias='c.')))
+    candidates = []
+    # Iterate the cursor itself: no intermediate list of every result row
+    for row in cursor:
+        # Candidates without any analysis get the defaults
+        analysis = row if row['experience_level'] is not None or row['skills_matched'] is not None else None
+        candidates.append(build_candidate_profile(row, analysis, analysis))
+    return candidates
+
+def sample_candidate_ids(cursor, count, rng):
+    """
+    count distinct random candidate ids
+    Contiguous ids are sampled from the id range without reading the table;
+    otherwise the ids are read (integers only) and sampled
+    """
+    cursor.execute("SELECT MIN(candidate_id), MAX(candidate_id), COUNT(*) FROM candidates")
+    low, high, total = cursor.fetchone()
+    count = min(count, total)
+    if not total:
+        return []
+    if high - low + 1 == total:
+        return rng.sample(range(low, high + 1), count)
+    cursor.execute("SELECT candidate_id FROM candidates")
+    return rng.sample([row[0] for row in cursor.fetchall()], count)
+
+def load_candidate_profiles_legacy(cursor):
+    """
+    Previous loader: GROUP_CONCAT query plus two correlated lookups per
+    candidate (2N+1 round trips). Kept for --compare-load timing
+    """
+    cursor.execute("""
+        SELECT c.*, 
+               GROUP_CONCAT(a.role_id) as applied_jobs
+        FROM candidates c
+        LEFT JOIN applications a ON c.candidate_id = a.candidate_id
+        GROUP BY c.candidate_id
+    """)
+    candidates_db = cursor.fetchall()
     
-    # Calculate AI score (simplified - based on random variation since we don't have full skill data)
-    # In real scenario, this would use actual skill matching
-    base_score = random.randint(55, 95)
-    ai_score = base_score
+    candidates = []
+    for row in candidates_db:
+        # Parse skills from existing data (we'll infer from their applications)
+        cursor.execute("""
+            SELECT skills_matched FROM ai_analysis 
+            WHERE application_id IN (
+                SELECT application_id FROM applications WHERE candidate_id = ?
+            )
+            LIMIT 1
+        """, (row['candidate_id'],))
+        skills_row = cursor.fetchone()
+        
+        # Get certifications and education
+        cursor.execute("""
+            SELECT certifications, education, experience_years, experience_level 
+            FROM ai_analysis 
+            WHERE application_id IN (
+                SELECT application_id FROM applications WHERE candidate_id = ?
+            )
+            LIMIT 1
+        """, (row['candidate_id'],))
+        profile_row = cursor.fetchone()
+        
+        candidates.append(build_candidate_profile(row, skills_row, profile_row))
+    return candidates
+
+def compare_profile_loading(cursor):
+    """Time the legacy and set-based loaders against the same database"""
+    print(f"\n⏱️  Comparing candidate profile loaders...")
     
-    # For simplicity, use candidate's existing skills
-    candidate['matched_skills'] = candidate['skills'][:random.randint(3, 7)]
-    candidate['missing_skills'] = ['SIEM', 'Threat Detection', 'Log Analysis'][:random.randint(1, 3)]
+    start = time.perf_counter()
+    legacy = load_candidate_profiles_legacy(cursor)
+    legacy_seconds = time.perf_counter() - start
     
-    # Check eligibility
-    is_eligible = ai_score >= 60  # Standard threshold
+    start = time.perf_counter()
+    set_based = load_candidate_profiles(cursor)
+    set_seconds = time.perf_counter() - start
     
-    # Generate timestamps
-    applied_at = base_date + timedelta(hours=random.randint(0, 48))
+    print(f"   Legacy (2N+1 queries): {legacy_seconds:.3f}s for {len(legacy)} candidates")
+    print(f"   Set-based (1 query):   {set_seconds:.3f}s for {len(set_based)} candidates")
+    print(f"   Speedup: {legacy_seconds / max(set_seconds, 1e-9):.1f}x")
+    print(f"   Profiles identical: {'✅' if legacy == set_based else '❌'}")
+    return legacy_seconds, set_seconds
+
+def generate_additional_applications(cursor, selected_candidates, role_models, rng=random, ids=None):
+    """
+    Build new application, analysis, test and decision rows for the selected candidates
+    Each candidate is scored against the cached role model with calculate_ai_score()
+    ids: first id per table (default: get_next_ids(); PLACEHOLDER_IDS to
+    number the rows later with assign_ids())
+    """
+    # Get next IDs (honouring sqlite_sequence, as the generator does)
+    if ids is None:
+        ids = get_next_ids(cursor)
+    next_app_id = ids['applications']
+    next_analysis_id = ids['ai_analysis']
+    next_test_id = ids['tests']
+    next_decision_id = ids['decisions']
     
-    # Create application
-    application = {
-        'application_id': next_app_id,
-        'candidate_id': candidate['candidate_id'],
-        'role_id': job['role_id'],
-        'status': 'test_completed' if is_eligible else 'not_eligible',
-        'applied_at': applied_at.strftime('%Y-%m-%d %H:%M:%S'),
-        'updated_at': (applied_at + timedelta(hours=4)).strftime('%Y-%m-%d %H:%M:%S')
-    }
-    new_applications.append(application)
+    # Generate additional applications
+    new_applications = []
+    new_analyses = []
+    new_tests = []
+    new_decisions = []
     
-    # Create AI analysis
-    analysis = {
-        'analysis_id': next_analysis_id,
-        'application_id': next_app_id,
-        'ai_score': ai_score,
-        'skills_matched': json.dumps(candidate.get('matched_skills', [])),
-        'skill_gaps': json.dumps(candidate.get('missing_skills', [])),
-        'experience_years': candidate['experience_years'],
-        'experience_level': candidate['experience_level'],
-        'education': candidate['education'],
-        'certifications': json.dumps(candidate['certifications']),
-        'reasoning': f"Candidate shows {len(candidate.get('matched_skills', []))} matched skills for {job['title']} position.",
-        'analysis_completed_at': (applied_at + timedelta(minutes=30)).strftime('%Y-%m-%d %H:%M:%S')
-    }
-    new_analyses.append(analysis)
+    base_date = datetime.now() - timedelta(days=rng.randint(1, 30))
+    role_ids = sorted(role_models)
     
-    # Generate test and decision if eligible
-    if is_eligible:
-        test_score = generate_test_score(ai_score)
-        skill_performance = generate_skill_performance(candidate.get('matched_skills', []), test_score)
+    for candidate in selected_candidates:
+        # Find jobs they haven't applied to yet
+        applied = set(candidate['applied_jobs'])
+        available_jobs = [role_id for role_id in role_ids if str(role_id) not in applied]
         
-        test = {
-            'test_id': next_test_id,
-            'application_id': next_app_id,
-            'test_token': f'tok_{random.randint(100000, 999999)}',
-            'test_score': test_score,
-            'started_at': (applied_at + timedelta(hours=2)).strftime('%Y-%m-%d %H:%M:%S'),
-            'completed_at': (applied_at + timedelta(hours=3)).strftime('%Y-%m-%d %H:%M:%S'),
-            'duration_minutes': random.randint(25, 45),
-            'answers': json.dumps([]),
-            'verification_details': json.dumps(skill_performance)
-        }
-        new_tests.append(test)
+        if not available_jobs:
+            continue  # Skip if already applied to all jobs
         
-        composite_score = calculate_composite_score(ai_score, test_score, candidate['experience_level'])
+        # Pick 1 random job
+        job_role = role_models[rng.choice(available_jobs)]
         
-        decision = {
-            'decision_id': next_decision_id,
+        # Calculate AI score against the role's real requirements
+        ai_score = calculate_ai_score(candidate, job_role)
+        candidate['ai_score'] = ai_score
+        
+        # Check eligibility against the role threshold
+        is_eligible = ai_score >= job_role['thresholdScore']
+        
+        # Generate timestamps
+        applied_at = base_date + timedelta(hours=rng.randint(0, 48))
+        
+        # Create application
+        application = {
             'application_id': next_app_id,
-            'composite_score': composite_score,
-            'resume_weight': 40 if candidate['experience_level'] == 'mid' else (70 if candidate['experience_level'] == 'entry' else 30),
-            'test_weight': 60 if candidate['experience_level'] == 'mid' else (30 if candidate['experience_level'] == 'entry' else 70),
-            'decided_by': 1
+            'candidate_id': candidate['candidate_id'],
+            'role_id': job_role['role_id'],
+            'status': 'test_completed' if is_eligible else 'not_eligible',
+            'applied_at': applied_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'updated_at': (applied_at + timedelta(hours=4)).strftime('%Y-%m-%d %H:%M:%S')
         }
-        new_decisions.append(decision)
+        new_applications.append(application)
         
-        next_test_id += 1
-        next_decision_id += 1
-    else:
-        # Create decision even for not eligible
-        decision = {
-            'decision_id': next_decision_id,
+        # Create AI analysis
+        analysis = {
+            'analysis_id': next_analysis_id,
             'application_id': next_app_id,
-            'composite_score': 0,
-            'resume_weight': 40,
-            'test_weight': 60,
-            'decided_by': 1
+            'ai_score': ai_score,
+            'skills_matched': json.dumps(candidate['matched_skills']),
+            'skill_gaps': json.dumps(candidate['missing_skills']),
+            'experience_years': candidate['experience_years'],
+            'experience_level': candidate['experience_level'],
+            'education': candidate['education'],
+            'certifications': json.dumps(candidate['certifications']),
+            'reasoning': f"Candidate shows {len(candidate['matched_skills'])} matched skills for {job_role['title']} position.",
+            'analysis_completed_at': (applied_at + timedelta(minutes=30)).strftime('%Y-%m-%d %H:%M:%S')
         }
-        new_decisions.append(decision)
-        next_decision_id += 1
+        new_analyses.append(analysis)
+        
+        # Generate test and decision if eligible
+        if is_eligible:
+            test_score, skill_performance, answers = generate_test_score_and_performance(candidate, job_role, rng)
+            
+            test = {
+                'test_id': next_test_id,
+                'application_id': next_app_id,
+                'test_token': f"test_{next_app_id}_{int(applied_at.timestamp())}",
+                'test_score': test_score,
+                'started_at': (applied_at + timedelta(hours=2)).strftime('%Y-%m-%d %H:%M:%S'),
+                'completed_at': (applied_at + timedelta(hours=3)).strftime('%Y-%m-%d %H:%M:%S'),
+                'duration_minutes': rng.randint(25, 45),
+                'answers': json.dumps(answers),
+                'verified_skills': json.dumps([s for s, p in skill_performance.items() if p['level'] != 'weak']),
+                'unverified_skills': json.dumps([s for s, p in skill_performance.items() if p['level'] == 'weak']),
+                'verification_details': json.dumps(skill_performance)
+            }
+            new_tests.append(test)
+            
+            composite_score = calculate_composite_score(ai_score, test_score, candidate['experience_level'])
+            weights = composite_weights(candidate['experience_level'])
+            
+            decision = {
+                'decision_id': next_decision_id,
+                'application_id': next_app_id,
+                'composite_score': composite_score,
+                'resume_weight': round(weights['ai'] * 100),
+                'test_weight': round(weights['test'] * 100),
+                'decided_by': 1
+            }
+            new_decisions.append(decision)
+            
+            next_test_id += 1
+            next_decision_id += 1
+        else:
+            # Create decision even for not eligible
+            decision = {
+                'decision_id': next_decision_id,
+                'application_id': next_app_id,
+                'composite_score': 0,
+                'resume_weight': 40,
+                'test_weight': 60,
+                'decided_by': 1
+            }
+            new_decisions.append(decision)
+            next_decision_id += 1
+        
+        next_app_id += 1
+        next_analysis_id += 1
     
-    next_app_id += 1
-    next_analysis_id += 1
-
-print(f"\n📊 Generated:")
-print(f"   - {len(new_applications)} new applications")
-print(f"   - {len(new_analyses)} new AI analyses")
-print(f"   - {len(new_tests)} new tests")
-print(f"   - {len(new_decisions)} new decisions")
-
-# Insert into database
-print(f"\n💾 Inserting into database...")
-
-for app in new_applications:
-    cursor.execute("""
-        INSERT INTO applications (application_id, candidate_id, role_id, status, applied_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (app['application_id'], app['candidate_id'], app['role_id'], app['status'], app['applied_at'], app['updated_at']))
-
-for analysis in new_analyses:
-    cursor.execute("""
-        INSERT INTO ai_analysis (
-            analysis_id, application_id, ai_score, skills_matched, skill_gaps,
-            experience_years, experience_level, education, certifications, reasoning, analysis_completed_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        analysis['analysis_id'], analysis['application_id'], analysis['ai_score'],
-        analysis['skills_matched'], analysis['skill_gaps'], analysis['experience_years'],
-        analysis['experience_level'], analysis['education'], analysis['certifications'],
-        analysis['reasoning'], analysis['analysis_completed_at']
-    ))
+    return new_applications, new_analyses, new_tests, new_decisions
 
-for test in new_tests:
-    cursor.execute("""
-        INSERT INTO tests (
-            test_id, application_id, test_token, test_score, started_at, completed_at,
-            duration_minutes, answers, verification_details
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        test['test_id'], test['application_id'], test['test_token'], test['test_score'],
-        test['started_at'], test['completed_at'], test['duration_minutes'],
-        test['answers'], test['verification_details']
-    ))
-
-for decision in new_decisions:
-    cursor.execute("""
-        INSERT INTO decisions (
-            decision_id, application_id, composite_score, resume_weight, test_weight, decided_by
-        ) VALUES (?, ?, ?, ?, ?, ?)
-    """, (
-        decision['decision_id'], decision['application_id'], decision['composite_score'],
-        decision['resume_weight'], decision['test_weight'], decision['decided_by']
-    ))
-
-conn.commit()
-print(f"✅ All data inserted successfully!")
+def insert_additional_applications(cursor, new_applications, new_analyses, new_tests, new_decisions):
+    """Insert the generated rows, one executemany per table"""
+    cursor.executemany(INSERT_APPLICATION_SQL, new_applications)
+    cursor.executemany(INSERT_ANALYSIS_SQL, new_analyses)
+    cursor.executemany(INSERT_TEST_SQL, new_tests)
+    cursor.executemany(INSERT_DECISION_SQL, new_decisions)
 
-# Print summary
-cursor.execute("SELECT COUNT(*) FROM candidates")
-total_candidates = cursor.fetchone()[0]
+def drop_taken_pairs(cursor, new_applications, new_analyses, new_tests, new_decisions):
+    """
+    Drop generated applications (and their rows) whose candidate/role pair
+    is already in the database, e.g. added by the backend after the
+    profiles were read; returns the remaining rows
+    """
+    candidate_ids = sorted({app['candidate_id'] for app in new_applications})
+    taken = set()
+    for offset in range(0, len(candidate_ids), PAIR_LOOKUP_BATCH):
+        batch = candidate_ids[offset:offset + PAIR_LOOKUP_BATCH]
+        cursor.execute(f"SELECT candidate_id, role_id FROM applications "
+                       f"WHERE candidate_id IN ({', '.join('?' * len(batch))})", batch)
+        taken.update((row[0], row[1]) for row in cursor.fetchall())
+    dropped = {app['application_id'] for app in new_applications
+               if (app['candidate_id'], app['role_id']) in taken}
+    if not dropped:
+        return new_applications, new_analyses, new_tests, new_decisions
+    keep = lambda rows: [row for row in rows if row['application_id'] not in dropped]
+    return keep(new_applications), keep(new_analyses), keep(new_tests), keep(new_decisions)
+
+def assign_ids(ids, new_applications, new_analyses, new_tests, new_decisions):
+    """Number rows built with placeholder ids consecutively from `ids` (get_next_ids()), keeping their links"""
+    application_ids = {}
+    for offset, app in enumerate(new_applications):
+        application_ids[app['application_id']] = ids['applications'] + offset
+        app['application_id'] = ids['applications'] + offset
+    for offset, analysis in enumerate(new_analyses):
+        analysis['analysis_id'] = ids['ai_analysis'] + offset
+        analysis['application_id'] = application_ids[analysis['application_id']]
+    for offset, test in enumerate(new_tests):
+        test['test_id'] = ids['tests'] + offset
+        test['application_id'] = application_ids[test['application_id']]
+        test['test_token'] = f"test_{test['application_id']}_{test['test_token'].rsplit('_', 1)[1]}"
+    for offset, decision in enumerate(new_decisions):
+        decision['decision_id'] = ids['decisions'] + offset
+        decision['application_id'] = application_ids[decision['application_id']]
+
+def insert_application_skills(cursor, new_analyses, new_tests):
+    """Write the normalized skill and certification rows for the new applications"""
+    skill_tables.ensure_skill_tables(cursor)
+    details = {test['application_id']: test['verification_details'] for test in new_tests}
+    records = [
+        (analysis['application_id'], analysis['skills_matched'], analysis['skill_gaps'],
+         analysis['certifications'], details.get(analysis['application_id']))
+        for analysis in new_analyses
+    ]
+    return skill_tables.backfill_batch(cursor, skill_tables.SkillRegistry(cursor), records)
+
+def add_applications(conn, count, rng, batch_size=SAMPLE_BATCH_SIZE, live=None):
+    """
+    Give `count` random existing candidates one additional application each
+    Works through the sample in batches (load profiles, score, insert the
+    rows, normalized skills and summary refresh, commit), so memory is
+    bounded by the batch size. conn must use sqlite3.Row.
+    live: a live_writer.LiveWriter whose connection is conn; it sizes the
+    batches and brackets each one's writes with begin()/commit()
+    Returns per-table counts of the inserted rows
+    """
+    cursor = conn.cursor()
+    role_models = load_role_catalog_from_db(cursor)
+    selected_ids = sample_candidate_ids(cursor, count, rng)
+    totals = {'candidates': 0, 'applications': 0, 'ai_analysis': 0, 'tests': 0, 'decisions': 0,
+              'application_skills': 0, 'application_certifications': 0}
+    if live is not None:
+        batches = live.chunks(selected_ids)
+    else:
+        batches = (selected_ids[offset:offset + batch_size] for offset in range(0, len(selected_ids), batch_size))
 
-cursor.execute("SELECT COUNT(*) FROM applications")
-total_applications = cursor.fetchone()[0]
+    for batch_ids in batches:
+        by_id = {candidate['candidate_id']: candidate
+                 for candidate in load_candidate_profiles(cursor, batch_ids)}
+        selected_candidates = [by_id[candidate_id] for candidate_id in batch_ids if candidate_id in by_id]
 
-print(f"\n" + "=" * 60)
-print(f"✅ COMPLETE!")
-print(f"=" * 60)
-print(f"Total Candidates: {total_candidates}")
-print(f"Total Applications: {total_applications}")
-print(f"New Applications Added: {len(new_applications)}")
-print(f"Candidates with Multiple Applications: {len(selected_candidates)}")
-print(f"=" * 60)
+        if live is None:
+            new_rows = generate_additional_applications(cursor, selected_candidates, role_models, rng)
+        else:
+            # Score outside the lock; ids and taken pairs are only final inside it
+            new_rows = generate_additional_applications(cursor, selected_candidates, role_models, rng,
+                                                        PLACEHOLDER_IDS)
+            live.begin()
+            new_rows = drop_taken_pairs(cursor, *new_rows)
+            assign_ids(get_next_ids(cursor), *new_rows)
+        new_applications, new_analyses, new_tests, new_decisions = new_rows
+        insert_additional_applications(cursor, new_applications, new_analyses, new_tests, new_decisions)
+        skill_rows, cert_rows = insert_application_skills(cursor, new_analyses, new_tests)
+        analytics_summary.refresh_summaries(cursor)
+        if live is not None:
+            live.commit()
+        else:
+            conn.commit()
+
+        totals['candidates'] += len(selected_candidates)
+        totals['applications'] += len(new_applications)
+        totals['ai_analysis'] += len(new_analyses)
+        totals['tests'] += len(new_tests)
+        totals['decisions'] += len(new_decisions)
+        totals['application_skills'] += skill_rows
+        totals['application_certifications'] += cert_rows
+        if live is None and len(selected_ids) > batch_size:
+            print(f"   Progress: {totals['candidates']}/{len(selected_ids)} candidates")
+    return totals
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Add additional applications for existing candidates")
+    parser.add_argument('--db', default=DB_PATH, help="SQLite database path")
+    parser.add_argument('--count', type=int, default=200,
+                        help="Number of candidates that get an additional application")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Seed for reproducible selection and scoring (random if omitted)")
+    parser.add_argument('--compare-load', action='store_true',
+                        help="Time the legacy vs set-based candidate loaders and exit")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    print("=" * 60)
+    print("Adding Multiple Applications for Existing Candidates")
+    print("=" * 60)
+    
+    # Connect to database
+    conn = sqlite3.connect(args.db)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    
+    if args.compare_load:
+        compare_profile_loading(cursor)
+        conn.close()
+        return
+    
+    # Select random candidates, then load only their profiles and add one
+    # application each, scored against the roles' real requirements
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    rng = random.Random(seed)
+    print(f"\n🎯 Adding applications for {args.count} random candidates (seed {seed})")
+    start = time.perf_counter()
+    totals = add_applications(conn, args.count, rng)
+    
+    print(f"\n📊 Inserted ({time.perf_counter() - start:.2f}s):")
+    print(f"   - {totals['applications']} new applications")
+    print(f"   - {totals['ai_analysis']} new AI analyses")
+    print(f"   - {totals['tests']} new tests")
+    print(f"   - {totals['decisions']} new decisions")
+    print(f"   - {totals['application_skills']} application skills, "
+          f"{totals['application_certifications']} certifications (normalized)")
+    print(f"   - Analytics summaries refreshed")
+    print(f"✅ All data inserted successfully!")
+    
+    # Print summary
+    cursor.execute("SELECT COUNT(*) FROM candidates")
+    total_candidates = cursor.fetchone()[0]
+    
+    cursor.execute("SELECT COUNT(*) FROM applications")
+    total_applications = cursor.fetchone()[0]
+    
+    print(f"\n" + "=" * 60)
+    print(f"✅ COMPLETE!")
+    print(f"=" * 60)
+    print(f"Total Candidates: {total_candidates}")
+    print(f"Total Applications: {total_applications}")
+    print(f"New Applications Added: {totals['applications']}")
+    print(f"Candidates with Multiple Applications: {totals['candidates']}")
+    print(f"=" * 60)
+    
+    conn.close()
 
-conn.close()
+if __name__ == "__main__":
+    main()
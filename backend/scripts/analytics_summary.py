@@ -0,0 +1,279 @@
+"""
+Materialized Analytics Summaries
+- Precomputed tables the dashboard can read instead of scanning applications:
+    summary_role_stats          applications, eligible, tests and score sums per role
+    summary_score_histogram     AI/test/composite scores in 10-point buckets per role
+    summary_daily_applications  applications and eligible per day and role
+    summary_skill_gaps          gap and weak-on-test counts per role and skill
+                                (from the normalized tables in skill_tables.py)
+- Sums and counts only, so an incremental refresh just adds the rows of
+  applications past a stored watermark (summary_state.last_application_id)
+- generate_candidates_v2.py rebuilds them after a seed (incrementally in
+  --append mode); add_multiple_applications.py refreshes them incrementally
+- Rows changed after they were summarized (e.g. the Node backend completing
+  a test later) are only picked up by a full refresh:
+    python backend/scripts/analytics_summary.py --full
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.append(os.path.dirname(__file__))
+
+import skill_tables
+
+DB_PATH = os.path.join(os.path.dirname(__file__), '../database/recruitment.db')
+
+SUMMARY_TABLES = [
+    'summary_state',
+    'summary_role_stats',
+    'summary_score_histogram',
+    'summary_daily_applications',
+    'summary_skill_gaps',
+]
+
+# Statuses that mean the application did not pass resume screening
+NOT_ELIGIBLE_STATUSES = ('not_eligible', 'pending')
+
+HISTOGRAM_BUCKET_WIDTH = 10
+
+SUMMARY_SCHEMA_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS summary_state (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS summary_role_stats (
+        role_id INTEGER PRIMARY KEY,
+        applications INTEGER NOT NULL DEFAULT 0,
+        eligible INTEGER NOT NULL DEFAULT 0,
+        ai_scored INTEGER NOT NULL DEFAULT 0,
+        ai_score_sum REAL NOT NULL DEFAULT 0,
+        tests_completed INTEGER NOT NULL DEFAULT 0,
+        test_score_sum REAL NOT NULL DEFAULT 0,
+        decisions INTEGER NOT NULL DEFAULT 0,
+        composite_score_sum REAL NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS summary_score_histogram (
+        score_type TEXT NOT NULL CHECK(score_type IN ('ai', 'test', 'composite')),
+        role_id INTEGER NOT NULL,
+        bucket INTEGER NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (score_type, role_id, bucket)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS summary_daily_applications (
+        day TEXT NOT NULL,
+        role_id INTEGER NOT NULL,
+        applications INTEGER NOT NULL DEFAULT 0,
+        eligible INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, role_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS summary_skill_gaps (
+        role_id INTEGER NOT NULL,
+        skill_id INTEGER NOT NULL,
+        gaps INTEGER NOT NULL DEFAULT 0,
+        weak_on_test INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (role_id, skill_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE VIEW IF NOT EXISTS summary_role_overview AS
+    SELECT s.role_id, r.title, s.applications, s.eligible,
+           ROUND(100.0 * s.eligible / NULLIF(s.applications, 0), 1) AS eligibility_rate,
+           ROUND(s.ai_score_sum / NULLIF(s.ai_scored, 0), 1) AS avg_ai_score,
+           ROUND(s.test_score_sum / NULLIF(s.tests_completed, 0), 1) AS avg_test_score,
+           ROUND(s.composite_score_sum / NULLIF(s.decisions, 0), 1) AS avg_composite_score
+    FROM summary_role_stats s
+    LEFT JOIN job_roles r ON r.role_id = s.role_id
+    """,
+]
+
+NOT_ELIGIBLE_SQL = ', '.join(f"'{status}'" for status in NOT_ELIGIBLE_STATUSES)
+
+# One row per application past the watermark (applications > ?) with its
+# latest analysis, test and decision scores, so applications with several
+# tests or decisions are counted once. Every refresh query below reads it
+# and adds its aggregates onto the existing summary rows
+BATCH_SQL = f"""
+    CREATE TEMP TABLE summary_batch AS
+    SELECT a.application_id, a.role_id, DATE(a.applied_at) AS day,
+           a.status NOT IN ({NOT_ELIGIBLE_SQL}) AS eligible,
+           (SELECT ai_score FROM ai_analysis x WHERE x.application_id = a.application_id
+            ORDER BY analysis_id DESC LIMIT 1) AS ai_score,
+           (SELECT test_score FROM tests x WHERE x.application_id = a.application_id
+            ORDER BY test_id DESC LIMIT 1) AS test_score,
+           (SELECT composite_score FROM decisions x WHERE x.application_id = a.application_id
+            AND composite_score > 0 ORDER BY decision_id DESC LIMIT 1) AS composite_score
+    FROM applications a
+    WHERE a.application_id > ?
+"""
+
+REFRESH_ROLE_STATS_SQL = """
+    INSERT INTO summary_role_stats (
+        role_id, applications, eligible, ai_scored, ai_score_sum,
+        tests_completed, test_score_sum, decisions, composite_score_sum
+    )
+    SELECT role_id, COUNT(*), SUM(eligible),
+           COUNT(ai_score), COALESCE(SUM(ai_score), 0),
+           COUNT(test_score), COALESCE(SUM(test_score), 0),
+           COUNT(composite_score), COALESCE(SUM(composite_score), 0)
+    FROM temp.summary_batch
+    GROUP BY role_id
+    ON CONFLICT(role_id) DO UPDATE SET
+        applications = applications + excluded.applications,
+        eligible = eligible + excluded.eligible,
+        ai_scored = ai_scored + excluded.ai_scored,
+        ai_score_sum = ai_score_sum + excluded.ai_score_sum,
+        tests_completed = tests_completed + excluded.tests_completed,
+        test_score_sum = test_score_sum + excluded.test_score_sum,
+        decisions = decisions + excluded.decisions,
+        composite_score_sum = composite_score_sum + excluded.composite_score_sum
+"""
+
+# Scores are 0-100; 100 falls into the top bucket
+REFRESH_HISTOGRAM_SQL = """
+    INSERT INTO summary_score_histogram (score_type, role_id, bucket, count)
+    SELECT ?, role_id, MIN(CAST({column} / ? AS INTEGER), ?) AS bucket, COUNT(*)
+    FROM temp.summary_batch
+    WHERE {column} IS NOT NULL
+    GROUP BY role_id, bucket
+    ON CONFLICT(score_type, role_id, bucket) DO UPDATE SET count = count + excluded.count
+"""
+
+HISTOGRAM_COLUMNS = [('ai', 'ai_score'), ('test', 'test_score'), ('composite', 'composite_score')]
+
+REFRESH_DAILY_SQL = """
+    INSERT INTO summary_daily_applications (day, role_id, applications, eligible)
+    SELECT day, role_id, COUNT(*), SUM(eligible)
+    FROM temp.summary_batch
+    WHERE day IS NOT NULL
+    GROUP BY day, role_id
+    ON CONFLICT(day, role_id) DO UPDATE SET
+        applications = applications + excluded.applications,
+        eligible = eligible + excluded.eligible
+"""
+
+REFRESH_SKILL_GAPS_SQL = """
+    INSERT INTO summary_skill_gaps (role_id, skill_id, gaps, weak_on_test)
+    SELECT a.role_id, x.skill_id, COUNT(*), COUNT(CASE WHEN x.verified_level = 'weak' THEN 1 END)
+    FROM application_skills x
+    JOIN applications a ON a.application_id = x.application_id
+    WHERE x.application_id > ? AND x.status = 'gap'
+    GROUP BY a.role_id, x.skill_id
+    ON CONFLICT(role_id, skill_id) DO UPDATE SET
+        gaps = gaps + excluded.gaps,
+        weak_on_test = weak_on_test + excluded.weak_on_test
+"""
+
+def ensure_summary_tables(cursor):
+    """Create the summary tables (and the skill tables they read) when missing"""
+    skill_tables.ensure_skill_tables(cursor)
+    for sql in SUMMARY_SCHEMA_SQL:
+        cursor.execute(sql)
+
+def get_watermark(cursor):
+    cursor.execute("SELECT value FROM summary_state WHERE name = 'last_application_id'")
+    row = cursor.fetchone()
+    return row[0] if row else 0
+
+def set_watermark(cursor, application_id):
+    cursor.execute("""
+        INSERT INTO summary_state (name, value) VALUES ('last_application_id', ?)
+        ON CONFLICT(name) DO UPDATE SET value = excluded.value, updated_at = CURRENT_TIMESTAMP
+    """, (application_id,))
+
+def refresh_summaries(cursor, full=False):
+    """
+    Bring the summary tables up to date on the caller's cursor (and transaction)
+    Incremental by default: folds in applications past the watermark.
+    full=True clears and recomputes everything.
+    Returns (applications folded in, new watermark)
+    """
+    ensure_summary_tables(cursor)
+    if full:
+        for table in SUMMARY_TABLES:
+            cursor.execute(f"DELETE FROM {table}")
+    watermark = get_watermark(cursor)
+
+    cursor.execute("SELECT COUNT(*), MAX(application_id) FROM applications WHERE application_id > ?",
+                   (watermark,))
+    new_applications, max_id = cursor.fetchone()
+    if not new_applications:
+        return 0, watermark
+
+    cursor.execute("DROP TABLE IF EXISTS temp.summary_batch")
+    cursor.execute(BATCH_SQL, (watermark,))
+    try:
+        cursor.execute(REFRESH_ROLE_STATS_SQL)
+        top_bucket = 100 // HISTOGRAM_BUCKET_WIDTH - 1
+        for score_type, column in HISTOGRAM_COLUMNS:
+            cursor.execute(REFRESH_HISTOGRAM_SQL.format(column=column),
+                           (score_type, HISTOGRAM_BUCKET_WIDTH, top_bucket))
+        cursor.execute(REFRESH_DAILY_SQL)
+        cursor.execute(REFRESH_SKILL_GAPS_SQL, (watermark,))
+    finally:
+        cursor.execute("DROP TABLE IF EXISTS temp.summary_batch")
+    set_watermark(cursor, max_id)
+    return new_applications, max_id
+
+def print_overview(cursor):
+    """Print the per-role overview from the precomputed rows"""
+    start = time.perf_counter()
+    cursor.execute("""
+        SELECT role_id, title, applications, eligible, eligibility_rate,
+               avg_ai_score, avg_test_score, avg_composite_score
+        FROM summary_role_overview ORDER BY role_id
+    """)
+    rows = cursor.fetchall()
+    elapsed = time.perf_counter() - start
+    print(f"\n📋 Per-role summary ({len(rows)} roles, read in {elapsed * 1000:.1f} ms):")
+    for role_id, title, applications, eligible, rate, avg_ai, avg_test, avg_composite in rows:
+        print(f"   {title or '?'} (Role {role_id}): {eligible}/{applications} eligible ({rate or 0}%), "
+              f"avg AI {avg_ai or 0}%, avg test {avg_test or 0}%, avg composite {avg_composite or 0}%")
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Refresh the materialized analytics summary tables")
+    parser.add_argument('--db', default=DB_PATH, help="SQLite database path")
+    parser.add_argument('--full', action='store_true',
+                        help="Recompute everything (default: fold in new applications only)")
+    parser.add_argument('--show', action='store_true', help="Print the per-role summary afterwards")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    conn = sqlite3.connect(args.db, isolation_level=None)
+    cursor = conn.cursor()
+    try:
+        print(f"📊 Refreshing analytics summaries in {args.db} ({'full' if args.full else 'incremental'})")
+        start = time.perf_counter()
+        cursor.execute("BEGIN")
+        folded, watermark = refresh_summaries(cursor, args.full)
+        cursor.execute("COMMIT")
+        print(f"✅ Folded in {folded} applications (watermark application_id {watermark}) "
+              f"in {time.perf_counter() - start:.2f}s")
+        if args.show:
+            print_overview(cursor)
+    except Exception as e:
+        print(f"\n❌ Refresh failed: {e}")
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    main()
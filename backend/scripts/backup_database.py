@@ -1,53 +1,233 @@
 """
 Database Backup Script
 Creates a backup of the current database before regenerating data
+- Uses SQLite's online backup API, copying a few pages per step and sleeping
+  between steps, so it is safe against a live database (e.g. while the Node
+  server is writing) without holding a long lock
+- Reports progress and throughput, then verifies the copy with PRAGMA integrity_check
+- --store keeps compressed, deduplicated snapshots with a retention policy
+  (see backup_store.py); --list and --restore work against that store
 """
 
+import argparse
 import sqlite3
-import shutil
+import time
 from datetime import datetime
 import os
 
-def backup_database():
+DEFAULT_DB_PATH = 'backend/database/recruitment.db'
+DEFAULT_BACKUP_DIR = 'backend/database/backups'
+
+# Online backup tuning: pages copied per step and pause between steps (seconds)
+DEFAULT_PAGES_PER_STEP = 1024
+DEFAULT_STEP_SLEEP = 0.005
+
+def make_progress_reporter(page_size, start_time):
+    """Progress callback for Connection.backup(): prints every ~10%"""
+    state = {'last_pct': -10}
+
+    def report(status, remaining, total):
+        if total <= 0:
+            return
+        copied = total - remaining
+        pct = copied * 100 // total
+        if pct >= state['last_pct'] + 10 or remaining == 0:
+            state['last_pct'] = pct
+            elapsed = max(time.perf_counter() - start_time, 1e-9)
+            mb = copied * page_size / (1024 * 1024)
+            print(f"   Progress: {copied}/{total} pages ({pct}%) - {mb / elapsed:.1f} MB/s")
+
+    return report
+
+def verify_backup(backup_path):
+    """Run PRAGMA integrity_check on a backup; returns True when it reports ok"""
+    conn = sqlite3.connect(backup_path)
+    try:
+        result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+    finally:
+        conn.close()
+    return result == 'ok'
+
+def online_backup(db_path, backup_path, pages_per_step=DEFAULT_PAGES_PER_STEP, sleep=DEFAULT_STEP_SLEEP):
+    """
+    Copy db_path to backup_path with the online backup API
+    Raises FileNotFoundError when the source database does not exist
+    """
+    # mode=ro: never create an empty database when the source is missing
+    try:
+        source = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    except sqlite3.OperationalError:
+        raise FileNotFoundError(db_path)
+
+    target = sqlite3.connect(backup_path)
+    start_time = time.perf_counter()
+    try:
+        page_size = source.execute("PRAGMA page_size").fetchone()[0]
+        source.backup(
+            target,
+            pages=pages_per_step,
+            progress=make_progress_reporter(page_size, start_time),
+            sleep=sleep,
+        )
+    finally:
+        target.close()
+        source.close()
+
+    return time.perf_counter() - start_time
+
+def backup_database(db_path=DEFAULT_DB_PATH, backup_dir=DEFAULT_BACKUP_DIR,
+                    pages_per_step=DEFAULT_PAGES_PER_STEP, sleep=DEFAULT_STEP_SLEEP, verify=True):
     """Create a timestamped backup of the database"""
-    
-    # Database paths
-    db_path = 'backend/database/recruitment.db'
-    backup_dir = 'backend/database/backups'
-    
+
     # Create backups directory if it doesn't exist
     os.makedirs(backup_dir, exist_ok=True)
-    
+
     # Generate backup filename with timestamp
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     backup_path = f'{backup_dir}/recruitment_backup_{timestamp}.db'
-    
+
     try:
-        # Copy database file
-        shutil.copy2(db_path, backup_path)
+        # Copy database with the online backup API
+        print(f"📦 Online backup: {pages_per_step} pages/step, {sleep * 1000:.0f} ms sleep between steps")
+        elapsed = online_backup(db_path, backup_path, pages_per_step, sleep)
         print(f"✅ Database backed up successfully!")
         print(f"📁 Backup location: {backup_path}")
-        
+
         # Get database size
         size_mb = os.path.getsize(backup_path) / (1024 * 1024)
         print(f"📊 Backup size: {size_mb:.2f} MB")
-        
+        print(f"⏱️  {elapsed:.2f}s ({size_mb / max(elapsed, 1e-9):.1f} MB/s)")
+
+        if verify:
+            if not verify_backup(backup_path):
+                print(f"❌ Integrity check failed for: {backup_path}")
+                os.remove(backup_path)
+                return None
+            print("🔍 Integrity check: ok")
+
         return backup_path
-        
+
     except FileNotFoundError:
         print(f"⚠️  Database file not found at: {db_path}")
         print("   This might be the first run. Continuing without backup...")
+        if os.path.exists(backup_path):
+            os.remove(backup_path)
         return None
-        
+
     except Exception as e:
         print(f"❌ Error creating backup: {e}")
         return None
 
-if __name__ == "__main__":
+def format_mb(num_bytes):
+    return f"{num_bytes / (1024 * 1024):.2f} MB"
+
+def print_space_report(store):
+    """Compare the store's disk usage with keeping every snapshot as a full copy"""
+    full, stored = store.space_report()
+    saved = full - stored
+    pct = saved / full * 100 if full else 0
+    print(f"💾 Full copies: {format_mb(full)} | Store on disk: {format_mb(stored)} | "
+          f"Saved: {format_mb(saved)} ({pct:.1f}%)")
+
+def store_backup(args):
+    """Snapshot into the deduplicated store, then apply the retention policy"""
+    from backup_store import BackupStore
+
+    store = BackupStore(args.store_dir, chunk_size=args.chunk_size)
+    print(f"📦 Snapshot into store: {args.store_dir} ({store.codec} chunks)")
+    try:
+        manifest = store.snapshot(args.db, args.pages_per_step, args.sleep)
+    except FileNotFoundError:
+        print(f"⚠️  Database file not found at: {args.db}")
+        return None
+
+    print(f"✅ Snapshot {manifest['id']}: {len(manifest['chunks'])} chunks, "
+          f"{manifest['new_chunks']} new ({format_mb(manifest['bytes_written'])} written)")
+
+    removed, removed_chunks, freed = store.prune(args.keep_hourly, args.keep_daily, args.keep_weekly,
+                                                 args.keep_last, args.min_age_hours)
+    if removed:
+        print(f"🗑️  Retention removed {len(removed)} snapshots, {removed_chunks} chunks ({format_mb(freed)})")
+    print_space_report(store)
+    return manifest['id']
+
+def list_store(args):
+    from backup_store import BackupStore
+
+    store = BackupStore(args.store_dir)
+    manifests = store.list_snapshots()
+    print(f"📚 {len(manifests)} snapshots in {args.store_dir}")
+    for manifest in manifests:
+        print(f"   {manifest['id']}  {manifest['created_at']}  {format_mb(manifest['size'])}  "
+              f"{len(manifest['chunks'])} chunks ({manifest['new_chunks']} new)")
+    print_space_report(store)
+
+def restore_snapshot(args):
+    from backup_store import BackupStore
+
+    store = BackupStore(args.store_dir)
+    output = args.output or f"recruitment_restored_{args.restore}.db"
+    manifest = store.restore(args.restore, output, verify=not args.no_verify)
+    print(f"✅ Restored snapshot {manifest['id']} to: {output} ({format_mb(manifest['size'])})")
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Back up the recruitment database")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="SQLite database path")
+    parser.add_argument('--backup-dir', default=DEFAULT_BACKUP_DIR, help="Backup directory")
+    parser.add_argument('--pages-per-step', type=int, default=DEFAULT_PAGES_PER_STEP,
+                        help="Pages copied per backup step (-1 copies everything in one step)")
+    parser.add_argument('--sleep', type=float, default=DEFAULT_STEP_SLEEP,
+                        help="Seconds to sleep between backup steps")
+    parser.add_argument('--no-verify', action='store_true', help="Skip PRAGMA integrity_check")
+
+    store = parser.add_argument_group('deduplicated store')
+    mode = store.add_mutually_exclusive_group()
+    mode.add_argument('--store', action='store_true',
+                      help="Snapshot into the compressed, deduplicated chunk store")
+    mode.add_argument('--list', action='store_true', help="List snapshots in the store")
+    mode.add_argument('--restore', metavar='SNAPSHOT_ID', help="Rebuild a snapshot from the store")
+    store.add_argument('--output', help="Restore target path")
+    store.add_argument('--store-dir', default=None,
+                       help="Chunk store directory (default: <backup-dir>/store)")
+    store.add_argument('--chunk-size', type=int, default=256 * 1024, help="Chunk size in bytes")
+    store.add_argument('--keep-last', type=int, default=10,
+                       help="Newest snapshots always kept, whatever their hour/day/week")
+    store.add_argument('--min-age-hours', type=float, default=24,
+                       help="Snapshots younger than this are never pruned")
+    store.add_argument('--keep-hourly', type=int, default=24, help="Hourly snapshots to keep")
+    store.add_argument('--keep-daily', type=int, default=7, help="Daily snapshots to keep")
+    store.add_argument('--keep-weekly', type=int, default=4, help="Weekly snapshots to keep")
+    args = parser.parse_args(argv)
+    args.store_dir = args.store_dir or os.path.join(args.backup_dir, 'store')
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.list:
+        list_store(args)
+        return
+    if args.restore:
+        restore_snapshot(args)
+        return
+    if args.store:
+        print("🔄 Creating database snapshot...\n")
+        snapshot_id = store_backup(args)
+        if snapshot_id:
+            print(f"\n✅ Snapshot complete! Restore with: --restore {snapshot_id}")
+        else:
+            print("\n⚠️  No snapshot created (database might not exist yet)")
+        return
+
     print("🔄 Creating database backup...\n")
-    backup_path = backup_database()
-    
+    backup_path = backup_database(args.db, args.backup_dir, args.pages_per_step, args.sleep,
+                                  verify=not args.no_verify)
+
     if backup_path:
         print(f"\n✅ Backup complete! You can restore from: {backup_path}")
     else:
         print("\n⚠️  No backup created (database might not exist yet)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""
+Deduplicated Backup Store
+- Snapshots are split into fixed-size, page-aligned chunks addressed by their
+  SHA-256, compressed with zstd (if the zstandard package is installed) or gzip
+- Unchanged chunks are stored once and shared by every snapshot
+- Each snapshot is a small JSON manifest listing its chunk hashes
+- Retention always keeps the newest N snapshots and every snapshot younger
+  than a minimum age; beyond those it keeps the newest snapshot per
+  hour/day/week up to N of each, then garbage-collects chunks no manifest
+  references
+- restore() rebuilds any snapshot into a standalone database file
+- <root>/.lock serializes garbage collection: snapshots and restores hold it
+  shared, prune() exclusive, so chunks are never collected while a snapshot
+  is writing (or reusing) them; in-flight *.tmp files are never collected
+
+Layout:
+    <root>/chunks/ab/abcd...ef.zst|.gz
+    <root>/snapshots/<snapshot_id>.json
+"""
+
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+sys.path.append(os.path.dirname(__file__))
+
+from backup_database import online_backup, verify_backup
+
+DEFAULT_CHUNK_SIZE = 256 * 1024  # bytes; rounded to a multiple of the page size
+
+DEFAULT_RETENTION = {'last': 10, 'min_age_hours': 24, 'hourly': 24, 'daily': 7, 'weekly': 4}
+
+def compress(data, codec):
+    if codec == 'zst':
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+def decompress(data, codec):
+    if codec == 'zst':
+        if zstandard is None:
+            raise ImportError("This chunk is zstd-compressed: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+@contextlib.contextmanager
+def file_lock(path, exclusive):
+    """
+    Advisory lock on path: shared or exclusive flock on POSIX; on Windows
+    (no shared locks) every holder is exclusive
+    """
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+class BackupStore:
+    """Content-addressed, compressed snapshot store rooted at a directory"""
+
+    def __init__(self, root, chunk_size=DEFAULT_CHUNK_SIZE, codec=None):
+        self.root = root
+        self.chunk_dir = os.path.join(root, 'chunks')
+        self.snapshot_dir = os.path.join(root, 'snapshots')
+        self.chunk_size = chunk_size
+        self.codec = codec or ('zst' if zstandard is not None else 'gz')
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        self.lock_path = os.path.join(root, '.lock')
+
+    def lock(self, exclusive=False):
+        """Store lock: shared for writers/readers of snapshots, exclusive for prune()"""
+        return file_lock(self.lock_path, exclusive)
+
+    # ---- chunks -------------------------------------------------------
+
+    def _chunk_path(self, digest, codec):
+        return os.path.join(self.chunk_dir, digest[:2], f"{digest}.{codec}")
+
+    def _find_chunk(self, digest):
+        for codec in ('zst', 'gz'):
+            path = self._chunk_path(digest, codec)
+            if os.path.exists(path):
+                return path, codec
+        return None, None
+
+    def put_chunk(self, data):
+        """Store a chunk if it is new; returns (digest, stored_bytes_written)"""
+        digest = hashlib.sha256(data).hexdigest()
+        path, _ = self._find_chunk(digest)
+        if path is not None:
+            return digest, 0
+
+        path = self._chunk_path(digest, self.codec)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        payload = compress(data, self.codec)
+        # Per-process temp name: concurrent snapshots may store the same chunk
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        return digest, len(payload)
+
+    def get_chunk(self, digest):
+        path, codec = self._find_chunk(digest)
+        if path is None:
+            raise FileNotFoundError(f"Missing chunk {digest}")
+        with open(path, 'rb') as f:
+            data = decompress(f.read(), codec)
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Corrupt chunk {digest}")
+        return data
+
+    # ---- snapshots ----------------------------------------------------
+
+    def _manifest_path(self, snapshot_id):
+        return os.path.join(self.snapshot_dir, f"{snapshot_id}.json")
+
+    def list_snapshots(self):
+        """Manifests of all snapshots, oldest first"""
+        manifests = []
+        for name in sorted(os.listdir(self.snapshot_dir)):
+            if name.endswith('.json'):
+                with open(os.path.join(self.snapshot_dir, name)) as f:
+                    manifests.append(json.load(f))
+        manifests.sort(key=lambda m: m['created_at'])
+        return manifests
+
+    def load_manifest(self, snapshot_id):
+        path = self._manifest_path(snapshot_id)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Unknown snapshot: {snapshot_id}")
+        with open(path) as f:
+            return json.load(f)
+
+    def add_file(self, db_file, created_at=None):
+        """
+        Chunk a consistent database file into the store (under the shared lock)
+        Returns the manifest, including bytes_written for new chunks
+        """
+        with self.lock():
+            return self._add_file(db_file, created_at)
+
+    def _add_file(self, db_file, created_at):
+        created_at = created_at or datetime.now()
+        conn = sqlite3.connect(db_file)
+        try:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        finally:
+            conn.close()
+
+        # Page-aligned chunks so a changed page dirties exactly one chunk
+        chunk_size = max(page_size, self.chunk_size // page_size * page_size)
+        chunks = []
+        bytes_written = 0
+        new_chunks = 0
+        with open(db_file, 'rb') as f:
+            while True:
+                data = f.read(chunk_size)
+                if not data:
+                    break
+                digest, written = self.put_chunk(data)
+                chunks.append(digest)
+                if written:
+                    new_chunks += 1
+                    bytes_written += written
+
+        manifest = {
+            'id': None,
+            'created_at': created_at.isoformat(),
+            'size': os.path.getsize(db_file),
+            'page_size': page_size,
+            'chunk_size': chunk_size,
+            'chunks': chunks,
+            'new_chunks': new_chunks,
+            'bytes_written': bytes_written,
+        }
+        # Link the manifest under the first free id: a concurrent snapshot in
+        # the same second gets the next suffix instead of overwriting this one
+        base_id = created_at.strftime('%Y%m%d_%H%M%S')
+        suffix = 1
+        while True:
+            manifest['id'] = base_id if suffix == 1 else f"{base_id}_{suffix}"
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self.snapshot_dir)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(manifest, f)
+                os.link(tmp_path, self._manifest_path(manifest['id']))
+                return manifest
+            except FileExistsError:
+                suffix += 1
+            finally:
+                os.remove(tmp_path)
+
+    def snapshot(self, db_path, pages_per_step, sleep):
+        """Online-backup db_path to a temp file, then chunk it into the store"""
+        fd, tmp_path = tempfile.mkstemp(suffix='.db', dir=self.root)
+        os.close(fd)
+        try:
+            online_backup(db_path, tmp_path, pages_per_step, sleep)
+            return self.add_file(tmp_path)
+        finally:
+            os.remove(tmp_path)
+
+    def restore(self, snapshot_id, output_path, verify=True):
+        """Rebuild a snapshot into output_path"""
+        tmp_path = f"{output_path}.tmp"
+        with self.lock():
+            manifest = self.load_manifest(snapshot_id)
+            with open(tmp_path, 'wb') as f:
+                for digest in manifest['chunks']:
+                    f.write(self.get_chunk(digest))
+        if os.path.getsize(tmp_path) != manifest['size']:
+            os.remove(tmp_path)
+            raise ValueError(f"Restored size mismatch for snapshot {snapshot_id}")
+        if verify and not verify_backup(tmp_path):
+            os.remove(tmp_path)
+            raise ValueError(f"Integrity check failed for snapshot {snapshot_id}")
+        os.replace(tmp_path, output_path)
+        return manifest
+
+    # ---- retention ----------------------------------------------------
+
+    def select_retained(self, manifests, keep_hourly, keep_daily, keep_weekly,
+                        keep_last=DEFAULT_RETENTION['last'],
+                        min_age_hours=DEFAULT_RETENTION['min_age_hours'], now=None):
+        """
+        The newest keep_last snapshots and any younger than min_age_hours are
+        always kept (so a snapshot never evicts the one before it); older ones
+        go through grandfather-father-son selection: the newest snapshot of
+        each of the last N hours, days and ISO weeks is kept
+        """
+        newest_first = sorted(manifests, key=lambda m: m['created_at'], reverse=True)
+        keep = {manifest['id'] for manifest in newest_first[:max(keep_last, 1)]}
+        cutoff = (now or datetime.now()) - timedelta(hours=min_age_hours)
+        keep.update(manifest['id'] for manifest in newest_first
+                    if datetime.fromisoformat(manifest['created_at']) > cutoff)
+
+        buckets = [
+            (keep_hourly, lambda t: t.strftime('%Y%m%d%H')),
+            (keep_daily, lambda t: t.strftime('%Y%m%d')),
+            (keep_weekly, lambda t: '%d-%02d' % t.isocalendar()[:2]),
+        ]
+        for limit, bucket_of in buckets:
+            seen = set()
+            for manifest in newest_first:
+                if len(seen) >= limit:
+                    break
+                bucket = bucket_of(datetime.fromisoformat(manifest['created_at']))
+                if bucket not in seen:
+                    seen.add(bucket)
+                    keep.add(manifest['id'])
+        return keep
+
+    def prune(self, keep_hourly, keep_daily, keep_weekly,
+              keep_last=DEFAULT_RETENTION['last'], min_age_hours=DEFAULT_RETENTION['min_age_hours']):
+        """
+        Apply the retention policy; returns (removed_snapshots, removed_chunks, freed_bytes)
+        Holds the store lock exclusively, so no snapshot is adding or reusing chunks meanwhile
+        """
+        with self.lock(exclusive=True):
+            return self._prune(keep_hourly, keep_daily, keep_weekly, keep_last, min_age_hours)
+
+    def _prune(self, keep_hourly, keep_daily, keep_weekly, keep_last, min_age_hours):
+        manifests = self.list_snapshots()
+        keep = self.select_retained(manifests, keep_hourly, keep_daily, keep_weekly,
+                                    keep_last, min_age_hours)
+        removed = [m['id'] for m in manifests if m['id'] not in keep]
+        for snapshot_id in removed:
+            os.remove(self._manifest_path(snapshot_id))
+
+        referenced = set()
+        for manifest in manifests:
+            if manifest['id'] in keep:
+                referenced.update(manifest['chunks'])
+
+        removed_chunks = 0
+        freed = 0
+        for prefix in os.listdir(self.chunk_dir):
+            prefix_dir = os.path.join(self.chunk_dir, prefix)
+            for name in os.listdir(prefix_dir):
+                if name.endswith('.tmp'):
+                    continue  # another writer's chunk in flight
+                digest = name.split('.', 1)[0]
+                if digest not in referenced:
+                    path = os.path.join(prefix_dir, name)
+                    freed += os.path.getsize(path)
+                    os.remove(path)
+                    removed_chunks += 1
+        return removed, removed_chunks, freed
+
+    # ---- reporting ----------------------------------------------------
+
+    def stored_bytes(self):
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                total += os.path.getsize(os.path.join(dirpath, name))
+        return total
+
+    def space_report(self):
+        """(full_copy_bytes, stored_bytes) for the snapshots currently in the store"""
+        full = sum(m['size'] for m in self.list_snapshots())
+        return full, self.stored_bytes()
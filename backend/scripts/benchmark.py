@@ -0,0 +1,385 @@
+"""
+Benchmark Suite for the Data-Generation and Scoring Scripts
+- Times generate_candidate_for_job(), calculate_ai_score(),
+  generate_test_score_and_performance(), save_to_database() and the
+  add_multiple_applications.py flow at several scales
+- Every scale runs against a scratch database (schema copied from --db), so
+  the real database is untouched; every stage runs in its own fresh process,
+  so its peak RSS is that stage's alone
+- Results are written as JSON: per-stage wall time, rows/sec and peak RSS
+- --baseline compares the run against a stored results file and exits
+  non-zero when any stage's rows/sec drops by more than --threshold
+
+Usage:
+    python backend/scripts/benchmark.py --sizes 1000 100000 1000000 --output baseline.json
+    python backend/scripts/benchmark.py --sizes 1000 100000 --baseline baseline.json
+    python backend/scripts/benchmark.py --compare latest.json --baseline baseline.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+sys.path.append(os.path.dirname(__file__))
+
+from generate_candidates_v2 import (
+    QUALITY_TIERS,
+    build_generation_tasks,
+    generate_candidate_for_job,
+    generate_job_posted_dates,
+    generate_test_score_and_performance,
+    get_candidate_distribution,
+    get_job_roles,
+    iter_candidates,
+    make_rng,
+    save_to_database,
+)
+from identity import IdentityAllocator
+from scoring import calculate_ai_score
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(__file__), '../database/recruitment.db')
+DEFAULT_SIZES = [1000, 100000, 1000000]
+DEFAULT_SEED = 42
+DEFAULT_THRESHOLD = 0.10
+
+# Scoring stages cycle over a bounded sample of generated candidates so
+# memory stays flat at 1M
+SAMPLE_SIZE = 10000
+
+# add_multiple_applications.py adds 200 applications to the 925 seeded candidates
+ADD_MULTIPLE_RATIO = 200 / 925
+
+STAGES = [
+    'generate_candidate_for_job',
+    'calculate_ai_score',
+    'generate_test_score_and_performance',
+    'save_to_database',
+    'seed_pipeline',
+    'add_multiple_applications',
+]
+
+def peak_rss_mb():
+    """Peak resident set size of this process (None when unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+def stage_result(seconds, rows, **details):
+    result = {
+        'seconds': round(seconds, 4),
+        'rows': rows,
+        'rows_per_sec': round(rows / seconds, 1) if seconds > 0 else None,
+        'peak_rss_mb': peak_rss_mb(),
+    }
+    if details:
+        result['details'] = details
+    return result
+
+@contextlib.contextmanager
+def quiet(verbose=False):
+    """Silence the scripts' progress prints while a stage is timed"""
+    if verbose:
+        yield
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+
+class TimedIterator:
+    """Wraps an iterator and accumulates the time spent producing items"""
+
+    def __init__(self, iterable):
+        self.iterator = iter(iterable)
+        self.seconds = 0.0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            return next(self.iterator)
+        finally:
+            self.seconds += time.perf_counter() - start
+
+def create_scratch_database(source_db, target_db):
+    """Create an empty database with the source database's schema"""
+    source = sqlite3.connect(f"file:{source_db}?mode=ro", uri=True)
+    try:
+        statements = [sql for (sql,) in source.execute(
+            "SELECT sql FROM sqlite_master WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' "
+            "ORDER BY CASE type WHEN 'table' THEN 0 ELSE 1 END, rowid"
+        )]
+    finally:
+        source.close()
+
+    target = sqlite3.connect(target_db)
+    try:
+        for sql in statements:
+            target.execute(sql)
+        target.commit()
+    finally:
+        target.close()
+
+def bench_generation(size, seed, now, job_posted_dates):
+    """generate_candidate_for_job() over the role distribution; returns (result, sample)"""
+    job_roles = get_job_roles()
+    distribution = get_candidate_distribution()
+    scale = size / sum(distribution.values())
+    tasks = build_generation_tasks(job_roles, distribution, job_posted_dates, seed, now, scale)
+    total = sum(task[2] for task in tasks)
+    stride = max(1, total // SAMPLE_SIZE)
+
+    sample = []
+    generated = 0
+    identities = IdentityAllocator()
+    start = time.perf_counter()
+    for role, chunk_index, count, job_posted_date, task_seed, task_now, quality_weights in tasks:
+        rng = make_rng(task_seed, role['id'], chunk_index)
+        for _ in range(count):
+            quality_tier = rng.choices(QUALITY_TIERS, weights=quality_weights)[0]
+            candidate = generate_candidate_for_job(role, job_posted_date, quality_tier, identities, rng, task_now)
+            if generated % stride == 0:
+                sample.append((candidate, role))
+            generated += 1
+    seconds = time.perf_counter() - start
+    return stage_result(seconds, generated), sample
+
+def bench_ai_score(size, sample):
+    calls = sample[:size]
+    repeats, remainder = divmod(size, len(calls))
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for candidate, role in calls:
+            calculate_ai_score(candidate, role)
+    for candidate, role in calls[:remainder]:
+        calculate_ai_score(candidate, role)
+    return stage_result(time.perf_counter() - start, size)
+
+def bench_test_score(size, sample, seed):
+    rng = random.Random(seed)
+    calls = sample[:size]
+    repeats, remainder = divmod(size, len(calls))
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for candidate, role in calls:
+            generate_test_score_and_performance(candidate, role, rng)
+    for candidate, role in calls[:remainder]:
+        generate_test_score_and_performance(candidate, role, rng)
+    return stage_result(time.perf_counter() - start, size)
+
+def bench_save(size, seed, now, job_posted_dates, db_path, verbose):
+    """
+    Seed the scratch database the way main() does (streamed generation into
+    save_to_database). Time spent producing candidates is measured separately,
+    so save_to_database is reported on its own and seed_pipeline end to end
+    """
+    distribution = get_candidate_distribution()
+    scale = size / sum(distribution.values())
+    candidates = TimedIterator(iter_candidates(job_posted_dates, seed, 1, scale, now))
+
+    start = time.perf_counter()
+    with quiet(verbose):
+        inserted = save_to_database(candidates, job_posted_dates, db_path)
+    total_seconds = time.perf_counter() - start
+
+    rows = sum(inserted.values())
+    save = stage_result(total_seconds - candidates.seconds, rows, **inserted)
+    pipeline = stage_result(total_seconds, inserted['candidates'],
+                            generation_seconds=round(candidates.seconds, 4))
+    return save, pipeline
+
+def bench_add_multiple(size, seed, db_path, verbose):
+    """add_multiple_applications.add_applications() against the seeded scratch database"""
+    import add_multiple_applications as add_multiple
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        count = max(1, round(size * ADD_MULTIPLE_RATIO))
+        start = time.perf_counter()
+        with quiet(verbose):
+            inserted = add_multiple.add_applications(conn, count, random.Random(seed))
+        seconds = time.perf_counter() - start
+    finally:
+        conn.close()
+
+    rows = sum(inserted[table] for table in ('applications', 'ai_analysis', 'tests', 'decisions'))
+    return stage_result(seconds, rows, **inserted)
+
+def run_stage(function, *args):
+    """Run one stage in a fresh process, so its peak RSS is not inflated by earlier stages"""
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(function, *args).result()
+
+def run_scale(size, seed, source_db, verbose=False):
+    """Run every stage at one scale; returns {'candidates', 'stages', 'total_seconds'}"""
+    now = datetime(2025, 1, 1, 12, 0, 0)  # fixed reference time: identical data every run
+    scratch_dir = tempfile.mkdtemp(prefix='ats_bench_')
+    db_path = os.path.join(scratch_dir, 'bench.db')
+    start = time.perf_counter()
+    try:
+        create_scratch_database(source_db, db_path)
+        with quiet(verbose):
+            job_posted_dates = generate_job_posted_dates(get_job_roles(), seed, now)
+
+        stages = {}
+        stages['generate_candidate_for_job'], sample = run_stage(
+            bench_generation, size, seed, now, job_posted_dates)
+        stages['calculate_ai_score'] = run_stage(bench_ai_score, size, sample)
+        stages['generate_test_score_and_performance'] = run_stage(bench_test_score, size, sample, seed)
+        del sample
+        stages['save_to_database'], stages['seed_pipeline'] = run_stage(
+            bench_save, size, seed, now, job_posted_dates, db_path, verbose)
+        stages['add_multiple_applications'] = run_stage(bench_add_multiple, size, seed, db_path, verbose)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    return {
+        'candidates': stages['generate_candidate_for_job']['rows'],
+        'stages': stages,
+        'total_seconds': round(time.perf_counter() - start, 3),
+    }
+
+def run_benchmarks(sizes, seed=DEFAULT_SEED, source_db=DEFAULT_DB_PATH, verbose=False):
+    """Run each scale (each stage in a fresh process) and collect the results document"""
+    results = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': seed,
+        'scales': {},
+    }
+    for size in sizes:
+        print(f"\n⏱️  Benchmarking {size:,} candidates...")
+        scale_result = run_scale(size, seed, source_db, verbose)
+        results['scales'][str(size)] = scale_result
+        print_scale(size, scale_result)
+    return results
+
+def print_scale(size, scale_result):
+    print(f"   {'Stage':<38} {'Seconds':>10} {'Rows/sec':>14} {'Peak RSS':>10}")
+    for name in STAGES:
+        stage = scale_result['stages'].get(name)
+        if stage is None:
+            continue
+        rate = f"{stage['rows_per_sec']:,.0f}" if stage['rows_per_sec'] else '-'
+        rss = f"{stage['peak_rss_mb']:,.0f} MB" if stage['peak_rss_mb'] is not None else '-'
+        print(f"   {name:<38} {stage['seconds']:>10.3f} {rate:>14} {rss:>10}")
+    print(f"   Total: {scale_result['total_seconds']:.2f}s")
+
+def compare_results(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare rows/sec per (scale, stage) against the baseline
+    Returns a list of comparison dicts; 'regression' is True when throughput
+    dropped by more than `threshold` (a fraction, 0.10 = 10%)
+    """
+    comparisons = []
+    for size, scale_result in current['scales'].items():
+        baseline_scale = baseline['scales'].get(size)
+        if baseline_scale is None:
+            continue
+        for name, stage in scale_result['stages'].items():
+            baseline_stage = baseline_scale['stages'].get(name)
+            if not baseline_stage or not stage['rows_per_sec'] or not baseline_stage['rows_per_sec']:
+                continue
+            change = stage['rows_per_sec'] / baseline_stage['rows_per_sec'] - 1
+            comparisons.append({
+                'size': size,
+                'stage': name,
+                'baseline_rows_per_sec': baseline_stage['rows_per_sec'],
+                'rows_per_sec': stage['rows_per_sec'],
+                'change': round(change, 4),
+                'baseline_peak_rss_mb': baseline_stage.get('peak_rss_mb'),
+                'peak_rss_mb': stage.get('peak_rss_mb'),
+                'regression': change < -threshold,
+            })
+    return comparisons
+
+def print_comparison(comparisons, threshold):
+    print(f"\n📊 Comparison against baseline (regression threshold: -{threshold:.0%} rows/sec)")
+    if not comparisons:
+        print("   ⚠️  No matching scales/stages in the baseline")
+        return
+    print(f"   {'Scale':>9} {'Stage':<38} {'Baseline':>12} {'Current':>12} {'Change':>8}")
+    for c in comparisons:
+        flag = '❌' if c['regression'] else '✅'
+        print(f"   {int(c['size']):>9,} {c['stage']:<38} {c['baseline_rows_per_sec']:>12,.0f} "
+              f"{c['rows_per_sec']:>12,.0f} {c['change']:>+8.1%} {flag}")
+    regressions = [c for c in comparisons if c['regression']]
+    if regressions:
+        print(f"\n❌ {len(regressions)} stage(s) regressed")
+    else:
+        print("\n✅ No regressions")
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+def write_results(results, path):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(results, f, indent=2)
+    os.replace(tmp_path, path)
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark the data-generation and scoring scripts")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Candidate counts to benchmark (default: 1000 100000 1000000)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="Seed for the generated data")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH,
+                        help="Database whose schema is copied into the scratch database")
+    parser.add_argument('--output', default='benchmark_results.json', help="Results JSON path")
+    parser.add_argument('--baseline', help="Stored results JSON to compare against")
+    parser.add_argument('--compare', metavar='RESULTS',
+                        help="Compare an existing results file with --baseline instead of running")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed rows/sec drop before a stage counts as a regression (default: 0.10)")
+    parser.add_argument('--verbose', action='store_true', help="Show the scripts' own progress output")
+    args = parser.parse_args(argv)
+    if args.compare and not args.baseline:
+        parser.error("--compare requires --baseline")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.compare:
+        results = load_results(args.compare)
+    else:
+        print("🏁 Data-generation benchmark")
+        print(f"   Sizes: {', '.join(f'{s:,}' for s in args.sizes)} | Seed: {args.seed}")
+        results = run_benchmarks(args.sizes, args.seed, args.db, args.verbose)
+        write_results(results, args.output)
+        print(f"\n💾 Results written to: {args.output}")
+
+    if args.baseline:
+        comparisons = compare_results(results, load_results(args.baseline), args.threshold)
+        print_comparison(comparisons, args.threshold)
+        if any(c['regression'] for c in comparisons):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
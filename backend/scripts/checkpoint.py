@@ -0,0 +1,191 @@
+"""
+Resumable Seed Runs
+- A checkpointed run commits after every `every` candidates, at a task
+  boundary (a role chunk, or a run of days in time-series mode), and records
+  its progress in the same transaction:
+    seed_progress         run settings (seed, reference time, profile, volume,
+                          mode, posting dates), the next task to generate, the
+                          last completed task (role id, chunk index, seed),
+                          the next ids and the rows inserted so far
+    seed_progress_emails  email counters of the identity allocator
+                          (identity.py), so resumed emails continue the sequence
+- generate_candidates_v2.py --resume restores all of it and skips the
+  finished tasks without generating them; the result is identical to an
+  uninterrupted run
+- Progress is deleted in the transaction that completes the run, and a new
+  (non-resumed) run discards any stale progress first
+- Checkpointed runs commit with synchronous=FULL, so every recorded
+  checkpoint survives a power loss along with its batch
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+sys.path.append(os.path.dirname(__file__))
+
+from identity import IdentityAllocator
+
+PROGRESS_TABLES = ['seed_progress', 'seed_progress_emails']
+
+PROGRESS_SCHEMA_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS seed_progress (
+        run_id INTEGER PRIMARY KEY CHECK (run_id = 1),
+        settings TEXT NOT NULL,
+        next_task INTEGER NOT NULL,
+        last_task TEXT NOT NULL,
+        ids TEXT NOT NULL,
+        inserted TEXT NOT NULL,
+        identity_sequence INTEGER NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS seed_progress_emails (
+        base_email TEXT PRIMARY KEY,
+        count INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+]
+
+SAVE_PROGRESS_SQL = """
+    INSERT OR REPLACE INTO seed_progress (
+        run_id, settings, next_task, last_task, ids, inserted, identity_sequence, updated_at
+    ) VALUES (1, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SAVE_EMAIL_COUNTS_SQL = """
+    INSERT INTO seed_progress_emails (base_email, count) VALUES (?, ?)
+    ON CONFLICT(base_email) DO UPDATE SET count = excluded.count
+"""
+
+# Candidates per committed batch (generate_candidates_v2.py --checkpoint-every)
+DEFAULT_CHECKPOINT_EVERY = 100000
+
+# Checkpointed commits are synced: a recorded checkpoint must never cover a
+# batch that a power loss could still take back
+CHECKPOINT_SYNCHRONOUS = 'FULL'
+
+def progress_tables_exist(cursor):
+    """True when the progress tables are present"""
+    placeholders = ','.join('?' * len(PROGRESS_TABLES))
+    cursor.execute(f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+                   PROGRESS_TABLES)
+    return cursor.fetchone()[0] == len(PROGRESS_TABLES)
+
+def ensure_progress_tables(cursor):
+    """Create the progress tables if missing"""
+    for sql in PROGRESS_SCHEMA_SQL:
+        cursor.execute(sql)
+
+def clear_progress(cursor):
+    """Discard recorded progress (no-op when the tables do not exist)"""
+    if progress_tables_exist(cursor):
+        cursor.execute("DELETE FROM seed_progress")
+        cursor.execute("DELETE FROM seed_progress_emails")
+
+def run_settings(seed, now, profile, scale, total, append, identity_offset, job_posted_dates):
+    """Everything that determines a run's output, in JSON-friendly form"""
+    return {
+        'seed': seed,
+        'now': now.isoformat(),
+        'profile': profile,
+        'scale': scale,
+        'total': total,
+        'append': append,
+        'identity_offset': identity_offset,
+        'job_posted_dates': {role_id: posted.isoformat() for role_id, posted in job_posted_dates.items()},
+    }
+
+def load_progress(db_path):
+    """
+    Progress of an interrupted run, or None
+    settings come back with datetimes restored (now, job_posted_dates)
+    """
+    if not os.path.exists(db_path):
+        return None
+    # Read-write on purpose: a killed run leaves a hot journal, which SQLite
+    # can only roll back (on the first read) through a writable connection
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        if not progress_tables_exist(cursor):
+            return None
+        row = cursor.execute(
+            "SELECT settings, next_task, last_task, ids, inserted, identity_sequence "
+            "FROM seed_progress WHERE run_id = 1").fetchone()
+        if row is None:
+            return None
+        email_counts = dict(cursor.execute("SELECT base_email, count FROM seed_progress_emails"))
+    finally:
+        conn.close()
+    settings, next_task, last_task, ids, inserted, identity_sequence = row
+    return {
+        'settings': json.loads(settings),
+        'next_task': next_task,
+        'last_task': json.loads(last_task),
+        'ids': json.loads(ids),
+        'inserted': json.loads(inserted),
+        'identity_sequence': identity_sequence,
+        'email_counts': email_counts,
+    }
+
+def restore_settings(settings):
+    """(now, job_posted_dates) of stored run settings as datetimes"""
+    now = datetime.fromisoformat(settings['now'])
+    job_posted_dates = {role_id: datetime.fromisoformat(posted)
+                        for role_id, posted in settings['job_posted_dates'].items()}
+    return now, job_posted_dates
+
+class SeedCheckpoint:
+    """
+    Commit points and progress records for one run
+    `progress` (from load_progress) resumes an interrupted run: tasks before
+    start_task are skipped and the identity allocator picks up where it was
+    """
+
+    def __init__(self, settings, every=DEFAULT_CHECKPOINT_EVERY, progress=None):
+        if every < 1:
+            raise ValueError("Checkpoint interval must be at least 1 candidate")
+        self.settings = settings
+        self.every = every
+        self.progress = progress
+        if progress is None:
+            self.start_task = 0
+            self.identities = IdentityAllocator(settings['identity_offset'])
+        else:
+            self.start_task = progress['next_task']
+            self.identities = IdentityAllocator(progress['identity_sequence'], progress['email_counts'])
+        self.saved_task = None
+
+    def batches(self, task_results):
+        """
+        (candidates, completed task or None) per task; the completed task
+        (index, key) marks a commit point, reached every `every` candidates
+        """
+        pending = 0
+        for task_index, key, chunk in task_results:
+            pending += len(chunk)
+            if pending >= self.every:
+                pending = 0
+                yield chunk, (task_index, key)
+            else:
+                yield chunk, None
+
+    def save(self, cursor, task, ids, inserted):
+        """Record progress through `task` (in the caller's transaction)"""
+        task_index, key = task
+        cursor.execute(SAVE_PROGRESS_SQL, (
+            json.dumps(self.settings),
+            task_index + 1,
+            json.dumps(key),
+            json.dumps(ids),
+            json.dumps(inserted),
+            self.identities.sequence,
+            datetime.now().isoformat(),
+        ))
+        cursor.executemany(SAVE_EMAIL_COUNTS_SQL, self.identities.take_changes().items())
+        self.saved_task = task
@@ -0,0 +1,240 @@
+"""
+Vectorized Cohort Scoring
+- NumPy version of calculate_ai_score() for a whole cohort of one job role
+- Inputs are arrays: skill-presence matrix, experience years, cert counts,
+  education-match vector
+- Computes AI scores, eligibility and matched/missing skill masks in one pass
+- Scores match the scalar calculate_ai_score() exactly, rounding included
+- Run directly for a scalar vs vectorized benchmark:
+    python backend/scripts/cohort_scoring.py --sizes 100000 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+sys.path.append(os.path.dirname(__file__))
+
+from scoring import (
+    calculate_ai_score,
+    check_education_match,
+    load_role_catalog,
+)
+from skill_index import compile_role
+
+def require_numpy():
+    """Fail with an actionable message when NumPy is not installed"""
+    if np is None:
+        raise ImportError("cohort_scoring requires NumPy: pip install numpy")
+
+def build_skill_matrix(candidates, job_role):
+    """
+    Build a boolean (n_candidates, n_required_skills) presence matrix
+    Column j is True when the candidate lists job_role['skillKeywords'][j]
+    (matched case-insensitively through the role's compiled SkillIndex)
+    """
+    require_numpy()
+    skill_index = compile_role(job_role)
+    column_bits = [skill_index.bits[skill] for skill in job_role['skillKeywords']]
+    matrix = np.zeros((len(candidates), len(column_bits)), dtype=bool)
+    for i, candidate in enumerate(candidates):
+        mask = skill_index.mask(candidate['skills'])
+        if mask:
+            matrix[i] = [bool(mask & bit) for bit in column_bits]
+    return matrix
+
+def education_match_vector(educations, job_education):
+    """
+    Evaluate check_education_match() once per distinct education string
+    and broadcast the result to a boolean vector
+    """
+    require_numpy()
+    cache = {}
+    result = np.empty(len(educations), dtype=bool)
+    for i, education in enumerate(educations):
+        match = cache.get(education)
+        if match is None:
+            match = cache[education] = check_education_match(education, job_education)
+        result[i] = match
+    return result
+
+def cohort_arrays(candidates, job_role):
+    """Convert candidate dicts into the array inputs of score_cohort()"""
+    require_numpy()
+    return (
+        build_skill_matrix(candidates, job_role),
+        np.array([c['experience_years'] for c in candidates], dtype=np.float64),
+        np.array([len(c['certifications']) for c in candidates], dtype=np.float64),
+        education_match_vector([c['education'] for c in candidates], job_role['education']),
+    )
+
+def experience_match_vector(experience_years, job_range):
+    """Vectorized calculate_experience_match()"""
+    min_years = job_range['min']
+    max_years = job_range['max']
+    under = np.maximum(0.5, 1.0 - ((min_years - experience_years) * 0.15))
+    over = np.maximum(0.7, 1.0 - ((experience_years - max_years) * 0.10))
+    return np.where(experience_years < min_years, under,
+                    np.where(experience_years > max_years, over, 1.0))
+
+def round_half_like_python(values, ndigits=1):
+    """
+    np.round() that agrees with Python's round() on every element
+    np.round scales by 10**ndigits first, which can flip values sitting on a
+    ...5 boundary; those elements are re-rounded with round() once per
+    distinct value (scores are sums of a few discrete terms, so few distinct)
+    """
+    scaled = values * 10 ** ndigits
+    rounded = np.round(values, ndigits)
+    ties = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if ties.any():
+        distinct, inverse = np.unique(values[ties], return_inverse=True)
+        fixed = np.array([round(float(v), ndigits) for v in distinct])
+        rounded[ties] = fixed[inverse]
+    return rounded
+
+def score_cohort(job_role, skill_matrix, experience_years, cert_counts, education_match):
+    """
+    Score a whole cohort for one job role
+
+    Args:
+        job_role: role dict from load_role_catalog()
+        skill_matrix: bool (n, len(skillKeywords)) skill-presence matrix
+        experience_years: (n,) years of experience
+        cert_counts: (n,) number of certifications held, counted like
+            calculate_ai_score() does: every held certification, whether
+            or not the role lists it (cert_match may exceed 1)
+        education_match: bool (n,) check_education_match() results
+
+    Returns dict of arrays: ai_score (rounded to 1 dp), is_eligible,
+    matched_mask, missing_mask, matched_count
+    """
+    require_numpy()
+    w_skills, w_knowledge, w_tasks, w_certs, w_education = job_role['weightVector']
+    required_skills = job_role['skillKeywords']
+    required_certs = job_role.get('certifications', [])
+    skill_matrix = np.asarray(skill_matrix, dtype=bool)
+    experience_years = np.asarray(experience_years, dtype=np.float64)
+    cert_counts = np.asarray(cert_counts, dtype=np.float64)
+    education_match = np.asarray(education_match, dtype=bool)
+
+    # Same operation order as calculate_ai_score() so floats agree bit for bit
+    # 1. Skills match
+    matched_count = skill_matrix.sum(axis=1)
+    skill_match = matched_count / max(len(required_skills), 1)
+    skill_score = skill_match * 100 * w_skills
+
+    # 2. Experience/Knowledge match
+    exp_match = experience_match_vector(experience_years, job_role['experienceRange'])
+    knowledge_score = exp_match * 100 * w_knowledge
+
+    # 3. Tasks capability (skills 50%, experience 30%, certifications 20%)
+    if required_certs:
+        cert_match = cert_counts / max(len(required_certs), 1)
+    else:
+        cert_match = np.full(len(cert_counts), 0.5)
+    task_capability = skill_match * 0.5 + exp_match * 0.3 + cert_match * 0.2
+    task_score = task_capability * 100 * w_tasks
+
+    # 4. Certifications match
+    cert_score = cert_match * 100 * w_certs
+
+    # 5. Education match
+    edu_score = np.where(education_match, 1.0, 0.5) * 100 * w_education
+
+    ai_score = round_half_like_python(skill_score + knowledge_score + task_score + cert_score + edu_score)
+
+    return {
+        'ai_score': ai_score,
+        'is_eligible': ai_score >= job_role['thresholdScore'],
+        'matched_mask': skill_matrix,
+        'missing_mask': ~skill_matrix,
+        'matched_count': matched_count,
+    }
+
+def synthetic_cohort(job_role, size, seed=0):
+    """Random cohort arrays for benchmarking (same value ranges as the generator)"""
+    require_numpy()
+    rng = np.random.default_rng(seed)
+    n_skills = len(job_role['skillKeywords'])
+    n_certs = len(job_role.get('certifications', []))
+    exp_range = job_role['experienceRange']
+    return (
+        rng.random((size, n_skills)) < 0.7,
+        rng.integers(max(0, exp_range['min'] - 2), exp_range['max'] + 3, size).astype(np.float64),
+        rng.integers(0, n_certs + 1, size).astype(np.float64),
+        rng.random(size) < 0.8,
+    )
+
+def scalar_candidates(job_role, skill_matrix, experience_years, cert_counts, education_match, limit):
+    """Build candidate dicts equivalent to the first `limit` cohort rows"""
+    required_skills = job_role['skillKeywords']
+    certs = job_role.get('certifications', [])
+    matched_edu = "Bachelor's degree in Cybersecurity"
+    unmatched_edu = "High school diploma"
+    if not check_education_match(matched_edu, job_role['education']):
+        raise ValueError(f"{matched_edu!r} does not match {job_role['title']}'s education: {job_role['education']}")
+    if check_education_match(unmatched_edu, job_role['education']):
+        raise ValueError(f"{unmatched_edu!r} unexpectedly matches {job_role['title']}'s education: "
+                         f"{job_role['education']}")
+
+    candidates = []
+    for i in range(limit):
+        candidates.append({
+            'skills': [s for s, present in zip(required_skills, skill_matrix[i]) if present],
+            'experience_years': int(experience_years[i]),
+            'certifications': certs[:int(cert_counts[i])],
+            'education': matched_edu if education_match[i] else unmatched_edu,
+        })
+    return candidates
+
+def run_benchmark(sizes, role_id='1', scalar_limit=100000):
+    """Time scalar vs vectorized scoring and check the results agree"""
+    require_numpy()
+    job_role = next(r for r in load_role_catalog() if r['id'] == role_id)
+    print(f"\n⏱️  Cohort scoring benchmark - {job_role['title']} (Role {role_id})")
+
+    for size in sizes:
+        arrays = synthetic_cohort(job_role, size)
+
+        start = time.perf_counter()
+        result = score_cohort(job_role, *arrays)
+        vector_seconds = time.perf_counter() - start
+
+        # Scalar path is timed on up to scalar_limit rows and extrapolated
+        limit = min(size, scalar_limit)
+        candidates = scalar_candidates(job_role, *arrays, limit)
+        start = time.perf_counter()
+        scalar_scores = [calculate_ai_score(c, job_role) for c in candidates]
+        scalar_seconds = (time.perf_counter() - start) * (size / limit)
+
+        max_diff = float(np.max(np.abs(result['ai_score'][:limit] - np.array(scalar_scores))))
+        masks_agree = all(
+            len(c['matched_skills']) == result['matched_count'][i] for i, c in enumerate(candidates)
+        )
+
+        print(f"\n   📊 {size:,} candidates")
+        print(f"      Scalar:     {scalar_seconds:8.3f}s ({size / scalar_seconds:,.0f}/sec)"
+              + ("" if limit == size else f" [extrapolated from {limit:,}]"))
+        print(f"      Vectorized: {vector_seconds:8.3f}s ({size / vector_seconds:,.0f}/sec)")
+        print(f"      Speedup:    {scalar_seconds / vector_seconds:,.1f}x")
+        print(f"      Max score difference: {max_diff:.2f} | Matched masks agree: {'✅' if masks_agree else '❌'}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark vectorized cohort scoring")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 1000000],
+                        help="Cohort sizes to benchmark")
+    parser.add_argument('--role', default='1', help="Job role id")
+    parser.add_argument('--scalar-limit', type=int, default=100000,
+                        help="Max rows timed on the scalar path (rest is extrapolated)")
+    args = parser.parse_args(argv)
+    run_benchmark(args.sizes, args.role, args.scalar_limit)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""
+Columnar Snapshot of Analysis and Test Data
+- Writes ai_analysis and tests to Parquet (default) or Arrow IPC files for
+  offline analytics, decoding the JSON text columns once at export time
+- skills_matched / skill_gaps / certifications / verified_skills /
+  unverified_skills / untested_skills become list<string> columns
+- verification_details becomes skill_performance:
+  list<struct<skill, correct, total, percentage, level>>
+- Each row carries its application keys (candidate_id, role_id, status,
+  applied_at) so either file can be queried on its own
+- Streams from SQLite in chunks into record batches (constant memory);
+  Arrow IPC files are uncompressed by default so they can be memory-mapped
+- Requires pyarrow (optional dependency): pip install pyarrow
+
+Usage:
+    python backend/scripts/columnar_export.py --out snapshot/ --format parquet
+    python backend/scripts/columnar_export.py --out snapshot/ --format arrow
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+DB_PATH = os.path.join(os.path.dirname(__file__), '../database/recruitment.db')
+OUTPUT_DIR = 'columnar_snapshot'
+CHUNK_SIZE = 50000
+
+def require_pyarrow():
+    """Fail with an actionable message when pyarrow is not installed"""
+    if pa is None:
+        raise ImportError("columnar_export requires pyarrow: pip install pyarrow")
+
+ANALYSIS_SQL = """
+    SELECT an.analysis_id, an.application_id, a.candidate_id, a.role_id, jr.title,
+           a.status, a.applied_at,
+           an.ai_score, an.skills_matched, an.skill_gaps,
+           an.experience_years, an.experience_level, an.education, an.certifications,
+           an.analysis_completed_at
+    FROM ai_analysis an
+    JOIN applications a ON a.application_id = an.application_id
+    LEFT JOIN job_roles jr ON jr.role_id = a.role_id
+    ORDER BY an.analysis_id
+"""
+
+TESTS_SQL = """
+    SELECT t.test_id, t.application_id, a.candidate_id, a.role_id,
+           t.test_score, t.started_at, t.completed_at, t.duration_minutes,
+           t.verified_skills, t.unverified_skills, t.untested_skills,
+           t.verification_details,
+           (SELECT d.composite_score FROM decisions d
+            WHERE d.application_id = t.application_id
+            ORDER BY d.decision_id DESC LIMIT 1)
+    FROM tests t
+    JOIN applications a ON a.application_id = t.application_id
+    ORDER BY t.test_id
+"""
+
+def analysis_schema():
+    return pa.schema([
+        ('analysis_id', pa.int64()),
+        ('application_id', pa.int64()),
+        ('candidate_id', pa.int64()),
+        ('role_id', pa.int32()),
+        ('role_title', pa.string()),
+        ('status', pa.string()),
+        ('applied_at', pa.timestamp('us')),
+        ('ai_score', pa.float64()),
+        ('skills_matched', pa.list_(pa.string())),
+        ('skill_gaps', pa.list_(pa.string())),
+        ('experience_years', pa.int32()),
+        ('experience_level', pa.string()),
+        ('education', pa.string()),
+        ('certifications', pa.list_(pa.string())),
+        ('analysis_completed_at', pa.timestamp('us')),
+    ])
+
+def skill_performance_type():
+    return pa.struct([
+        ('skill', pa.string()),
+        ('correct', pa.int32()),
+        ('total', pa.int32()),
+        ('percentage', pa.float64()),
+        ('level', pa.string()),
+    ])
+
+def tests_schema():
+    return pa.schema([
+        ('test_id', pa.int64()),
+        ('application_id', pa.int64()),
+        ('candidate_id', pa.int64()),
+        ('role_id', pa.int32()),
+        ('test_score', pa.float64()),
+        ('started_at', pa.timestamp('us')),
+        ('completed_at', pa.timestamp('us')),
+        ('duration_minutes', pa.int32()),
+        ('verified_skills', pa.list_(pa.string())),
+        ('unverified_skills', pa.list_(pa.string())),
+        ('untested_skills', pa.list_(pa.string())),
+        ('skill_performance', pa.list_(skill_performance_type())),
+        ('composite_score', pa.float64()),
+    ])
+
+def parse_json_list(value):
+    """
+    JSON list column -> Python list
+    Gap analyses written by the backend store an object
+    ({"skills": [...], "knowledge": [...], ...}); its skill list is used
+    """
+    if not value:
+        return []
+    parsed = json.loads(value)
+    if isinstance(parsed, dict):
+        return parsed.get('skills') or []
+    return parsed
+
+def parse_timestamp(value):
+    """SQLite text timestamps ('2025-11-19T09:57:00.082072' or '2025-11-24 03:20:19')"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+def parse_skill_performance(value):
+    """verification_details JSON {skill: {...}} -> list of struct dicts"""
+    if not value:
+        return []
+    return [
+        {
+            'skill': skill,
+            'correct': detail.get('correct'),
+            'total': detail.get('total'),
+            'percentage': detail.get('percentage'),
+            'level': detail.get('level'),
+        }
+        for skill, detail in json.loads(value).items()
+    ]
+
+def analysis_batch(rows, schema):
+    """Record batch from ANALYSIS_SQL rows"""
+    columns = list(zip(*rows))
+    return pa.record_batch([
+        pa.array(columns[0], pa.int64()),
+        pa.array(columns[1], pa.int64()),
+        pa.array(columns[2], pa.int64()),
+        pa.array(columns[3], pa.int32()),
+        pa.array(columns[4], pa.string()),
+        pa.array(columns[5], pa.string()),
+        pa.array([parse_timestamp(v) for v in columns[6]], pa.timestamp('us')),
+        pa.array(columns[7], pa.float64()),
+        pa.array([parse_json_list(v) for v in columns[8]], pa.list_(pa.string())),
+        pa.array([parse_json_list(v) for v in columns[9]], pa.list_(pa.string())),
+        pa.array(columns[10], pa.int32()),
+        pa.array(columns[11], pa.string()),
+        pa.array(columns[12], pa.string()),
+        pa.array([parse_json_list(v) for v in columns[13]], pa.list_(pa.string())),
+        pa.array([parse_timestamp(v) for v in columns[14]], pa.timestamp('us')),
+    ], schema=schema)
+
+def tests_batch(rows, schema):
+    """Record batch from TESTS_SQL rows"""
+    columns = list(zip(*rows))
+    return pa.record_batch([
+        pa.array(columns[0], pa.int64()),
+        pa.array(columns[1], pa.int64()),
+        pa.array(columns[2], pa.int64()),
+        pa.array(columns[3], pa.int32()),
+        pa.array(columns[4], pa.float64()),
+        pa.array([parse_timestamp(v) for v in columns[5]], pa.timestamp('us')),
+        pa.array([parse_timestamp(v) for v in columns[6]], pa.timestamp('us')),
+        pa.array(columns[7], pa.int32()),
+        pa.array([parse_json_list(v) for v in columns[8]], pa.list_(pa.string())),
+        pa.array([parse_json_list(v) for v in columns[9]], pa.list_(pa.string())),
+        pa.array([parse_json_list(v) for v in columns[10]], pa.list_(pa.string())),
+        pa.array([parse_skill_performance(v) for v in columns[11]], pa.list_(skill_performance_type())),
+        pa.array(columns[12], pa.float64()),
+    ], schema=schema)
+
+# name -> (query, schema factory, batch builder)
+DATASETS = {
+    'ai_analysis': (ANALYSIS_SQL, analysis_schema, analysis_batch),
+    'tests': (TESTS_SQL, tests_schema, tests_batch),
+}
+
+class BatchWriter:
+    """Parquet or Arrow IPC file writer behind one write_batch()/close() API"""
+
+    def __init__(self, path, schema, fmt, compression):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        if fmt == 'parquet':
+            self.writer = pq.ParquetWriter(self.tmp_path, schema, compression=compression or 'none')
+        else:
+            options = pa.ipc.IpcWriteOptions(compression=compression)
+            self.writer = pa.ipc.new_file(self.tmp_path, schema, options=options)
+
+    def write_batch(self, batch):
+        self.writer.write_batch(batch)
+
+    def close(self):
+        self.writer.close()
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        self.writer.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+def export_dataset(conn, name, path, fmt, compression, chunk_size=CHUNK_SIZE):
+    """Stream one dataset query into a columnar file; returns the row count"""
+    query, schema_factory, build_batch = DATASETS[name]
+    schema = schema_factory()
+    writer = BatchWriter(path, schema, fmt, compression)
+    count = 0
+    try:
+        cursor = conn.execute(query)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            writer.write_batch(build_batch(rows, schema))
+            count += len(rows)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+    return count
+
+def read_table(path):
+    """Read a snapshot file back (Arrow IPC files are memory-mapped)"""
+    require_pyarrow()
+    if path.endswith('.parquet'):
+        return pq.read_table(path, memory_map=True)
+    with pa.memory_map(path, 'r') as source:
+        return pa.ipc.open_file(source).read_all()
+
+def print_sample_queries(out_dir, extension):
+    """Vectorized queries over the snapshot - no JSON decoding at read time"""
+    start = time.perf_counter()
+    analysis = read_table(os.path.join(out_dir, f"ai_analysis.{extension}"))
+    tests = read_table(os.path.join(out_dir, f"tests.{extension}"))
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    top_gaps = pc.value_counts(pc.list_flatten(analysis['skill_gaps']))
+    top_gaps = sorted(top_gaps.to_pylist(), key=lambda item: -item['counts'])[:3]
+    performance = pc.list_flatten(tests['skill_performance'])
+    weak = pc.sum(pc.equal(pc.struct_field(performance, 'level'), 'weak')).as_py() or 0
+    query_seconds = time.perf_counter() - start
+
+    print(f"\n🔎 Read back {analysis.num_rows + tests.num_rows} rows in {load_seconds:.3f}s, "
+          f"queried in {query_seconds:.3f}s")
+    print(f"   Average AI score: {pc.mean(analysis['ai_score']).as_py() or 0:.1f}")
+    print(f"   Most common skill gaps: " + ", ".join(f"{g['values']} ({g['counts']})" for g in top_gaps))
+    print(f"   Weak skill results: {weak} of {len(performance)}")
+
+def export_snapshot(db_path=DB_PATH, out_dir=OUTPUT_DIR, fmt='parquet', compression=None,
+                    chunk_size=CHUNK_SIZE):
+    """Export every dataset; returns {name: (path, rows)}"""
+    require_pyarrow()
+    os.makedirs(out_dir, exist_ok=True)
+    extension = 'parquet' if fmt == 'parquet' else 'arrow'
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    exported = {}
+    try:
+        for name in DATASETS:
+            path = os.path.join(out_dir, f"{name}.{extension}")
+            start = time.perf_counter()
+            rows = export_dataset(conn, name, path, fmt, compression, chunk_size)
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            exported[name] = (path, rows)
+            print(f"   ✅ {name}: {rows} rows → {path} "
+                  f"({rows / elapsed:,.0f} rows/sec, {os.path.getsize(path) / (1024 * 1024):.2f} MB)")
+    finally:
+        conn.close()
+    return exported
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Export ai_analysis and tests as a columnar snapshot")
+    parser.add_argument('--db', default=DB_PATH, help="SQLite database path")
+    parser.add_argument('--out', default=OUTPUT_DIR, help="Output directory")
+    parser.add_argument('--format', choices=['parquet', 'arrow'], default='parquet',
+                        help="parquet (compressed) or arrow (IPC file, memory-mappable)")
+    parser.add_argument('--compression', default=None,
+                        help="Codec (default: zstd for parquet, none for arrow so it can be memory-mapped)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Rows per record batch")
+    parser.add_argument('--no-check', action='store_true', help="Skip the read-back sample queries")
+    args = parser.parse_args(argv)
+    if args.compression is None and args.format == 'parquet':
+        args.compression = 'zstd'
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    require_pyarrow()
+
+    print(f"📦 Columnar snapshot: {args.db} → {args.out} ({args.format}, "
+          f"compression: {args.compression or 'none'})")
+    start = time.perf_counter()
+    export_snapshot(args.db, args.out, args.format, args.compression, args.chunk_size)
+    print(f"\n✅ Snapshot written in {time.perf_counter() - start:.2f}s")
+
+    if not args.no_check:
+        print_sample_queries(args.out, 'parquet' if args.format == 'parquet' else 'arrow')
+
+if __name__ == "__main__":
+    main()
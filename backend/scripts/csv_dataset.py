@@ -0,0 +1,275 @@
+"""
+CSV Dataset Export/Import
+- Same layout as backend/data/csv: 1_candidates.csv ... 6_decisions.csv
+- export streams each table to CSV in chunks (constant memory), optionally
+  gzip-compressed (.csv.gz), into ./csv_snapshot unless --dir is given; the
+  committed backend/data/csv files are only written when asked for explicitly
+- Switching an export directory between .csv and .csv.gz removes only files
+  an earlier export wrote there (recorded in .csv_export.json)
+- import bulk-loads those files back into SQLite with chunked executemany
+  inside one transaction per run, using the generator's bulk-load PRAGMAs
+- Columns are matched by header name, so files with fewer columns (like the
+  committed backend/data/csv exports) import too; missing columns get
+  their defaults. Empty cells are read as NULL, as in the committed files
+- Derived tables are rebuilt in the same transaction: the normalized skill
+  rows (skill_tables.py; all of them on replace) and the analytics
+  summaries (analytics_summary.py), so neither describes rows that are gone
+
+Usage:
+    python backend/scripts/csv_dataset.py export --dir snapshot/ --gzip
+    python backend/scripts/csv_dataset.py import --dir snapshot/ --db backend/database/recruitment.db
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.append(os.path.dirname(__file__))
+
+from generate_candidates_v2 import apply_load_pragmas, restore_pragmas
+import analytics_summary
+import skill_tables
+
+DB_PATH = os.path.join(os.path.dirname(__file__), '../database/recruitment.db')
+CSV_DIR = os.path.join(os.path.dirname(__file__), '../data/csv')
+EXPORT_DIR = 'csv_snapshot'
+# Files written by export, per directory; only these are ever removed
+EXPORT_MANIFEST = '.csv_export.json'
+
+CHUNK_SIZE = 10000
+
+# File name -> table, in foreign-key order (parents first)
+DATASET_FILES = [
+    ('1_candidates', 'candidates'),
+    ('2_job_roles', 'job_roles'),
+    ('3_applications', 'applications'),
+    ('4_ai_analysis', 'ai_analysis'),
+    ('5_tests', 'tests'),
+    ('6_decisions', 'decisions'),
+]
+
+# Column subsets and order of the committed backend/data/csv exports (--layout docs)
+DOCS_COLUMNS = {
+    'candidates': ['candidate_id', 'name', 'email', 'phone', 'resume_path', 'created_at'],
+    'job_roles': ['role_id', 'title', 'description', 'requirements', 'salary_min', 'salary_max',
+                  'status', 'recruiter_id', 'created_at'],
+    'applications': ['application_id', 'candidate_id', 'role_id', 'status', 'applied_at', 'updated_at'],
+    'ai_analysis': ['analysis_id', 'application_id', 'ai_score', 'skills_matched', 'skill_gaps',
+                    'experience_years', 'experience_level', 'education', 'certifications',
+                    'reasoning', 'analysis_completed_at'],
+    'tests': ['test_id', 'application_id', 'test_score', 'test_token', 'completed_at', 'answers',
+              'verification_details', 'started_at'],
+    'decisions': ['decision_id', 'application_id', 'composite_score', 'resume_weight',
+                  'test_weight', 'decided_by'],
+}
+
+def table_columns(conn, table):
+    return [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')]
+
+def open_text(path, mode, compressed=None):
+    """Open a .csv or .csv.gz file in text mode for the csv module"""
+    if compressed is None:
+        compressed = path.endswith('.gz')
+    if compressed:
+        return gzip.open(path, mode + 't', newline='', encoding='utf-8', compresslevel=6)
+    return open(path, mode, newline='', encoding='utf-8')
+
+def find_dataset_file(directory, name):
+    """Path of name.csv or name.csv.gz in directory (None when neither exists)"""
+    for suffix in ('.csv', '.csv.gz'):
+        path = os.path.join(directory, name + suffix)
+        if os.path.exists(path):
+            return path
+    return None
+
+def export_table(conn, table, path, columns, chunk_size=CHUNK_SIZE):
+    """Stream one table to CSV, chunk_size rows at a time; returns the row count"""
+    quoted = ', '.join(f'"{column}"' for column in columns)
+    cursor = conn.execute(f'SELECT {quoted} FROM "{table}" ORDER BY rowid')
+    count = 0
+    tmp_path = f"{path}.tmp"
+    with open_text(tmp_path, 'w', compressed=path.endswith('.gz')) as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            writer.writerows(rows)
+            count += len(rows)
+    os.replace(tmp_path, path)
+    return count
+
+def read_export_manifest(directory):
+    """File names an earlier export wrote into directory"""
+    try:
+        with open(os.path.join(directory, EXPORT_MANIFEST)) as f:
+            return set(json.load(f))
+    except (OSError, ValueError):
+        return set()
+
+def write_export_manifest(directory, names):
+    path = os.path.join(directory, EXPORT_MANIFEST)
+    with open(f"{path}.tmp", 'w') as f:
+        json.dump(sorted(names), f, indent=2)
+    os.replace(f"{path}.tmp", path)
+
+def export_dataset(db_path=DB_PATH, directory=EXPORT_DIR, use_gzip=False, layout='full',
+                   chunk_size=CHUNK_SIZE):
+    """Export every dataset table; returns {table: rows}"""
+    os.makedirs(directory, exist_ok=True)
+    written = read_export_manifest(directory)
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    exported = {}
+    try:
+        for name, table in DATASET_FILES:
+            columns = table_columns(conn, table)
+            if layout == 'docs':
+                columns = [column for column in DOCS_COLUMNS[table] if column in columns]
+            path = os.path.join(directory, name + ('.csv.gz' if use_gzip else '.csv'))
+            # A stale file in the other format is removed only if an export wrote it
+            other = name + ('.csv' if use_gzip else '.csv.gz')
+            if os.path.exists(os.path.join(directory, other)):
+                if other in written:
+                    os.remove(os.path.join(directory, other))
+                    written.discard(other)
+                else:
+                    print(f"   ⚠️  Keeping {other}, not written by an export (import reads .csv first)")
+
+            start = time.perf_counter()
+            exported[table] = export_table(conn, table, path, columns, chunk_size)
+            written.add(os.path.basename(path))
+            write_export_manifest(directory, written)
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            print(f"   ✅ {table}: {exported[table]} rows → {os.path.basename(path)} "
+                  f"({exported[table] / elapsed:,.0f} rows/sec, {os.path.getsize(path) / (1024 * 1024):.2f} MB)")
+    finally:
+        conn.close()
+    return exported
+
+def iter_csv_rows(reader, width):
+    """CSV records as insert tuples; empty cells become NULL"""
+    for record in reader:
+        if len(record) != width:
+            raise ValueError(f"line {reader.line_num}: expected {width} fields, got {len(record)}")
+        yield tuple(value if value != '' else None for value in record)
+
+def import_table(cursor, table, path, table_cols, chunk_size=CHUNK_SIZE):
+    """Load one CSV into table with chunked executemany; returns the row count"""
+    with open_text(path, 'r') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return 0
+        unknown = [column for column in header if column not in table_cols]
+        if unknown:
+            raise ValueError(f"{os.path.basename(path)}: columns not in {table}: {', '.join(unknown)}")
+
+        quoted = ', '.join(f'"{column}"' for column in header)
+        placeholders = ', '.join('?' * len(header))
+        sql = f'INSERT INTO "{table}" ({quoted}) VALUES ({placeholders})'
+
+        count = 0
+        rows = iter_csv_rows(reader, len(header))
+        while True:
+            chunk = [row for _, row in zip(range(chunk_size), rows)]
+            if not chunk:
+                break
+            cursor.executemany(sql, chunk)
+            count += len(chunk)
+    return count
+
+def import_dataset(db_path=DB_PATH, directory=CSV_DIR, replace=True, chunk_size=CHUNK_SIZE):
+    """
+    Import every dataset file found in directory in one transaction
+    replace=True empties the imported tables first (children before parents)
+    The normalized skill rows and analytics summaries are rebuilt before COMMIT
+    Returns {table: rows}
+    """
+    files = [(table, find_dataset_file(directory, name)) for name, table in DATASET_FILES]
+    files = [(table, path) for table, path in files if path]
+    if not files:
+        raise FileNotFoundError(f"No dataset CSV files in {directory}")
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    cursor = conn.cursor()
+    previous_pragmas = apply_load_pragmas(conn)
+    imported = {}
+    start_time = time.perf_counter()
+    try:
+        cursor.execute("BEGIN")
+        if replace:
+            for table, _ in reversed(files):
+                cursor.execute(f'DELETE FROM "{table}"')
+            print(f"   🗑️  Cleared {len(files)} tables")
+
+        for table, path in files:
+            start = time.perf_counter()
+            imported[table] = import_table(cursor, table, path, table_columns(conn, table), chunk_size)
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            print(f"   ✅ {table}: {imported[table]} rows ← {os.path.basename(path)} "
+                  f"({imported[table] / elapsed:,.0f} rows/sec)")
+
+        normalized = skill_tables.backfill_in_transaction(cursor, full=replace)
+        print(f"   ✅ Normalized skills: {normalized['application_skills']} skill rows, "
+              f"{normalized['application_certifications']} certifications "
+              f"for {normalized['applications']} applications")
+        # Imported ids can sit below the summaries' watermark, so always recompute
+        summarized, _ = analytics_summary.refresh_summaries(cursor, full=True)
+        print(f"   📊 Analytics summaries rebuilt ({summarized} applications)")
+        cursor.execute("COMMIT")
+    except Exception as e:
+        print(f"\n❌ Import failed, rolled back: {e}")
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
+        raise
+    finally:
+        restore_pragmas(conn, previous_pragmas)
+        conn.close()
+
+    elapsed = time.perf_counter() - start_time
+    total_rows = sum(imported.values())
+    print(f"   ⏱️  {total_rows} rows in {elapsed:.2f}s ({total_rows / max(elapsed, 1e-9):,.0f} rows/sec)")
+    return imported
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Export/import the recruitment dataset as CSV")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    export = commands.add_parser('export', help="Stream tables to 1_candidates.csv ... 6_decisions.csv")
+    export.add_argument('--db', default=DB_PATH, help="SQLite database path")
+    export.add_argument('--dir', default=EXPORT_DIR, help=f"Output directory (default: ./{EXPORT_DIR})")
+    export.add_argument('--gzip', action='store_true', help="Write .csv.gz files")
+    export.add_argument('--layout', choices=['full', 'docs'], default='full',
+                        help="full: every column; docs: the column subset of the committed CSVs")
+    export.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Rows fetched per chunk")
+
+    load = commands.add_parser('import', help="Bulk-load the CSV files into SQLite")
+    load.add_argument('--db', default=DB_PATH, help="SQLite database path")
+    load.add_argument('--dir', default=CSV_DIR, help="Input directory (default: backend/data/csv)")
+    load.add_argument('--append', action='store_true',
+                      help="Keep existing rows (default: replace the imported tables)")
+    load.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Rows per executemany")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.command == 'export':
+        print(f"📤 Exporting {args.db} → {args.dir} ({args.layout} layout{', gzip' if args.gzip else ''})")
+        start = time.perf_counter()
+        exported = export_dataset(args.db, args.dir, args.gzip, args.layout, args.chunk_size)
+        print(f"\n✅ Exported {sum(exported.values())} rows in {time.perf_counter() - start:.2f}s")
+    else:
+        print(f"📥 Importing {args.dir} → {args.db} ({'append' if args.append else 'replace'})")
+        imported = import_dataset(args.db, args.dir, not args.append, args.chunk_size)
+        print(f"\n✅ Imported {sum(imported.values())} rows")
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,45 @@
 """
 Generate Realistic Candidate Data for Cybersecurity ATS
-- Uses 20 job roles from jobRoles.js with proper skill matching
+- Uses the 20 job roles from the shared role catalog (scoring.py) with proper skill matching
 - Generates 1000+ candidates following natural application flow
 - Realistic dates: job posted → application → test (same day)
 - AI scores calculated using job-specific weights
 - Test scores only for eligible candidates (AI score >= threshold)
-- Skill performance tracking (strong/moderate/weak)
+- Test answers simulated on the real question bank, graded like the submit endpoint
 - Updated: November 2024
 """
 
+import argparse
+import collections
 import json
+import multiprocessing
 import random
 import sqlite3
+import time
 from datetime import datetime, timedelta
 import os
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+
+# Scoring lives in scoring.py; re-exported here for existing importers
+from scoring import (
+    calculate_ai_score,
+    calculate_composite_score,
+    calculate_experience_match,
+    check_education_match,
+    estimate_task_capability,
+    load_role_catalog,
+)
+import analytics_summary
+import checkpoint
+import identity
+import instrumentation
+import live_writer
+import profiles
+import skill_tables
+import test_simulation
+import traffic
 
 # Professional names for realistic candidates
 FIRST_NAMES = [
@@ -36,50 +62,29 @@ LAST_NAMES = [
 
 EMAIL_DOMAINS = ["gmail.com", "outlook.com", "yahoo.com", "protonmail.com", "icloud.com", "hotmail.com"]
 
-def generate_realistic_name():
+def generate_realistic_name(rng=random):
     """Generate a realistic professional name"""
-    return f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
 
-def generate_realistic_email(name, used_emails=None):
-    """Generate a realistic professional email (guaranteed unique)"""
-    if used_emails is None:
-        used_emails = set()
-    
+def generate_realistic_email(name, rng=random):
+    """
+    Generate a realistic professional base email (e.g. sarah.johnson@gmail.com)
+    Made unique by identity.IdentityAllocator, which numbers repeated bases
+    """
     first, last = name.lower().split()
-    domain = random.choice(EMAIL_DOMAINS)
-    
-    # Try different formats until we find a unique one
-    attempts = 0
-    while attempts < 100:
-        if attempts < 20:
-            # First 20 attempts: try standard formats
-            formats = [
-                f"{first}.{last}@{domain}",
-                f"{first}{last}@{domain}",
-                f"{first[0]}{last}@{domain}",
-            ]
-            email = random.choice(formats)
-        else:
-            # After 20 attempts: add numbers
-            email = f"{first}.{last}{random.randint(1,9999)}@{domain}"
-        
-        if email not in used_emails:
-            used_emails.add(email)
-            return email
-        
-        attempts += 1
-    
-    # Fallback: use timestamp
-    import time
-    email = f"{first}.{last}.{int(time.time())}@{domain}"
-    used_emails.add(email)
-    return email
+    domain = rng.choice(EMAIL_DOMAINS)
+    formats = [
+        f"{first}.{last}@{domain}",
+        f"{first}{last}@{domain}",
+        f"{first[0]}{last}@{domain}",
+    ]
+    return rng.choice(formats)
 
-def generate_realistic_phone():
+def generate_realistic_phone(rng=random):
     """Generate a realistic US phone number"""
-    area_code = random.randint(200, 999)
-    exchange = random.randint(200, 999)
-    number = random.randint(1000, 9999)
+    area_code = rng.randint(200, 999)
+    exchange = rng.randint(200, 999)
+    number = rng.randint(1000, 9999)
     return f"+1-{area_code}-{exchange}-{number}"
 
 def get_experience_level(years):
@@ -91,51 +96,53 @@ def get_experience_level(years):
     else:
         return 'senior'
 
-def generate_job_posted_date():
+def generate_job_posted_date(rng=random, now=None, days_ago_range=(30, 60)):
     """
-    Generate realistic job posted date (30-60 days ago)
+    Generate realistic job posted date (30-60 days ago by default)
     Mix of older and newer postings
     """
-    days_ago = random.randint(30, 60)
-    posted_date = datetime.now() - timedelta(days=days_ago)
+    now = now or datetime.now()
+    days_ago = rng.randint(*days_ago_range)
+    posted_date = now - timedelta(days=days_ago)
     return posted_date
 
-def generate_application_date(job_posted_date):
+def generate_application_date(job_posted_date, rng=random, now=None):
     """
     Generate application date after job posting
     Distribution: 40% week 1, 30% week 2-3, 30% week 4+
     """
-    days_since_posted = (datetime.now() - job_posted_date).days
+    now = now or datetime.now()
+    days_since_posted = (now - job_posted_date).days
     
     # Determine which period this application falls into
-    rand = random.random()
+    rand = rng.random()
     
     if rand < 0.40:  # 40% in first week
-        days_after = random.randint(1, min(7, days_since_posted))
+        days_after = rng.randint(1, min(7, days_since_posted))
     elif rand < 0.70:  # 30% in middle period
-        days_after = random.randint(8, min(21, days_since_posted))
+        days_after = rng.randint(8, min(21, days_since_posted))
     else:  # 30% in recent period
-        days_after = random.randint(max(22, days_since_posted - 7), days_since_posted)
+        days_after = rng.randint(max(22, days_since_posted - 7), days_since_posted)
     
     application_date = job_posted_date + timedelta(days=days_after)
     
     # Add random time during business hours (8 AM - 6 PM)
-    hour = random.randint(8, 18)
-    minute = random.randint(0, 59)
+    hour = rng.randint(8, 18)
+    minute = rng.randint(0, 59)
     application_date = application_date.replace(hour=hour, minute=minute, second=0)
     
     return application_date
 
-def generate_test_completion_date(application_date):
+def generate_test_completion_date(application_date, rng=random):
     """
     Generate test completion date (same day as application, few hours later)
     """
     # Test completed 2-6 hours after application
-    hours_later = random.randint(2, 6)
+    hours_later = rng.randint(2, 6)
     test_date = application_date + timedelta(hours=hours_later)
     return test_date
 
-def generate_skills_for_candidate(job_role, experience_years, quality_tier):
+def generate_skills_for_candidate(job_role, experience_years, quality_tier, rng=random):
     """
     Generate realistic skills based on job requirements and candidate quality
     
@@ -149,20 +156,20 @@ def generate_skills_for_candidate(job_role, experience_years, quality_tier):
     
     # Determine skill match percentage based on quality tier
     if quality_tier == 'excellent':
-        match_percentage = random.uniform(0.80, 0.90)
+        match_percentage = rng.uniform(0.80, 0.90)
     elif quality_tier == 'good':
-        match_percentage = random.uniform(0.65, 0.75)
+        match_percentage = rng.uniform(0.65, 0.75)
     elif quality_tier == 'average':
-        match_percentage = random.uniform(0.55, 0.65)
+        match_percentage = rng.uniform(0.55, 0.65)
     else:  # poor
-        match_percentage = random.uniform(0.40, 0.55)
+        match_percentage = rng.uniform(0.40, 0.55)
     
     # Calculate how many required skills to include
     num_required_skills = int(len(required_skills) * match_percentage)
     num_required_skills = max(1, num_required_skills)  # At least 1 skill
     
     # Select random required skills
-    candidate_skills = random.sample(required_skills, num_required_skills)
+    candidate_skills = rng.sample(required_skills, num_required_skills)
     
     # Add some additional related skills (1-3 skills)
     additional_skills = [
@@ -171,14 +178,14 @@ def generate_skills_for_candidate(job_role, experience_years, quality_tier):
         'TCP/IP', 'Wireshark', 'Nmap', 'Burp Suite'
     ]
     
-    num_additional = random.randint(1, 3)
-    for skill in random.sample(additional_skills, num_additional):
+    num_additional = rng.randint(1, 3)
+    for skill in rng.sample(additional_skills, num_additional):
         if skill not in candidate_skills:
             candidate_skills.append(skill)
     
     return candidate_skills
 
-def generate_certifications_for_candidate(job_role, experience_years, quality_tier):
+def generate_certifications_for_candidate(job_role, experience_years, quality_tier, rng=random):
     """
     Generate realistic certifications based on job requirements and quality
     """
@@ -189,13 +196,13 @@ def generate_certifications_for_candidate(job_role, experience_years, quality_ti
     
     # Determine cert match based on quality tier
     if quality_tier == 'excellent':
-        match_percentage = random.uniform(0.40, 0.60)
+        match_percentage = rng.uniform(0.40, 0.60)
     elif quality_tier == 'good':
-        match_percentage = random.uniform(0.20, 0.40)
+        match_percentage = rng.uniform(0.20, 0.40)
     elif quality_tier == 'average':
-        match_percentage = random.uniform(0.10, 0.25)
+        match_percentage = rng.uniform(0.10, 0.25)
     else:  # poor
-        match_percentage = random.uniform(0.0, 0.15)
+        match_percentage = rng.uniform(0.0, 0.15)
     
     num_certs = int(len(required_certs) * match_percentage)
     num_certs = max(0, min(num_certs, len(required_certs)))
@@ -203,451 +210,26 @@ def generate_certifications_for_candidate(job_role, experience_years, quality_ti
     if num_certs == 0:
         return []
     
-    return random.sample(required_certs, num_certs)
-
-def check_education_match(candidate_education, job_education):
-    """Check if candidate education matches job requirement"""
-    # Simple matching - in production, use more sophisticated logic
-    candidate_lower = candidate_education.lower()
-    job_lower = job_education.lower()
-    
-    # Check for degree level match
-    if "bachelor" in job_lower and "bachelor" in candidate_lower:
-        return True
-    if "master" in job_lower and "master" in candidate_lower:
-        return True
-    if "associate" in job_lower and ("associate" in candidate_lower or "bachelor" in candidate_lower):
-        return True
-    
-    # Check for field match
-    fields = ["cybersecurity", "computer science", "information", "technology", "security"]
-    for field in fields:
-        if field in job_lower and field in candidate_lower:
-            return True
-    
-    return False
-
-def calculate_experience_match(candidate_years, job_range):
-    """Calculate how well candidate experience matches job requirements"""
-    min_years = job_range['min']
-    max_years = job_range['max']
-    
-    if min_years <= candidate_years <= max_years:
-        return 1.0  # Perfect match
-    elif candidate_years < min_years:
-        # Under-qualified
-        diff = min_years - candidate_years
-        return max(0.5, 1.0 - (diff * 0.15))
-    else:
-        # Over-qualified (not as bad as under-qualified)
-        diff = candidate_years - max_years
-        return max(0.7, 1.0 - (diff * 0.10))
-
-def estimate_task_capability(matched_skills, required_skills, experience_match, cert_match):
-    """
-    Estimate candidate's ability to perform job tasks
-    Based on: skills (50%), experience (30%), certifications (20%)
-    """
-    skill_factor = len(matched_skills) / max(len(required_skills), 1)
-    
-    task_capability = (
-        skill_factor * 0.5 +
-        experience_match * 0.3 +
-        cert_match * 0.2
-    )
-    
-    return task_capability
-
-def calculate_ai_score(candidate, job_role):
-    """
-    Calculate AI score using job-specific weights
-    Matches the exact logic from jobRoles.js
-    """
-    weights = job_role['weights']
-    required_skills = job_role['skillKeywords']
-    required_certs = job_role.get('certifications', [])
-    
-    # 1. Skills match (using job's skills weight)
-    matched_skills = [s for s in candidate['skills'] if s in required_skills]
-    skill_match = len(matched_skills) / max(len(required_skills), 1)
-    skill_score = skill_match * 100 * weights['skills']
-    
-    # 2. Experience/Knowledge match (using job's knowledge weight)
-    exp_match = calculate_experience_match(candidate['experience_years'], job_role['experienceRange'])
-    knowledge_score = exp_match * 100 * weights['knowledge']
-    
-    # 3. Tasks capability (using job's tasks weight)
-    cert_match = len(candidate['certifications']) / max(len(required_certs), 1) if required_certs else 0.5
-    task_capability = estimate_task_capability(matched_skills, required_skills, exp_match, cert_match)
-    task_score = task_capability * 100 * weights['tasks']
-    
-    # 4. Certifications match (using job's certifications weight)
-    cert_score = cert_match * 100 * weights['certifications']
-    
-    # 5. Education match (using job's education weight)
-    edu_match = 1.0 if check_education_match(candidate['education'], job_role['education']) else 0.5
-    edu_score = edu_match * 100 * weights['education']
-    
-    # Total AI score
-    ai_score = skill_score + knowledge_score + task_score + cert_score + edu_score
-    
-    # Store matched skills for later use
-    candidate['matched_skills'] = matched_skills
-    candidate['missing_skills'] = [s for s in required_skills if s not in matched_skills]
-    
-    return round(ai_score, 1)
+    return rng.sample(required_certs, num_certs)
 
-def generate_test_score_and_performance(candidate, job_role):
+def generate_test_score_and_performance(candidate, job_role, rng=random):
     """
-    Generate realistic test score and skill performance
+    Simulate the candidate taking the role's skill test
+    Answers real questions from the question bank (see test_simulation.py)
+    and grades them as the submit endpoint does
+    Returns (test score, skill performance, answers)
     Only called for eligible candidates
     """
-    # Base test score correlates somewhat with AI score but has variation
-    ai_score = candidate['ai_score']
-    
-    # Add randomness: ±15 points from AI score
-    variation = random.uniform(-15, 15)
-    test_score = ai_score + variation
-    
-    # Clamp to realistic range (40-95)
-    test_score = max(40, min(95, test_score))
-    
-    # Generate skill performance breakdown
-    skill_performance = {}
-    matched_skills = candidate['matched_skills']
-    
-    for skill in matched_skills:
-        # Skills candidate has: 50-100% correct
-        correct_rate = random.uniform(0.50, 1.0)
-        
-        # Adjust based on test score
-        if test_score >= 80:
-            correct_rate = random.uniform(0.70, 1.0)
-        elif test_score >= 65:
-            correct_rate = random.uniform(0.50, 0.85)
-        else:
-            correct_rate = random.uniform(0.40, 0.70)
-        
-        # Assume 2 questions per skill
-        total_questions = 2
-        correct_questions = int(total_questions * correct_rate)
-        percentage = int((correct_questions / total_questions) * 100)
-        
-        # Determine level
-        if percentage >= 80:
-            level = 'strong'
-        elif percentage >= 50:
-            level = 'moderate'
-        else:
-            level = 'weak'
-        
-        skill_performance[skill] = {
-            'correct': correct_questions,
-            'total': total_questions,
-            'percentage': percentage,
-            'level': level
-        }
-    
-    # Add some skills candidate doesn't have (they'll perform poorly)
-    missing_skills = candidate['missing_skills']
-    for skill in random.sample(missing_skills, min(2, len(missing_skills))):
-        skill_performance[skill] = {
-            'correct': 0,
-            'total': 2,
-            'percentage': 0,
-            'level': 'weak'
-        }
-    
-    return round(test_score, 1), skill_performance
-
-def calculate_composite_score(ai_score, test_score, experience_level):
-    """
-    Calculate composite score with experience-based weighting
-    """
-    weights = {
-        'entry': {'ai': 0.4, 'test': 0.6},   # Test matters more for juniors
-        'mid': {'ai': 0.5, 'test': 0.5},     # Balanced
-        'senior': {'ai': 0.6, 'test': 0.4}   # Experience matters more
-    }
-    
-    w = weights.get(experience_level, weights['mid'])
-    composite = (ai_score * w['ai']) + (test_score * w['test'])
-    
-    return round(composite, 1)
-
+    return test_simulation.simulate_test(candidate, job_role, rng)
 
 def get_job_roles():
     """
-    Return the 20 cybersecurity job roles matching jobRoles.js
+    Return the 20 cybersecurity job roles from the shared role catalog
+    (backend/data/csv/8_job_roles_detailed.csv, compiled once - see scoring.py)
     Each role includes: id, title, skillKeywords, certifications, education,
     experienceRange, weights, thresholdScore, testCategory
     """
-    return [
-        {
-            'id': '1',
-            'title': 'Incident Response Analyst',
-            'skillKeywords': ['Incident Response', 'Digital evidence collection', 'forensic processing', 
-                            'malware analysis', 'network traffic analysis', 'log analysis', 
-                            'vulnerability triage', 'threat containment', 'alert triage', 'IOC detection'],
-            'certifications': ['CompTIA Security+', 'EC-Council Certified Incident Handler (ECIH)', 
-                             'GIAC Certified Incident Handler (GCIH)', 'CompTIA CySA+', 
-                             'GIAC Forensic Analyst (GCFA)'],
-            'education': "Bachelor's degree in Cybersecurity, Computer Science, Information Security",
-            'experienceRange': {'min': 2, 'max': 5},
-            'weights': {'skills': 0.35, 'knowledge': 0.25, 'tasks': 0.20, 'certifications': 0.10, 'education': 0.10},
-            'thresholdScore': 60,
-            'testCategory': 'incident_response'
-        },
-        {
-            'id': '2',
-            'title': 'Threat Analysis Analyst',
-            'skillKeywords': ['Threat analysis', 'Threat hunting', 'Network threat identification',
-                            'Data querying', 'Metadata analysis', 'Virtual machine operations',
-                            'Security reporting', 'Threat intelligence', 'Data collection'],
-            'certifications': ['CompTIA Security+', 'EC-Council Certified Threat Intelligence Analyst (CTIA)',
-                             'GIAC Cyber Threat Intelligence (GCTI)', 'CompTIA CySA+'],
-            'education': "Bachelor's degree in Cybersecurity, Information Technology, Computer Science",
-            'experienceRange': {'min': 1, 'max': 3},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'threat_analysis'
-        },
-        {
-            'id': '3',
-            'title': 'Defensive Cybersecurity Analyst',
-            'skillKeywords': ['Network defense', 'Threat detection', 'Traffic analysis', 'Log analysis',
-                            'Vulnerability identification', 'Security monitoring', 'Anomaly detection',
-                            'Security tool evaluation'],
-            'certifications': ['CompTIA Security+', 'CompTIA CySA+', 'EC-Council Certified SOC Analyst (CSA)',
-                             'GIAC Certified Defense Analyst (GCDA)'],
-            'education': "Bachelor's degree in Cybersecurity, Information Technology, Computer Science",
-            'experienceRange': {'min': 1, 'max': 3},
-            'weights': {'skills': 0.45, 'knowledge': 0.30, 'tasks': 0.15, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'defensive_cybersecurity'
-        },
-        {
-            'id': '4',
-            'title': 'Digital Forensics Investigator',
-            'skillKeywords': ['Digital Evidence Handling', 'Evidence Collection', 'Evidence Processing',
-                            'Memory Forensics', 'File System Forensics', 'Log Analysis',
-                            'Forensic Analysis', 'Technical Reporting'],
-            'certifications': ['GIAC Certified Forensic Analyst (GCFA)', 'GIAC Certified Forensic Examiner (GCFE)',
-                             'Certified Forensic Computer Examiner (CFCE)', 'CompTIA CySA+',
-                             'EnCase Certified Examiner (EnCE)'],
-            'education': "Bachelor's degree in Cybersecurity, Digital Forensics, IT, Computer Science",
-            'experienceRange': {'min': 3, 'max': 7},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 65,
-            'testCategory': 'digital_forensics'
-        },
-        {
-            'id': '5',
-            'title': 'Insider Threat Analyst',
-            'skillKeywords': ['threat analysis', 'behavioral analysis', 'data analysis', 'log analysis',
-                            'pattern detection', 'report writing', 'insider threat investigation'],
-            'certifications': ['CompTIA Security+', 'EC-Council Certified Threat Intelligence Analyst (CTIA)',
-                             'GIAC Cyber Threat Intelligence (GCTI)', 'CompTIA CySA+'],
-            'education': "Bachelor's in Cybersecurity, Computer Science, Information Systems, Psychology",
-            'experienceRange': {'min': 1, 'max': 4},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'insider_threat'
-        },
-        {
-            'id': '6',
-            'title': 'Vulnerability Analyst',
-            'skillKeywords': ['vulnerability scanning', 'risk assessment', 'network analysis',
-                            'application security', 'threat identification', 'security auditing',
-                            'policy compliance'],
-            'certifications': ['CompTIA Security+', 'CompTIA CySA+', 'EC-Council CEH (Certified Ethical Hacker)',
-                             'CompTIA PenTest+'],
-            'education': "Bachelor's degree in Cybersecurity, Computer Science, Information Technology",
-            'experienceRange': {'min': 2, 'max': 5},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'vulnerability_analysis'
-        },
-        {
-            'id': '7',
-            'title': 'Cybersecurity Policy & Planning Analyst',
-            'skillKeywords': ['cybersecurity policy', 'governance', 'risk management', 'compliance',
-                            'strategic planning', 'policy development', 'regulatory alignment'],
-            'certifications': ['ISACA CISM', 'ISC2 CGRC', 'ISO 27001 Lead Implementer or Lead Auditor',
-                             'IAPP CIPM', 'Associate of ISC2'],
-            'education': "Bachelor's degree in Information Security, IT Management, Business Administration",
-            'experienceRange': {'min': 2, 'max': 5},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'policy_and_governance'
-        },
-        {
-            'id': '8',
-            'title': 'Privacy Governance Analyst',
-            'skillKeywords': ['privacy compliance', 'privacy impact assessment', 'data governance',
-                            'regulatory compliance', 'privacy policies', 'PII protection',
-                            'privacy risk assessment'],
-            'certifications': ['IAPP CIPM (Certified Information Privacy Manager)', 'IAPP CIPP/US or CIPP/E',
-                             'ISO 27701 Lead Implementer', 'CompTIA Security+'],
-            'education': "Bachelor's degree in Information Security, Privacy Management, Law",
-            'experienceRange': {'min': 2, 'max': 5},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'privacy_compliance'
-        },
-        {
-            'id': '9',
-            'title': 'Junior Security Control Assessor',
-            'skillKeywords': ['security controls', 'RMF', 'control assessment', 'risk analysis',
-                            'evidence collection', 'security authorization', 'compliance review'],
-            'certifications': ['CompTIA Security+', 'ISC2 Associate', 'ISO 27001 Foundation', 'CompTIA CySA+'],
-            'education': "Associate's or Bachelor's degree in Cybersecurity, Information Systems",
-            'experienceRange': {'min': 0, 'max': 2},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'security_control_assessment'
-        },
-        {
-            'id': '10',
-            'title': 'Cybersecurity Architect',
-            'skillKeywords': ['security architecture', 'secure design', 'risk management', 'defense in depth',
-                            'network segmentation', 'system security engineering', 'architecture analysis'],
-            'certifications': ['ISC2 CISSP', 'ISACA CISM', 'Cisco CCNP Security or CCSP',
-                             'AWS Solutions Architect – Security Specialty', 'SABSA Foundation'],
-            'education': "Bachelor's degree in Cybersecurity, Computer Science, Information Technology",
-            'experienceRange': {'min': 3, 'max': 6},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'cybersecurity_architecture'
-        },
-        {
-            'id': '11',
-            'title': 'Secure Software Engineer',
-            'skillKeywords': ['secure coding', 'software security', 'input validation', 'error handling',
-                            'static code analysis', 'threat modeling', 'secure SDLC'],
-            'certifications': ['GIAC GSSP', 'CSSLP', 'CompTIA PenTest+', 'AWS or Microsoft Developer Certification'],
-            'education': "Bachelor's in Computer Science, Software Engineering, Cybersecurity",
-            'experienceRange': {'min': 2, 'max': 5},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'secure_software_development'
-        },
-        {
-            'id': '12',
-            'title': 'Secure Systems Engineer',
-            'skillKeywords': ['secure system design', 'system hardening', 'risk analysis',
-                            'vulnerability identification', 'secure configuration', 'system security testing',
-                            'secure SDLC'],
-            'certifications': ['CompTIA Security+', 'CompTIA CySA+', 'GIAC GSEC',
-                             'Microsoft or Linux systems engineering certifications'],
-            'education': "Bachelor's degree in Information Technology, Cybersecurity, Systems Engineering",
-            'experienceRange': {'min': 2, 'max': 5},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'secure_systems_development'
-        },
-        {
-            'id': '13',
-            'title': 'Software Security Analyst',
-            'skillKeywords': ['application security', 'secure code review', 'static analysis', 'threat modeling',
-                            'vulnerability analysis', 'secure SDLC', 'software risk assessment'],
-            'certifications': ['GIAC GWAPT or GSSP', 'CompTIA PenTest+', 'CSSLP',
-                             'Vendor secure development certifications'],
-            'education': "Bachelor's in Computer Science, Software Engineering, Cybersecurity",
-            'experienceRange': {'min': 1, 'max': 4},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'software_security_assessment'
-        },
-        {
-            'id': '14',
-            'title': 'Systems Security Analyst',
-            'skillKeywords': ['system hardening', 'vulnerability management', 'security monitoring',
-                            'configuration management', 'access control', 'risk mitigation'],
-            'certifications': ['CompTIA Security+', 'CompTIA CySA+', 'GIAC GSEC'],
-            'education': "Bachelor's degree in Cybersecurity, IT, Computer Science",
-            'experienceRange': {'min': 1, 'max': 3},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'systems_security_analysis'
-        },
-        {
-            'id': '15',
-            'title': 'Network Operations Analyst',
-            'skillKeywords': ['network monitoring', 'routing', 'switching', 'network security', 'firewalls',
-                            'vulnerability patching', 'troubleshooting'],
-            'certifications': ['CompTIA Network+', 'Cisco CCNA', 'CompTIA Security+'],
-            'education': "Associate's or Bachelor's degree in Information Technology, Networking, Cybersecurity",
-            'experienceRange': {'min': 1, 'max': 3},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'network_operations'
-        },
-        {
-            'id': '16',
-            'title': 'Database Security Analyst',
-            'skillKeywords': ['database administration', 'SQL', 'backup and recovery', 'performance tuning',
-                            'data integrity', 'db security', 'database monitoring'],
-            'certifications': ['Microsoft SQL Server (MCSA)', 'Oracle Database Associate', 'CompTIA Data+',
-                             'AWS/Azure database specialty certifications'],
-            'education': "Bachelor's degree in Computer Science, Information Systems, IT",
-            'experienceRange': {'min': 1, 'max': 3},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'database_administration'
-        },
-        {
-            'id': '17',
-            'title': 'Cybersecurity Systems Administrator',
-            'skillKeywords': ['system hardening', 'patch management', 'user access management',
-                            'server configuration', 'backup and recovery', 'os administration',
-                            'security monitoring'],
-            'certifications': ['CompTIA Security+', 'CompTIA Linux+ or Server+',
-                             'Microsoft or Linux system administration certifications'],
-            'education': "Associate's or Bachelor's in Information Technology, Cybersecurity, Computer Science",
-            'experienceRange': {'min': 1, 'max': 3},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'systems_administration'
-        },
-        {
-            'id': '18',
-            'title': 'Cybersecurity Data Analyst',
-            'skillKeywords': ['data analysis', 'anomaly detection', 'metric development', 'threat analytics',
-                            'data quality validation', 'statistical analysis', 'cybersecurity insights'],
-            'certifications': ['CompTIA Data+', 'Google/AWS/Azure Data Analytics certifications',
-                             'ISC2 CC or Security+'],
-            'education': "Bachelor's degree in Data Science, Cybersecurity, Computer Science, Information Systems",
-            'experienceRange': {'min': 1, 'max': 3},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'cyber_data_analysis'
-        },
-        {
-            'id': '19',
-            'title': 'Cybercrime Investigator',
-            'skillKeywords': ['digital evidence', 'log analysis', 'forensics', 'chain of custody',
-                            'threat analysis', 'intrusion investigation', 'artifact examination'],
-            'certifications': ['CompTIA CySA+', 'CompTIA Security+', 'EC-Council CHFI', 'GIAC GCIH or GCFA'],
-            'education': "Bachelor's degree in Cybersecurity, Digital Forensics, Computer Science, Criminal Justice",
-            'experienceRange': {'min': 1, 'max': 3},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'cybercrime_investigation'
-        },
-        {
-            'id': '20',
-            'title': 'Digital Evidence Analyst',
-            'skillKeywords': ['digital forensics', 'evidence preservation', 'drive imaging', 'file system analysis',
-                            'memory analysis', 'artifact analysis', 'chain of custody', 'log analysis'],
-            'certifications': ['CompTIA Security+', 'CompTIA CySA+', 'CHFI', 'GIAC GCFA or GCIH'],
-            'education': "Associate's or Bachelor's degree in Digital Forensics, Cybersecurity, Information Technology",
-            'experienceRange': {'min': 1, 'max': 3},
-            'weights': {'skills': 0.40, 'knowledge': 0.30, 'tasks': 0.20, 'certifications': 0.05, 'education': 0.05},
-            'thresholdScore': 60,
-            'testCategory': 'digital_evidence_analysis'
-        }
-    ]
+    return load_role_catalog()
 
 def get_candidate_distribution():
     """
@@ -682,30 +264,35 @@ def get_candidate_distribution():
     }
 
 
-def generate_candidate_for_job(job_role, job_posted_date, quality_tier, used_emails=None):
+def generate_candidate_for_job(job_role, job_posted_date, quality_tier, identities=None, rng=random, now=None,
+                               applied_at=None):
     """
     Generate a single realistic candidate for a job role
     Follows natural flow: job posted → application → AI analysis → test (if eligible)
+    identities (an identity.IdentityAllocator) assigns the unique email and
+    phone; without one the candidate keeps its base email and a random
+    phone, and the caller allocates them (see iter_candidates)
+    applied_at fixes the application time (time-series mode) instead of
+    drawing it relative to the posting date
     """
-    if used_emails is None:
-        used_emails = set()
-    
     # Generate basic info
-    name = generate_realistic_name()
-    email = generate_realistic_email(name, used_emails)
-    phone = generate_realistic_phone()
+    name = generate_realistic_name(rng)
+    email = generate_realistic_email(name, rng)
+    phone = generate_realistic_phone(rng)
+    if identities is not None:
+        email, phone = identities.allocate(email)
     
     # Generate experience within or near job range
     exp_range = job_role['experienceRange']
     if quality_tier in ['excellent', 'good']:
         # Good candidates have appropriate experience
-        experience_years = random.randint(exp_range['min'], exp_range['max'])
+        experience_years = rng.randint(exp_range['min'], exp_range['max'])
     else:
         # Average/poor candidates might be under/over qualified
-        if random.random() < 0.5:
-            experience_years = random.randint(max(0, exp_range['min'] - 2), exp_range['min'])
+        if rng.random() < 0.5:
+            experience_years = rng.randint(max(0, exp_range['min'] - 2), exp_range['min'])
         else:
-            experience_years = random.randint(exp_range['min'], exp_range['max'] + 2)
+            experience_years = rng.randint(exp_range['min'], exp_range['max'] + 2)
     
     experience_level = get_experience_level(experience_years)
     
@@ -718,11 +305,11 @@ def generate_candidate_for_job(job_role, job_posted_date, quality_tier, used_ema
         "Master's degree in Information Security",
         "Associate's degree in Cybersecurity"
     ]
-    education = random.choice(education_options)
+    education = rng.choice(education_options)
     
     # Generate skills and certifications based on quality tier
-    skills = generate_skills_for_candidate(job_role, experience_years, quality_tier)
-    certifications = generate_certifications_for_candidate(job_role, experience_years, quality_tier)
+    skills = generate_skills_for_candidate(job_role, experience_years, quality_tier, rng)
+    certifications = generate_certifications_for_candidate(job_role, experience_years, quality_tier, rng)
     
     # Create candidate object
     candidate = {
@@ -749,22 +336,27 @@ def generate_candidate_for_job(job_role, job_posted_date, quality_tier, used_ema
     candidate['threshold'] = threshold
     
     # Generate application date (after job posted)
-    application_date = generate_application_date(job_posted_date)
+    if applied_at is None:
+        application_date = generate_application_date(job_posted_date, rng, now)
+    else:
+        application_date = applied_at
     candidate['applied_at'] = application_date
     
     # If eligible, generate test score and performance
     if is_eligible:
-        test_score, skill_performance = generate_test_score_and_performance(candidate, job_role)
+        test_score, skill_performance, answers = generate_test_score_and_performance(candidate, job_role, rng)
         candidate['test_score'] = test_score
         candidate['skill_performance'] = skill_performance
+        candidate['test_answers'] = answers
         
         # Calculate composite score
         composite_score = calculate_composite_score(ai_score, test_score, experience_level)
         candidate['composite_score'] = composite_score
         
         # Test completed same day as application
-        test_completed_at = generate_test_completion_date(application_date)
+        test_completed_at = generate_test_completion_date(application_date, rng)
         candidate['test_completed_at'] = test_completed_at
+        candidate['test_duration_minutes'] = rng.randint(20, 40)
         
         # Status
         candidate['status'] = 'test_completed'
@@ -772,288 +364,1333 @@ def generate_candidate_for_job(job_role, job_posted_date, quality_tier, used_ema
         # Not eligible - no test
         candidate['test_score'] = None
         candidate['skill_performance'] = {}
+        candidate['test_answers'] = None
         candidate['composite_score'] = None
         candidate['test_completed_at'] = None
+        candidate['test_duration_minutes'] = None
         candidate['status'] = 'not_eligible'
     
     return candidate
 
-def generate_all_candidates():
+# Quality distribution: 25% excellent, 50% good, 20% average, 5% poor
+QUALITY_TIERS = ['excellent', 'good', 'average', 'poor']
+QUALITY_WEIGHTS = [0.25, 0.50, 0.20, 0.05]
+
+# Work unit size for the process pool. Fixed (not derived from the worker
+# count) so every chunk gets the same seed no matter how many workers run
+ROLE_CHUNK_SIZE = 2000
+
+def make_rng(seed, *keys):
     """
-    Generate all candidates for all 20 job roles
-    Total: ~1005 candidates with realistic distribution
+    Create an independent random.Random for a (master seed, role, chunk) key
+    String seeds are hashed deterministically, unlike hash() of tuples
     """
-    print("\n" + "="*70)
-    print("🚀 GENERATING REALISTIC CANDIDATE DATA")
-    print("="*70)
+    return random.Random(":".join(str(k) for k in (seed,) + keys))
+
+def generate_role_chunk(task):
+    """
+    Process-pool worker: generate one chunk of candidates for a role
+    Each chunk has its own RNG seeded from (master seed, role id, chunk index)
+    """
+    role, chunk_index, count, job_posted_date, seed, now, quality_weights = task
+    rng = make_rng(seed, role['id'], chunk_index)
     
-    job_roles = get_job_roles()
-    distribution = get_candidate_distribution()
+    candidates = []
+    for _ in range(count):
+        # Assign quality tier based on distribution
+        quality_tier = rng.choices(QUALITY_TIERS, weights=quality_weights)[0]
+        
+        candidate = generate_candidate_for_job(role, job_posted_date, quality_tier, None, rng, now)
+        candidate['job_posted_date'] = job_posted_date
+        candidates.append(candidate)
     
-    all_candidates = []
-    job_posted_dates = {}
-    used_emails = set()  # Track used emails for uniqueness
+    return role['id'], candidates
+
+def build_generation_tasks(job_roles, distribution, job_posted_dates, seed, now, scale=1,
+                           quality_weights=QUALITY_WEIGHTS):
+    """Split every role's candidate count into fixed-size chunk tasks"""
+    tasks = []
+    for role in job_roles:
+        num_candidates = int(round(distribution[role['id']] * scale))
+        for chunk_index, offset in enumerate(range(0, num_candidates, ROLE_CHUNK_SIZE)):
+            count = min(ROLE_CHUNK_SIZE, num_candidates - offset)
+            tasks.append((role, chunk_index, count, job_posted_dates[role['id']], seed, now,
+                          quality_weights))
+    return tasks
+
+# Time-series mode: days per work unit. Every day has its own RNG, so the
+# stream does not depend on the worker count
+TIME_SERIES_CHUNK_DAYS = 7
+
+def plan_time_series(job_roles, seed, now, profile):
+    """
+    Arrival-model inputs for a time-series run (see traffic.py)
+    Returns (plan, job_posted_dates); each role's posted date is its first
+    posting, so every application comes after it
+    """
+    config = profile['time_series']
+    role_ids = [role['id'] for role in job_roles]
+    weights = profiles.role_weights(profile, role_ids, get_candidate_distribution())
+    total_weight = sum(weights.values())
+    start, days = traffic.timeline(config, now)
+    plan = {
+        'config': config,
+        'start': start,
+        'days': days,
+        'role_share': {role_id: weight / total_weight for role_id, weight in weights.items()},
+        'postings': traffic.posting_schedule(role_ids, start, now, config, make_rng(seed, 'postings')),
+    }
+    return plan, {role_id: dates[0] for role_id, dates in plan['postings'].items()}
+
+def generate_time_series_chunk(task):
+    """
+    Process-pool worker: generate every application of a run of days, in
+    timestamp order. Each day has its own RNG seeded from (master seed, date)
+    """
+    roles_by_id, plan, first_day, num_days, seed, now, quality_weights = task
+    
+    candidates = []
+    for offset in range(first_day, first_day + num_days):
+        day = plan['start'] + timedelta(days=offset)
+        rng = make_rng(seed, 'day', day.date().isoformat())
+        arrivals = traffic.day_arrivals(day, plan['start'], plan['role_share'], plan['postings'],
+                                        plan['config'], rng, now)
+        for applied_at, role_id in arrivals:
+            quality_tier = rng.choices(QUALITY_TIERS, weights=quality_weights)[0]
+            job_posted_date = traffic.latest_posting(plan['postings'][role_id], applied_at)
+            candidate = generate_candidate_for_job(roles_by_id[role_id], job_posted_date, quality_tier,
+                                                   None, rng, now, applied_at)
+            candidate['job_posted_date'] = job_posted_date
+            candidates.append(candidate)
     
-    # Generate job posted dates for all roles
+    return first_day, candidates
+
+def build_time_series_tasks(job_roles, seed, now, profile, scale=1):
+    """Split the stream into TIME_SERIES_CHUNK_DAYS-day tasks (oldest first)"""
+    plan, _ = plan_time_series(job_roles, seed, now, profile)
+    plan['config'] = dict(plan['config'],
+                          applications_per_day=plan['config']['applications_per_day'] * scale)
+    roles_by_id = {role['id']: role for role in job_roles}
+    quality_weights = profiles.quality_weights(profile)
+    return [
+        (roles_by_id, plan, first_day, min(TIME_SERIES_CHUNK_DAYS, plan['days'] - first_day), seed, now,
+         quality_weights)
+        for first_day in range(0, plan['days'], TIME_SERIES_CHUNK_DAYS)
+    ]
+
+def imap_ordered(pool, func, tasks, max_pending):
+    """
+    Ordered pool.imap with at most `max_pending` tasks in flight
+    Pool.imap queues every result the consumer has not read yet; bounding
+    the in-flight work keeps memory flat when the consumer (the database
+    writer) is slower than the workers
+    """
+    pending = collections.deque()
+    for task in tasks:
+        pending.append(pool.apply_async(func, (task,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+def generate_job_posted_dates(job_roles, seed, now, days_ago_range=(30, 60)):
+    """Generate job posted dates for all roles from the master seed"""
     print("\n📅 Generating job posted dates...")
+    posted_rng = make_rng(seed, 'posted')
+    job_posted_dates = {}
     for role in job_roles:
-        job_posted_dates[role['id']] = generate_job_posted_date()
-        print(f"   Job {role['id']}: {role['title']} - Posted {(datetime.now() - job_posted_dates[role['id']]).days} days ago")
+        job_posted_dates[role['id']] = generate_job_posted_date(posted_rng, now, days_ago_range)
+        print(f"   Job {role['id']}: {role['title']} - Posted {(now - job_posted_dates[role['id']]).days} days ago")
+    return job_posted_dates
+
+def get_job_posted_dates(job_roles, seed, now, profile):
+    """Posted date per role: the first posting of a time-series run, otherwise drawn per profile"""
+    if profile['time_series'] is not None:
+        plan, job_posted_dates = plan_time_series(job_roles, seed, now, profile)
+        expected = traffic.expected_total(plan['start'], plan['days'], plan['role_share'], plan['postings'],
+                                          plan['config'])
+        print(f"\n📅 Time series: {plan['days']} days from {plan['start']:%Y-%m-%d}, "
+              f"{sum(len(dates) for dates in plan['postings'].values())} job postings, "
+              f"~{expected:,.0f} applications expected")
+        return job_posted_dates
+    return generate_job_posted_dates(job_roles, seed, now, profile['posted_days_ago'])
+
+def build_tasks(job_roles, job_posted_dates, seed, now, profile, scale=1, total=None):
+    """(worker, tasks) for a run: role chunks, or runs of days for a time-series profile"""
+    if profile['time_series'] is not None:
+        return generate_time_series_chunk, build_time_series_tasks(job_roles, seed, now, profile, scale)
+    distribution = profiles.role_counts(profile, [role['id'] for role in job_roles],
+                                        get_candidate_distribution(), total)
+    return generate_role_chunk, build_generation_tasks(job_roles, distribution, job_posted_dates, seed, now,
+                                                       scale, profiles.quality_weights(profile))
+
+def task_key(worker, task):
+    """[role id, chunk index, seed] of a role chunk, or ['days', first day, seed] in time-series mode"""
+    if worker is generate_time_series_chunk:
+        return ['days', task[2], task[4]]
+    return [task[0]['id'], task[1], task[4]]
+
+def iter_task_results(job_posted_dates, seed, workers=1, scale=1, now=None, profile=None, total=None,
+                      identities=None, start_task=0, email_lookup=None):
+    """
+    Lazily generate candidates task by task, yielding (task index, task key,
+    candidates) with emails and phones allocated
+    Tasks run on a process pool when workers > 1; results are yielded in
+    task order so the output is identical for any worker count. Only the
+    tasks in flight are held in memory.
+    The per-role counts and quality mix come from `profile` (see profiles.py;
+    the default profile is the hand-tuned distribution); `total` overrides
+    the profile's volume and `scale` multiplies the per-role counts.
+    A profile with a time_series section yields one date-ordered stream
+    over its timeline instead (`scale` multiplies the arrival rate).
+    Identities come from `identities` (an identity.IdentityAllocator), in
+    task order. Tasks before start_task are skipped without being
+    generated (resumed runs, see checkpoint.py). email_lookup (e.g.
+    DatabaseEmailCounts) returns {base: addresses already taken} for bases
+    the allocator has not seen, so appended emails continue after them.
+    """
+    now = now or datetime.now()
+    profile = profile or profiles.load_profile('default')
+    identities = identities or identity.IdentityAllocator()
+    worker, tasks = build_tasks(get_job_roles(), job_posted_dates, seed, now, profile, scale, total)
+    tasks = tasks[start_task:]
+    
+    if workers > 1:
+        pool = multiprocessing.Pool(workers)
+        results = imap_ordered(pool, worker, tasks, workers * 2)
+    else:
+        pool = None
+        results = map(worker, tasks)
     
-    print("\n👥 Generating candidates...")
+    try:
+        # Identities are allocated in task order, so they are deterministic
+        for task_index, (task, (_, chunk)) in enumerate(zip(tasks, results), start=start_task):
+            if email_lookup is not None:
+                identities.reserve(email_lookup(identities.unseen(c['email'] for c in chunk)))
+            for candidate in chunk:
+                candidate['email'], candidate['phone'] = identities.allocate(candidate['email'])
+            yield task_index, task_key(worker, task), chunk
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+def iter_candidates(job_posted_dates, seed, workers=1, scale=1, now=None, profile=None, total=None,
+                    identity_offset=0, email_lookup=None):
+    """
+    Lazily generate candidates for all roles (see iter_task_results)
+    identity_offset continues the phone sequence of an earlier run
+    """
+    identities = identity.IdentityAllocator(identity_offset)
+    for _, _, chunk in iter_task_results(job_posted_dates, seed, workers, scale, now, profile, total,
+                                         identities, email_lookup=email_lookup):
+        yield from chunk
+
+def generate_all_candidates(seed=None, workers=1, scale=1, now=None, profile=None):
+    """
+    Generate all candidates for all 20 job roles
+    Total: ~1005 candidates with realistic distribution (times `scale`),
+    or the volume and role mix of `profile` (see profiles.py)
     
-    # Quality distribution: 25% excellent, 50% good, 20% average, 5% poor
-    quality_tiers = ['excellent', 'good', 'average', 'poor']
-    quality_weights = [0.25, 0.50, 0.20, 0.05]
+    Materializes iter_candidates() into a list; main() streams instead.
+    Output is identical for a given seed (and reference `now`) regardless
+    of the worker count.
+    """
+    print("\n" + "="*70)
+    print("🚀 GENERATING REALISTIC CANDIDATE DATA")
+    print("="*70)
     
-    for role in job_roles:
-        role_id = role['id']
-        num_candidates = distribution[role_id]
-        job_posted_date = job_posted_dates[role_id]
-        
-        print(f"\n   📋 {role['title']} (Role {role_id})")
-        print(f"      Generating {num_candidates} candidates...")
-        
-        role_candidates = []
-        
-        for i in range(num_candidates):
-            # Assign quality tier based on distribution
-            quality_tier = random.choices(quality_tiers, weights=quality_weights)[0]
-            
-            candidate = generate_candidate_for_job(role, job_posted_date, quality_tier, used_emails)
-            candidate['job_posted_date'] = job_posted_date
-            role_candidates.append(candidate)
-        
-        # Calculate statistics for this role
-        eligible = len([c for c in role_candidates if c['is_eligible']])
-        avg_ai = sum(c['ai_score'] for c in role_candidates) / len(role_candidates)
-        avg_test = sum(c['test_score'] for c in role_candidates if c['test_score']) / eligible if eligible > 0 else 0
-        
-        print(f"      ✅ Generated {num_candidates} candidates")
-        print(f"      📊 Eligible: {eligible}/{num_candidates} ({eligible/num_candidates*100:.1f}%)")
-        print(f"      📈 Avg AI Score: {avg_ai:.1f}%")
-        if eligible > 0:
-            print(f"      📈 Avg Test Score: {avg_test:.1f}%")
-        
-        all_candidates.extend(role_candidates)
+    if seed is None:
+        seed = random.randrange(2**32)
+    now = now or datetime.now()
+    print(f"\n🎲 Seed: {seed} | Workers: {workers} | Scale: {scale}x")
+    
+    profile = profile or profiles.load_profile('default')
+    job_posted_dates = get_job_posted_dates(get_job_roles(), seed, now, profile)
+    
+    print("\n👥 Generating candidates...")
+    all_candidates = list(iter_candidates(job_posted_dates, seed, workers, scale, now, profile))
     
     print(f"\n✅ Total candidates generated: {len(all_candidates)}")
     
     return all_candidates, job_posted_dates
 
-def save_to_database(candidates, job_posted_dates, db_path='backend/database/recruitment.db'):
+# Bulk load tuning: rows are grouped into chunks of candidates and each table
+# is written with a single executemany per chunk
+BULK_CHUNK_SIZE = 5000
+
+# PRAGMAs applied only for the duration of a bulk load, then restored
+BULK_LOAD_PRAGMAS = {
+    'journal_mode': 'TRUNCATE',
+    'synchronous': 'OFF',
+    'cache_size': -262144,  # 256 MB page cache (negative = KiB)
+    'temp_store': 'MEMORY',
+}
+
+# Reseed loads into a scratch file that is discarded on failure, so it
+# needs no rollback journal at all
+RESEED_PRAGMAS = dict(BULK_LOAD_PRAGMAS, journal_mode='OFF')
+
+# Seconds to wait for the live database's write lock before the reseed
+# copy gives up (the scratch file is discarded and the data left as it was)
+RESEED_LOCK_TIMEOUT = 30
+# sqlite3_backup_step() result codes for a locked destination
+SQLITE_BUSY = 5
+SQLITE_LOCKED = 6
+
+# Tables save_to_database() rewrites; every other table (e.g. users) is
+# copied as-is into the reseeded file
+SEEDED_TABLES = (['job_roles', 'candidates', 'applications', 'ai_analysis', 'tests', 'decisions',
+                  'application_skills', 'application_certifications']
+                 + analytics_summary.SUMMARY_TABLES + checkpoint.PROGRESS_TABLES)
+
+INSERT_JOB_ROLE_SQL = """
+    INSERT INTO job_roles (
+        role_id, title, description, requirements,
+        min_ai_threshold, salary_min, salary_max,
+        status, recruiter_id, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Append mode: refresh role definitions but keep the posting date, salary and status
+UPSERT_JOB_ROLE_SQL = INSERT_JOB_ROLE_SQL.rstrip() + """
+    ON CONFLICT(role_id) DO UPDATE SET
+        title = excluded.title,
+        description = excluded.description,
+        requirements = excluded.requirements,
+        min_ai_threshold = excluded.min_ai_threshold
+"""
+
+# Emails checked per IN (...) lookup against the candidates.email unique index
+EMAIL_LOOKUP_BATCH = 500
+
+# Highest address number per base email (identity.numbered_email) for a
+# batch of local parts: one range scan on the email index per local part
+# (local + digits + '@' sorts between local + '0' and local + 'A'), covering
+# every domain at once; the part before '@' must be digits only
+EMAIL_COUNTS_SQL = """
+    WITH locals(local) AS (VALUES {values}),
+    matches AS (
+        SELECT l.local, c.email, instr(c.email, '@') AS at
+        FROM locals l
+        JOIN candidates c ON c.email >= l.local || '0' AND c.email < l.local || 'A'
+    )
+    SELECT local || substr(email, at) AS base,
+           MAX(CASE WHEN at = length(local) + 1 THEN 1
+                    ELSE CAST(substr(email, length(local) + 1, at - length(local) - 1) AS INTEGER) END)
+    FROM matches
+    WHERE substr(email, length(local) + 1, at - length(local) - 1) NOT GLOB '*[^0-9]*'
+    GROUP BY base
+"""
+
+INSERT_CANDIDATE_SQL = """
+    INSERT INTO candidates (candidate_id, name, email, phone, resume_path)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+INSERT_APPLICATION_SQL = """
+    INSERT INTO applications (application_id, candidate_id, role_id, status, applied_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_ANALYSIS_SQL = """
+    INSERT INTO ai_analysis (
+        analysis_id, application_id, ai_score, skills_matched, skill_gaps,
+        experience_years, experience_level,
+        education, certifications
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_TEST_SQL = """
+    INSERT INTO tests (
+        test_id, application_id, test_token, test_score,
+        started_at, completed_at, duration_minutes,
+        answers, verified_skills, unverified_skills,
+        untested_skills, verification_details
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_DECISION_SQL = """
+    INSERT INTO decisions (
+        decision_id, application_id, composite_score, final_decision,
+        decided_by, decided_at
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+def apply_load_pragmas(conn, pragmas=BULK_LOAD_PRAGMAS):
+    """Apply bulk-load PRAGMAs and return the previous values for restore_pragmas()"""
+    previous = {}
+    for name, value in pragmas.items():
+        previous[name] = conn.execute(f"PRAGMA {name}").fetchone()[0]
+        conn.execute(f"PRAGMA {name} = {value}")
+    return previous
+
+def restore_pragmas(conn, previous):
+    """Restore PRAGMA values captured by apply_load_pragmas()"""
+    for name, value in previous.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+
+def get_next_id(cursor, table, id_column):
+    """
+    Next free primary key for a table
+    Honours AUTOINCREMENT history so ids are never reused after a DELETE
+    """
+    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,))
+    row = cursor.fetchone()
+    seq = row[0] if row else 0
+    cursor.execute(f"SELECT MAX({id_column}) FROM {table}")
+    max_id = cursor.fetchone()[0] or 0
+    return max(seq, max_id) + 1
+
+def get_next_ids(cursor, append=False):
+    """
+    Next free id per seeded table (plus the resume file number, which
+    continues after the candidates on append)
+    """
+    ids = {
+        'candidates': get_next_id(cursor, 'candidates', 'candidate_id'),
+        'applications': get_next_id(cursor, 'applications', 'application_id'),
+        'ai_analysis': get_next_id(cursor, 'ai_analysis', 'analysis_id'),
+        'tests': get_next_id(cursor, 'tests', 'test_id'),
+        'decisions': get_next_id(cursor, 'decisions', 'decision_id'),
+        'resume': 1,
+    }
+    if append:
+        ids['resume'] = ids['candidates']  # Keep resume paths unique as well
+    return ids
+
+def iter_chunks(items, size=BULK_CHUNK_SIZE):
+    """Yield lists of up to `size` items from any iterable"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def find_existing_emails(cursor, emails):
+    """Emails already in the candidates table (batched lookups on the unique email index)"""
+    existing = set()
+    for batch in iter_chunks(emails, EMAIL_LOOKUP_BATCH):
+        placeholders = ','.join('?' * len(batch))
+        cursor.execute(f"SELECT email FROM candidates WHERE email IN ({placeholders})", batch)
+        existing.update(row[0] for row in cursor)
+    return existing
+
+def existing_email_counts(cursor, base_emails):
+    """
+    {base: highest number among its addresses in the candidates table} (see
+    identity.numbered_email; the base itself counts as 1, bases with no
+    address are left out). One grouped query per EMAIL_LOOKUP_BATCH local parts
+    """
+    base_emails = set(base_emails)
+    local_parts = sorted({base_email.split('@')[0] for base_email in base_emails})
+    counts = {}
+    for batch in iter_chunks(local_parts, EMAIL_LOOKUP_BATCH):
+        values = ','.join(['(?)'] * len(batch))
+        cursor.execute(EMAIL_COUNTS_SQL.format(values=values), batch)
+        counts.update((base_email, count) for base_email, count in cursor if base_email in base_emails)
+    return counts
+
+class DatabaseEmailCounts:
+    """
+    email_lookup for append runs (iter_task_results): existing_email_counts()
+    on the writing connection, which save_to_database() attaches, so lookups
+    see this run's rows and never wait on its lock
+    """
+
+    def __init__(self):
+        self.cursor = None
+
+    def __call__(self, base_emails):
+        if not base_emails:
+            return {}
+        if self.cursor is None:
+            raise RuntimeError("Email lookups need the connection attached by save_to_database()")
+        return existing_email_counts(self.cursor, base_emails)
+
+def claim_database_emails(cursor, chunk):
+    """
+    Append mode: renumber emails in a chunk that already exist in the database
+    Counters are primed from the database before allocation, so this only
+    catches rows written concurrently (e.g. by the backend during --live).
+    Colliding addresses continue after the highest number of their base in
+    the database and the chunk. Returns the number of emails changed
+    """
+    emails = [candidate['email'] for candidate in chunk]
+    existing = find_existing_emails(cursor, emails)
+    if not existing:
+        return 0
+    
+    colliding = [candidate for candidate in chunk if candidate['email'] in existing]
+    counts = existing_email_counts(cursor, {identity.split_email(email)[0] for email in existing})
+    for email in emails:
+        base_email, number = identity.split_email(email)
+        if base_email in counts:
+            counts[base_email] = max(counts[base_email], number)
+    for candidate in colliding:
+        base_email, _ = identity.split_email(candidate['email'])
+        counts[base_email] += 1
+        candidate['email'] = identity.numbered_email(base_email, counts[base_email])
+    return len(colliding)
+
+def load_job_posted_dates(db_path):
+    """Posting dates (job_roles.created_at) of roles already in the database"""
+    if not os.path.exists(db_path):
+        return {}
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT role_id, created_at FROM job_roles").fetchall()
+    finally:
+        conn.close()
+    posted = {}
+    for role_id, created_at in rows:
+        try:
+            posted[str(role_id)] = datetime.fromisoformat(created_at)
+        except (TypeError, ValueError):
+            continue
+    return posted
+
+def load_identity_offset(db_path):
+    """
+    Phone sequence offset for an appended run: the highest candidate id, so
+    new candidates continue after the identities already allocated
+    """
+    if not os.path.exists(db_path):
+        return 0
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COALESCE(MAX(candidate_id), 0) FROM candidates").fetchone()[0]
+    except sqlite3.OperationalError:
+        return 0
+    finally:
+        conn.close()
+
+def build_job_role_rows(job_roles, job_posted_dates):
+    """Build job_roles insert rows (created_at = job posted date)"""
+    rows = []
+    for role in job_roles:
+        rows.append((
+            role['id'],
+            role['title'],
+            f"Cybersecurity position: {role['title']}",
+            json.dumps({
+                'skills': role['skillKeywords'],
+                'certifications': role['certifications'],
+                'education': role['education'],
+                'experience': role['experienceRange']
+            }),
+            role['thresholdScore'],  # min_ai_threshold
+            80000,  # salary_min
+            150000,  # salary_max
+            'active',  # status
+            1,  # recruiter_id = 1
+            job_posted_dates[role['id']].isoformat()  # created_at (job posted date)
+        ))
+    return rows
+
+def build_candidate_rows(chunk, ids, rows, skills=None):
+    """
+    Append insert rows for a chunk of candidates to the per-table row lists
+    IDs are assigned up front from `ids` (next free id per table) instead of
+    relying on cursor.lastrowid, so every table can be written with executemany
+    With a skill_tables.SkillRegistry as `skills`, the normalized
+    application_skills/application_certifications rows are built as well
+    """
+    for candidate in chunk:
+        candidate_id = ids['candidates']
+        application_id = ids['applications']
+        applied_at = candidate['applied_at'].isoformat()
+
+        rows['candidates'].append((
+            candidate_id,
+            candidate['name'],
+            candidate['email'],
+            candidate['phone'],
+            f"uploads/resume_{ids['resume']}.pdf"
+        ))
+        rows['applications'].append((
+            application_id,
+            candidate_id,
+            candidate['role_id'],
+            candidate['status'],
+            applied_at,
+            applied_at
+        ))
+        rows['ai_analysis'].append((
+            ids['ai_analysis'],
+            application_id,
+            candidate['ai_score'],
+            json.dumps(candidate['matched_skills']),
+            json.dumps(candidate['missing_skills']),
+            candidate['experience_years'],
+            candidate['experience_level'],
+            candidate['education'],
+            json.dumps(candidate['certifications'])
+        ))
+
+        # Test results and decision (only if eligible)
+        if candidate['is_eligible']:
+            skill_performance = candidate['skill_performance']
+            rows['tests'].append((
+                ids['tests'],
+                application_id,
+                f"test_{application_id}_{int(candidate['applied_at'].timestamp())}",
+                candidate['test_score'],
+                applied_at,
+                candidate['test_completed_at'].isoformat(),
+                candidate['test_duration_minutes'],
+                json.dumps(candidate['test_answers']),
+                json.dumps([s for s, p in skill_performance.items() if p['level'] != 'weak']),
+                json.dumps([s for s, p in skill_performance.items() if p['level'] == 'weak']),
+                json.dumps([]),
+                json.dumps(skill_performance)
+            ))
+            rows['decisions'].append((
+                ids['decisions'],
+                application_id,
+                candidate['composite_score'],
+                'hold',  # Default decision
+                1,  # recruiter_id
+                candidate['test_completed_at'].isoformat()
+            ))
+            ids['tests'] += 1
+            ids['decisions'] += 1
+
+        if skills is not None:
+            rows['application_skills'].extend(skill_tables.application_skill_rows(
+                application_id, candidate['matched_skills'], candidate['missing_skills'],
+                candidate.get('skill_performance'), skills))
+            rows['application_certifications'].extend(
+                skill_tables.application_certification_rows(application_id, candidate['certifications']))
+
+        ids['candidates'] += 1
+        ids['applications'] += 1
+        ids['ai_analysis'] += 1
+        ids['resume'] += 1
+
+# Insert order matters for foreign keys: parents before children
+BULK_TABLES = [
+    ('candidates', INSERT_CANDIDATE_SQL),
+    ('applications', INSERT_APPLICATION_SQL),
+    ('ai_analysis', INSERT_ANALYSIS_SQL),
+    ('tests', INSERT_TEST_SQL),
+    ('decisions', INSERT_DECISION_SQL),
+    ('application_skills', skill_tables.INSERT_APPLICATION_SKILL_SQL),
+    ('application_certifications', skill_tables.INSERT_APPLICATION_CERT_SQL),
+]
+
+def save_to_database(candidates, job_posted_dates, db_path='backend/database/recruitment.db',
+                     chunk_size=BULK_CHUNK_SIZE, append=False, pragmas=BULK_LOAD_PRAGMAS,
+                     save_checkpoint=None, live=None, email_lookup=None):
     """
     Save generated candidates to SQLite database
     Clears existing data and inserts fresh data
+
+    Bulk load path: ids are assigned in Python, each table is written with
+    chunked executemany, and everything runs in one explicit transaction
+    with load-tuned PRAGMAs (restored afterwards). Returns per-table row counts.
+
+    append=True keeps existing rows: job roles are upserted, ids continue
+    after the current maximum and emails already in the database are
+    renumbered via indexed lookups (existing emails are never loaded).
+    email_lookup (a DatabaseEmailCounts feeding the generation stream) is
+    attached to the writing connection, so emails are allocated after the
+    database's own in the first place.
+
+    save_checkpoint (a checkpoint.SeedCheckpoint) makes the run resumable:
+    `candidates` is then the (task index, task key, candidates) stream of
+    iter_task_results(), and the load commits with its progress every
+    save_checkpoint.every candidates. A resumed checkpoint continues after
+    the committed tasks (no clearing, same ids); the returned counts cover
+    the whole run.
+
+    live (a live_writer.LiveWriter) appends while the backend keeps serving:
+    WAL, and one short transaction (rows plus summary refresh) per chunk,
+    sized to the writer's time budget; candidates are generated between
+    transactions and SQLITE_BUSY is retried with backoff. The backend can
+    insert while the lock is released, so next ids are re-read at the start
+    of every transaction.
     """
-    print(f"\n💾 Saving {len(candidates)} candidates to database...")
+    if live is not None and (not append or save_checkpoint is not None):
+        raise ValueError("The live writer only appends, without checkpoints")
+    resumed = save_checkpoint is not None and save_checkpoint.progress is not None
+    mode = "append" if append else "bulk load"
+    if save_checkpoint is not None:
+        mode += f", commits every {save_checkpoint.every:,} candidates"
+    if live is not None:
+        mode += f", live: WAL, {live.budget * 1000:g} ms transactions"
+        pragmas = live_writer.LIVE_PRAGMAS
+    if save_checkpoint is not None:
+        pragmas = dict(pragmas, synchronous=checkpoint.CHECKPOINT_SYNCHRONOUS)
+    print(f"\n💾 Saving candidates to database ({mode}, chunks of {chunk_size})...")
     print(f"   Database: {db_path}")
+    instr = instrumentation.active()
     
-    conn = sqlite3.connect(db_path)
+    # Autocommit mode so BEGIN/COMMIT below are the only transaction boundaries
+    if live is not None:
+        conn = live.connect(db_path)
+    else:
+        conn = sqlite3.connect(db_path, isolation_level=None)
     cursor = conn.cursor()
+    if email_lookup is not None:
+        email_lookup.cursor = conn.cursor()
+    previous_pragmas = apply_load_pragmas(conn, pragmas)
+    inserted = {'job_roles': 0}
+    inserted.update({table: 0 for table, _ in BULK_TABLES})
+    start_time = time.perf_counter()
     
     try:
-        # Clear existing data
-        print("\n🗑️  Clearing existing data...")
-        cursor.execute("DELETE FROM decisions")
-        cursor.execute("DELETE FROM tests")
-        cursor.execute("DELETE FROM ai_analysis")
-        cursor.execute("DELETE FROM applications")
-        cursor.execute("DELETE FROM candidates")
-        cursor.execute("DELETE FROM job_roles")
-        conn.commit()
-        print("   ✅ Existing data cleared")
+        if live is not None:
+            live.begin()
+        else:
+            cursor.execute("BEGIN")
+        if skill_tables.ensure_skill_tables(cursor):
+            print("   ✅ Created normalized skill tables")
+        if save_checkpoint is not None:
+            checkpoint.ensure_progress_tables(cursor)
         
-        # Insert job roles with created_at dates (using posted date)
-        print("\n📋 Inserting job roles...")
-        job_roles = get_job_roles()
-        for role in job_roles:
-            posted_date = job_posted_dates[role['id']]
-            cursor.execute("""
-                INSERT INTO job_roles (
-                    role_id, title, description, requirements, 
-                    min_ai_threshold, salary_min, salary_max,
-                    status, recruiter_id, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                role['id'],
-                role['title'],
-                f"Cybersecurity position: {role['title']}",
-                json.dumps({
-                    'skills': role['skillKeywords'],
-                    'certifications': role['certifications'],
-                    'education': role['education'],
-                    'experience': role['experienceRange']
-                }),
-                role['thresholdScore'],  # min_ai_threshold
-                80000,  # salary_min
-                150000,  # salary_max
-                'active',  # status
-                1,  # recruiter_id = 1
-                posted_date.isoformat()  # created_at (job posted date)
-            ))
-        conn.commit()
-        print(f"   ✅ Inserted {len(job_roles)} job roles")
+        if resumed:
+            # Cleared data, job roles and earlier tasks are already committed
+            progress = save_checkpoint.progress
+            inserted = dict(progress['inserted'])
+            ids = dict(progress['ids'])
+            print(f"\n♻️  Resuming after task {progress['next_task'] - 1} "
+                  f"(last completed: {progress['last_task']}), "
+                  f"{inserted['candidates']} candidates already saved")
+        else:
+            # A new run discards the progress of any interrupted one
+            checkpoint.clear_progress(cursor)
+            if not append:
+                # Clear existing data (the skills dictionary is kept so skill ids stay stable)
+                print("\n🗑️  Clearing existing data...")
+                with instr.stage('save.clear'):
+                    cursor.execute("DELETE FROM application_certifications")
+                    cursor.execute("DELETE FROM application_skills")
+                    cursor.execute("DELETE FROM decisions")
+                    cursor.execute("DELETE FROM tests")
+                    cursor.execute("DELETE FROM ai_analysis")
+                    cursor.execute("DELETE FROM applications")
+                    cursor.execute("DELETE FROM candidates")
+                    cursor.execute("DELETE FROM job_roles")
+                print("   ✅ Existing data cleared")
+            
+            # Insert job roles with created_at dates (using posted date)
+            print(f"\n📋 {'Upserting' if append else 'Inserting'} job roles...")
+            job_roles = get_job_roles()
+            job_role_sql = UPSERT_JOB_ROLE_SQL if append else INSERT_JOB_ROLE_SQL
+            cursor.executemany(job_role_sql, build_job_role_rows(job_roles, job_posted_dates))
+            inserted['job_roles'] = len(job_roles)
+            print(f"   ✅ {'Upserted' if append else 'Inserted'} {len(job_roles)} job roles")
+            
+            # Assign all ids up front
+            ids = get_next_ids(cursor, append)
+            if append:
+                print(f"   Appending after candidate_id {ids['candidates'] - 1}, "
+                      f"application_id {ids['applications'] - 1}")
+        renamed_emails = 0
+        skills = skill_tables.SkillRegistry(cursor)
+        previous_rows = sum(inserted.values())
+        if live is not None:
+            # Release the lock before generating the first chunk
+            live.commit()
+        
+        # Checkpointed runs commit at task boundaries, together with their progress
+        if save_checkpoint is not None:
+            batches = save_checkpoint.batches(candidates)
+        elif live is not None:
+            batches = ((chunk, None) for chunk in live.chunks(candidates))
+        else:
+            batches = ((chunk, None) for chunk in iter_chunks(candidates, chunk_size))
+        next_progress = 0
         
         # Insert candidates and related data
         print("\n👥 Inserting candidates...")
-        for idx, candidate in enumerate(candidates, 1):
-            # Insert candidate
-            cursor.execute("""
-                INSERT INTO candidates (name, email, phone, resume_path)
-                VALUES (?, ?, ?, ?)
-            """, (
-                candidate['name'],
-                candidate['email'],
-                candidate['phone'],
-                f"uploads/resume_{idx}.pdf"
-            ))
-            
-            candidate_id = cursor.lastrowid
-            
-            # Insert application
-            cursor.execute("""
-                INSERT INTO applications (candidate_id, role_id, status, applied_at, updated_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                candidate_id,
-                candidate['role_id'],
-                candidate['status'],
-                candidate['applied_at'].isoformat(),
-                candidate['applied_at'].isoformat()
-            ))
+        for chunk, completed_task in batches:
+            if live is not None:
+                live.begin()
+                # The backend may have inserted rows while the lock was released
+                ids = get_next_ids(cursor, append)
+            if append:
+                with instr.stage('save.claim_emails'):
+                    renamed_emails += claim_database_emails(cursor, chunk)
+            rows = {table: [] for table, _ in BULK_TABLES}
+            with instr.stage('save.build_rows'):
+                build_candidate_rows(chunk, ids, rows, skills)
+            for table, sql in BULK_TABLES:
+                with instr.stage(f'save.insert.{table}'):
+                    cursor.executemany(sql, rows[table])
+                inserted[table] += len(rows[table])
+            if completed_task is not None:
+                with instr.stage('save.checkpoint'):
+                    save_checkpoint.save(cursor, completed_task, ids, inserted)
+                    cursor.execute("COMMIT")
+                    cursor.execute("BEGIN")
+            elif live is not None:
+                # Keep the dashboard summaries current with every short transaction
+                with instr.stage('save.live_commit'):
+                    analytics_summary.refresh_summaries(cursor)
+                    live.commit()
             
-            application_id = cursor.lastrowid
-            
-            # Insert AI analysis
-            cursor.execute("""
-                INSERT INTO ai_analysis (
-                    application_id, ai_score, skills_matched, skill_gaps,
-                    experience_years, experience_level,
-                    education, certifications
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                application_id,
-                candidate['ai_score'],
-                json.dumps(candidate['matched_skills']),
-                json.dumps(candidate['missing_skills']),
-                candidate['experience_years'],
-                candidate['experience_level'],
-                candidate['education'],
-                json.dumps(candidate['certifications'])
-            ))
-            
-            # Insert test results (only if eligible)
-            if candidate['is_eligible']:
-                cursor.execute("""
-                    INSERT INTO tests (
-                        application_id, test_token, test_score,
-                        started_at, completed_at, duration_minutes,
-                        answers, verified_skills, unverified_skills,
-                        untested_skills, verification_details
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    application_id,
-                    f"test_{application_id}_{int(candidate['applied_at'].timestamp())}",
-                    candidate['test_score'],
-                    candidate['applied_at'].isoformat(),
-                    candidate['test_completed_at'].isoformat(),
-                    random.randint(20, 40),  # Test duration
-                    json.dumps([]),  # Empty answers array
-                    json.dumps([s for s, p in candidate['skill_performance'].items() if p['level'] != 'weak']),
-                    json.dumps([s for s, p in candidate['skill_performance'].items() if p['level'] == 'weak']),
-                    json.dumps([]),
-                    json.dumps(candidate['skill_performance'])
-                ))
-                
-                # Insert decision
-                cursor.execute("""
-                    INSERT INTO decisions (
-                        application_id, composite_score, final_decision,
-                        decided_by, decided_at
-                    ) VALUES (?, ?, ?, ?, ?)
-                """, (
-                    application_id,
-                    candidate['composite_score'],
-                    'hold',  # Default decision
-                    1,  # recruiter_id
-                    candidate['test_completed_at'].isoformat()
-                ))
-            
-            # Progress indicator
-            if idx % 100 == 0:
-                print(f"   Progress: {idx}/{len(candidates)} candidates...")
-                conn.commit()
+            # Progress indicator (about every chunk_size candidates)
+            if inserted['candidates'] >= next_progress or completed_task is not None:
+                next_progress = inserted['candidates'] + chunk_size
+                elapsed = time.perf_counter() - start_time
+                print(f"   Progress: {inserted['candidates']} candidates "
+                      f"({(sum(inserted.values()) - previous_rows) / max(elapsed, 1e-9):,.0f} rows/sec)"
+                      + (" - checkpoint saved" if completed_task is not None else "..."))
+        
+        # Precomputed dashboard aggregates: rebuilt after a fresh load, folded in on append
+        if live is not None and not conn.in_transaction:
+            live.begin()
+        with instr.stage('save.summaries'):
+            summarized, _ = analytics_summary.refresh_summaries(cursor, full=not append)
+        print(f"\n📊 Analytics summaries {'updated' if append else 'rebuilt'} ({summarized} applications)")
         
-        conn.commit()
-        print(f"\n✅ Successfully saved {len(candidates)} candidates to database!")
+        if save_checkpoint is not None:
+            checkpoint.clear_progress(cursor)
+        with instr.stage('save.commit'):
+            if live is not None:
+                live.commit()
+            else:
+                cursor.execute("COMMIT")
         
     except Exception as e:
         print(f"\n❌ Error saving to database: {e}")
-        conn.rollback()
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
+        if resumed or (save_checkpoint is not None and save_checkpoint.saved_task is not None):
+            print(f"   💾 Progress up to the last checkpoint is saved: "
+                  f"rerun with --resume --db {db_path} to continue")
         raise
+    finally:
+        if email_lookup is not None:
+            email_lookup.cursor = None
+        restore_pragmas(conn, previous_pragmas)
+        conn.close()
+    
+    elapsed = time.perf_counter() - start_time
+    total_rows = sum(inserted.values()) - previous_rows
+    print(f"\n✅ Successfully saved {inserted['candidates']} candidates to database!")
+    print(f"   Rows inserted: " + ", ".join(f"{table}={count}" for table, count in inserted.items()))
+    if append:
+        print(f"   📧 Emails renumbered to avoid concurrently added candidates: {renamed_emails}")
+    print(f"   ⏱️  {total_rows} rows in {elapsed:.2f}s ({total_rows / max(elapsed, 1e-9):,.0f} rows/sec)")
+    if live is not None:
+        live.print_report()
+    
+    return inserted
+
+def read_schema(db_path):
+    """
+    Schema of an existing database from sqlite_master, split into
+    (tables, deferred) where deferred holds the explicit indexes, views and
+    triggers that a reseed creates after the data is loaded
+    """
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            "SELECT type, name, sql FROM sqlite_master "
+            "WHERE sql IS NOT NULL AND name NOT LIKE 'sqlite_%' ORDER BY rowid"
+        ).fetchall()
     finally:
         conn.close()
+    tables = [(name, sql) for kind, name, sql in rows if kind == 'table']
+    deferred = [(name, sql) for kind, name, sql in rows if kind != 'table']
+    return tables, deferred
+
+def fail_when_locked(status, remaining, total):
+    """
+    Backup progress callback: the live connection's busy timeout has already
+    run out when a step reports BUSY/LOCKED, so stop instead of retrying forever
+    """
+    if status in (SQLITE_BUSY, SQLITE_LOCKED):
+        raise sqlite3.OperationalError(
+            f"database is locked: could not get the write lock within {RESEED_LOCK_TIMEOUT}s")
+
+def reseed_database(candidates, job_posted_dates, db_path='backend/database/recruitment.db',
+                    chunk_size=BULK_CHUNK_SIZE):
+    """
+    Full reseed into a fresh database file, then copy it into place
+    1. Create the tables (schema read from the live database) in a scratch
+       file next to it; copy unseeded tables (users) and the AUTOINCREMENT
+       counters so ids are not reused
+    2. Bulk load with no journal and no secondary indexes to maintain
+    3. Create the indexes, views and triggers, then ANALYZE
+    4. Copy the scratch file into db_path with SQLite's online backup API,
+       which takes the live database's write lock and goes through its
+       journal (rollback or WAL), so connections that stay open (e.g. the
+       backend's) see the new data on their next read instead of a file
+       swapped out from under them
+    Returns (per-table row counts, per-step seconds)
+    """
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"Reseed reads its schema from an existing database: {db_path}")
+    
+    instr = instrumentation.active()
+    timings = {}
+    tables, deferred = read_schema(db_path)
+    tmp_path = f"{db_path}.reseed-{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    
+    print(f"\n🏗️  Reseeding into a fresh file: {tmp_path}")
+    try:
+        start = time.perf_counter()
+        with instr.stage('reseed.schema'):
+            conn = sqlite3.connect(tmp_path, isolation_level=None)
+            try:
+                conn.execute("PRAGMA journal_mode = OFF")
+                # The backup below needs matching page sizes when the live database is in WAL
+                conn.execute("ATTACH DATABASE ? AS live", (db_path,))
+                page_size = conn.execute("PRAGMA live.page_size").fetchone()[0]
+                conn.execute(f"PRAGMA main.page_size = {int(page_size)}")
+                conn.execute("BEGIN")
+                for _, sql in tables:
+                    conn.execute(sql)
+                for name, _ in tables:
+                    if name not in SEEDED_TABLES:
+                        conn.execute(f'INSERT INTO main."{name}" SELECT * FROM live."{name}"')
+                has_sequence = conn.execute(
+                    "SELECT 1 FROM live.sqlite_master WHERE name = 'sqlite_sequence'").fetchone()
+                if has_sequence:
+                    conn.execute("DELETE FROM main.sqlite_sequence")
+                    conn.execute("INSERT INTO main.sqlite_sequence SELECT * FROM live.sqlite_sequence")
+                conn.execute("COMMIT")
+                conn.execute("DETACH DATABASE live")
+            finally:
+                conn.close()
+        timings['schema'] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        inserted = save_to_database(candidates, job_posted_dates, tmp_path, chunk_size,
+                                    pragmas=RESEED_PRAGMAS)
+        timings['load'] = time.perf_counter() - start
+        
+        print(f"\n🗂️  Creating {len(deferred)} indexes/views/triggers and running ANALYZE...")
+        conn = sqlite3.connect(tmp_path, isolation_level=None)
+        try:
+            apply_load_pragmas(conn, RESEED_PRAGMAS)
+            start = time.perf_counter()
+            with instr.stage('reseed.indexes'):
+                conn.execute("BEGIN")
+                # Objects the load already created (e.g. new summary views) are skipped
+                existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+                for name, sql in deferred:
+                    if name not in existing:
+                        conn.execute(sql)
+                conn.execute("COMMIT")
+            timings['indexes'] = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            with instr.stage('reseed.analyze'):
+                conn.execute("ANALYZE")
+            timings['analyze'] = time.perf_counter() - start
+        finally:
+            conn.close()
+        
+        start = time.perf_counter()
+        with instr.stage('reseed.copy'):
+            source = sqlite3.connect(tmp_path)
+            live = sqlite3.connect(db_path, timeout=RESEED_LOCK_TIMEOUT)
+            try:
+                # The copy is committed through the live database's own journal
+                live.execute("PRAGMA synchronous = FULL")
+                source.backup(live, progress=fail_when_locked)
+            finally:
+                live.close()
+                source.close()
+        timings['copy'] = time.perf_counter() - start
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    print(f"✅ Copied reseeded database into place: {db_path}")
+    print("   ⏱️  " + ", ".join(f"{step} {seconds:.2f}s" for step, seconds in timings.items()))
+    return inserted, timings
+
+class RunningStats:
+    """Running accumulators for candidate statistics (constant memory)"""
+    
+    def __init__(self):
+        self.total = 0
+        self.eligible = 0
+        self.ai_total = 0.0
+        self.test_total = 0.0
+        self.composite_total = 0.0
+    
+    def add(self, candidate):
+        self.total += 1
+        self.ai_total += candidate['ai_score']
+        if candidate['is_eligible']:
+            self.eligible += 1
+            self.test_total += candidate['test_score'] or 0
+            self.composite_total += candidate['composite_score'] or 0
+    
+    @property
+    def avg_ai(self):
+        return self.ai_total / self.total if self.total else 0
+    
+    @property
+    def avg_test(self):
+        return self.test_total / self.eligible if self.eligible else 0
+    
+    @property
+    def avg_composite(self):
+        return self.composite_total / self.eligible if self.eligible else 0
+
+class SummaryStats(RunningStats):
+    """
+    Incremental generation summary: overall and per-role accumulators plus
+    the application date range, updated one candidate at a time
+    """
+    
+    def __init__(self, now=None):
+        super().__init__()
+        self.now = now or datetime.now()
+        self.by_role = {}
+        self.role_titles = {}
+        self.earliest = None
+        self.latest = None
+        self.recent = 0
+    
+    def add(self, candidate):
+        super().add(candidate)
+        role_id = candidate['role_id']
+        if role_id not in self.by_role:
+            self.by_role[role_id] = RunningStats()
+            self.role_titles[role_id] = candidate['role_title']
+        self.by_role[role_id].add(candidate)
+        
+        applied_at = candidate['applied_at']
+        if self.earliest is None or applied_at < self.earliest:
+            self.earliest = applied_at
+        if self.latest is None or applied_at > self.latest:
+            self.latest = applied_at
+        if (self.now - applied_at).days <= 7:
+            self.recent += 1
+    
+    def track(self, candidates):
+        """Pass candidates through unchanged while accumulating statistics"""
+        for candidate in candidates:
+            self.add(candidate)
+            yield candidate
+    
+    def track_tasks(self, task_results):
+        """track() for (task index, task key, candidates) results"""
+        for result in task_results:
+            for candidate in result[2]:
+                self.add(candidate)
+            yield result
 
 def print_summary(candidates):
-    """Print summary statistics"""
+    """
+    Print summary statistics
+    Accepts a SummaryStats (streaming pipeline) or a list of candidates
+    """
+    if isinstance(candidates, SummaryStats):
+        stats = candidates
+    else:
+        stats = SummaryStats()
+        for candidate in candidates:
+            stats.add(candidate)
+    
     print("\n" + "="*70)
     print("📊 GENERATION SUMMARY")
     print("="*70)
     
-    total = len(candidates)
-    eligible = len([c for c in candidates if c['is_eligible']])
+    total = stats.total
+    if total == 0:
+        print("\n⚠️  No candidates generated")
+        return
+    eligible = stats.eligible
     not_eligible = total - eligible
     
-    avg_ai = sum(c['ai_score'] for c in candidates) / total
-    avg_test = sum(c['test_score'] for c in candidates if c['test_score']) / eligible if eligible > 0 else 0
-    avg_composite = sum(c['composite_score'] for c in candidates if c['composite_score']) / eligible if eligible > 0 else 0
+    print(f"\n📋 Per-Role Statistics:")
+    for role_id, role_stats in stats.by_role.items():
+        print(f"   {stats.role_titles[role_id]} (Role {role_id}): "
+              f"{role_stats.eligible}/{role_stats.total} eligible "
+              f"({role_stats.eligible/role_stats.total*100:.1f}%), "
+              f"avg AI {role_stats.avg_ai:.1f}%, avg test {role_stats.avg_test:.1f}%")
     
     print(f"\n📈 Overall Statistics:")
     print(f"   Total Candidates: {total}")
     print(f"   Eligible (took test): {eligible} ({eligible/total*100:.1f}%)")
     print(f"   Not Eligible: {not_eligible} ({not_eligible/total*100:.1f}%)")
-    print(f"\n   Average AI Score: {avg_ai:.1f}%")
-    print(f"   Average Test Score: {avg_test:.1f}%")
-    print(f"   Average Composite Score: {avg_composite:.1f}%")
+    print(f"\n   Average AI Score: {stats.avg_ai:.1f}%")
+    print(f"   Average Test Score: {stats.avg_test:.1f}%")
+    print(f"   Average Composite Score: {stats.avg_composite:.1f}%")
     
     # Date range
-    all_dates = [c['applied_at'] for c in candidates]
-    earliest = min(all_dates)
-    latest = max(all_dates)
+    earliest = stats.earliest
+    latest = stats.latest
     print(f"\n📅 Application Date Range:")
     print(f"   Earliest: {earliest.strftime('%Y-%m-%d')}")
     print(f"   Latest: {latest.strftime('%Y-%m-%d')}")
     print(f"   Span: {(latest - earliest).days} days")
     
     # Recent applications (last 7 days)
-    recent = len([c for c in candidates if (datetime.now() - c['applied_at']).days <= 7])
     print(f"\n🔥 Recent Activity:")
-    print(f"   Applications in last 7 days: {recent}")
+    print(f"   Applications in last 7 days: {stats.recent}")
     
     print("\n" + "="*70)
 
-def main():
+def add_multiple_applications(db_path, count, seed, live=None):
+    """
+    Run the add_multiple_applications.py flow for `count` random candidates
+    live (a live_writer.LiveWriter): write through its short, budgeted
+    BEGIN IMMEDIATE transactions, as save_to_database() does
+    """
+    import add_multiple_applications as add_multiple
+    
+    if live is not None:
+        conn = live.connect(db_path)
+        previous_pragmas = apply_load_pragmas(conn, live_writer.LIVE_PRAGMAS)
+    else:
+        conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        totals = add_multiple.add_applications(conn, count, make_rng(seed, 'multi_applications'), live=live)
+    finally:
+        if live is not None:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            restore_pragmas(conn, previous_pragmas)
+        conn.close()
+    totals.pop('candidates')
+    if live is not None:
+        live.print_report("Live writer (including the second applications)")
+    return totals
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Generate realistic candidate data for the cybersecurity ATS")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Master seed for reproducible output (random if omitted)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Number of worker processes (default: 1)")
+    parser.add_argument('--scale', type=float, default=1,
+                        help="Multiplier for the per-role candidate distribution (default: 1)")
+    parser.add_argument('--db', default='backend/database/recruitment.db',
+                        help="SQLite database path")
+    parser.add_argument('--count', type=int, default=None,
+                        help="Total candidates to generate (overrides the profile's volume)")
+    parser.add_argument('--data-profile', default='default', metavar='NAME|PATH',
+                        help="Scale/distribution profile: a built-in name (default, smoke, 1m, "
+                             "10m-hot-roles) or a .json/.yaml file (see profiles.py)")
+    parser.add_argument('--list-profiles', action='store_true', help="List the built-in profiles and exit")
+    
+    series = parser.add_argument_group('time-series mode (multi-year, date-ordered stream; see traffic.py)')
+    series.add_argument('--time-series', action='store_true',
+                        help="Generate a time-series stream (default settings unless the profile has them)")
+    series.add_argument('--years', type=float, default=None, help="Years of history (implies --time-series)")
+    series.add_argument('--arrival-rate', type=float, default=None, metavar='PER_DAY',
+                        help="Base applications per day (implies --time-series)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--append', action='store_true',
+                      help="Add candidates to the existing data instead of replacing it")
+    mode.add_argument('--reseed', action='store_true',
+                      help="Replace all data by loading a fresh database file (indexes built "
+                           "after the load) and copying it into place")
+    mode.add_argument('--resume', action='store_true',
+                      help="Continue an interrupted run in --db with its original settings "
+                           "(seed, profile, volume, mode are read from its progress table)")
+    parser.add_argument('--checkpoint-every', type=int, default=checkpoint.DEFAULT_CHECKPOINT_EVERY,
+                        metavar='N',
+                        help="Commit with resumable progress every N candidates; 0 loads in one "
+                             f"transaction (default: {checkpoint.DEFAULT_CHECKPOINT_EVERY}; not used by --reseed)")
+    
+    live = parser.add_argument_group('live writer (append while the backend keeps serving; see live_writer.py)')
+    live.add_argument('--live', action='store_true',
+                      help="Append in WAL mode with short, time-bounded transactions (implies --append)")
+    live.add_argument('--txn-budget-ms', type=float, default=live_writer.DEFAULT_BUDGET_MS, metavar='MS',
+                      help=f"Commit once a transaction has run this long (default: {live_writer.DEFAULT_BUDGET_MS})")
+    live.add_argument('--max-backoff-ms', type=float, default=live_writer.DEFAULT_MAX_BACKOFF_MS, metavar='MS',
+                      help="Longest pause between SQLITE_BUSY retries "
+                           f"(default: {live_writer.DEFAULT_MAX_BACKOFF_MS})")
+    live.add_argument('--lock-share', type=float, default=live_writer.DEFAULT_LOCK_SHARE, metavar='FRACTION',
+                      help="Largest share of wall time the writer holds the write lock, leaving the rest "
+                           f"to the backend (default: {live_writer.DEFAULT_LOCK_SHARE})")
+    live.add_argument('--probe-reads', action='store_true',
+                      help="Time dashboard queries on a second connection during the load "
+                           "(also without --live, for comparison)")
+    
+    instrument = parser.add_argument_group('instrumentation (off by default)')
+    instrument.add_argument('--instrument', metavar='REPORT',
+                            help="Record stage timings and counters and write them to REPORT")
+    instrument.add_argument('--trace-format', choices=['json', 'chrome'], default='json',
+                            help="Report format: structured JSON or a Chrome trace (default: json)")
+    instrument.add_argument('--profile', action='store_true',
+                            help="Also run cProfile (top functions in the report, full stats in REPORT.prof)")
+    instrument.add_argument('--trace-memory', action='store_true',
+                            help="Also track memory per stage with tracemalloc (slow)")
+    args = parser.parse_args(argv)
+    args.time_series = args.time_series or args.years is not None or args.arrival_rate is not None
+    if args.time_series and args.count is not None:
+        parser.error("--count sets a fixed volume; in time-series mode use --arrival-rate and --years")
+    if (args.profile or args.trace_memory) and not args.instrument:
+        parser.error("--profile and --trace-memory require --instrument REPORT")
+    if args.checkpoint_every < 0:
+        parser.error("--checkpoint-every must be 0 or more")
+    if args.resume and args.checkpoint_every == 0:
+        parser.error("--resume continues a checkpointed run; --checkpoint-every must be positive")
+    if args.live:
+        if args.reseed or args.resume:
+            parser.error("--live appends to the existing data; it cannot be combined with --reseed or --resume")
+        if args.txn_budget_ms <= 0 or args.max_backoff_ms <= 0:
+            parser.error("--txn-budget-ms and --max-backoff-ms must be positive")
+        if not 0 < args.lock_share <= 1:
+            parser.error("--lock-share must be in (0, 1]")
+        args.append = True
+    if args.probe_reads and args.reseed:
+        parser.error("--probe-reads measures reads during the load; --reseed loads a scratch file")
+    return args
+
+def main(argv=None):
     """Main execution function"""
+    args = parse_args(argv)
+    
+    if args.list_profiles:
+        for name, profile in profiles.list_profiles():
+            print(f"   {name:15} {profile['description']}")
+            print(f"   {'':15} {profiles.describe_profile(profile)}")
+        return
+    progress = None
+    if args.resume:
+        progress = checkpoint.load_progress(args.db)
+        if progress is None:
+            raise SystemExit(f"❌ No interrupted run to resume in {args.db}")
+        # The interrupted run's settings replace the command line's
+        settings = progress['settings']
+        profile = settings['profile']
+        args.seed, args.scale, args.count, args.append = (
+            settings['seed'], settings['scale'], settings['total'], settings['append'])
+    else:
+        profile = profiles.load_profile(args.data_profile)
+        if args.time_series:
+            overrides = dict(profile['time_series'] or {})
+            if args.years is not None:
+                overrides['years'] = args.years
+            if args.arrival_rate is not None:
+                overrides['applications_per_day'] = args.arrival_rate
+            profile = dict(profile, time_series=traffic.resolve_time_series(overrides))
+    
     print("\n🎯 Cybersecurity ATS - Realistic Candidate Data Generator")
     print("   Version 2.0 - November 2024")
     print("   Generating 1000+ candidates for 20 job roles")
     
-    # Generate all candidates
-    candidates, job_posted_dates = generate_all_candidates()
+    print("\n" + "="*70)
+    print("🚀 GENERATING REALISTIC CANDIDATE DATA")
+    print("="*70)
     
-    # Save to database
-    save_to_database(candidates, job_posted_dates)
+    if args.instrument:
+        instrumentation.enable(profile=args.profile, trace_memory=args.trace_memory)
+    instr = instrumentation.active()
+    
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    now = datetime.now()
+    if progress is not None:
+        now, _ = checkpoint.restore_settings(progress['settings'])
+    print(f"\n🎲 Seed: {seed} | Workers: {args.workers} | Scale: {args.scale:g}x"
+          + (" | Mode: append" if args.append else " | Mode: reseed" if args.reseed else "")
+          + (" | Resuming" if progress is not None else ""))
+    print(f"📐 Profile {profiles.describe_profile(profile)}")
+    identity_offset = 0
+    with instr.stage('job_posted_dates'):
+        if progress is not None:
+            identity_offset = progress['settings']['identity_offset']
+            _, job_posted_dates = checkpoint.restore_settings(progress['settings'])
+        else:
+            job_posted_dates = get_job_posted_dates(get_job_roles(), seed, now, profile)
+            if args.append:
+                identity_offset = load_identity_offset(args.db)
+                # Roles already in the database keep their posting date
+                existing_dates = load_job_posted_dates(args.db)
+                job_posted_dates.update({role_id: posted for role_id, posted in existing_dates.items()
+                                         if role_id in job_posted_dates})
+                print(f"   Keeping the posting date of {len(existing_dates)} existing roles")
+    
+    writer = None
+    if args.live:
+        writer = live_writer.LiveWriter(args.txn_budget_ms, args.max_backoff_ms, args.lock_share)
+    probe = None
+    if args.probe_reads:
+        probe = live_writer.ReadProbe(args.db)
+        probe.start()
+    
+    # Stream candidates straight into the batched database writer,
+    # accumulating summary statistics on the way through
+    # ('generate' is the time spent producing candidates inside the save)
+    stats = SummaryStats(now)
+    # Appended emails continue after the addresses already in the database
+    email_lookup = DatabaseEmailCounts() if args.append else None
+    with instr.stage('save_to_database'):
+        if args.reseed or args.live or args.checkpoint_every == 0:
+            candidates = instr.timed_iter('generate', iter_candidates(
+                job_posted_dates, seed, args.workers, args.scale, now, profile, args.count, identity_offset,
+                email_lookup))
+            if args.reseed:
+                inserted, _ = reseed_database(stats.track(candidates), job_posted_dates, args.db)
+            else:
+                inserted = save_to_database(stats.track(candidates), job_posted_dates, args.db,
+                                            append=args.append, live=writer, email_lookup=email_lookup)
+        else:
+            # Resumable: commits every --checkpoint-every candidates (see checkpoint.py)
+            settings = checkpoint.run_settings(seed, now, profile, args.scale, args.count, args.append,
+                                               identity_offset, job_posted_dates)
+            save_checkpoint = checkpoint.SeedCheckpoint(settings, args.checkpoint_every, progress)
+            task_results = instr.timed_iter('generate', iter_task_results(
+                job_posted_dates, seed, args.workers, args.scale, now, profile, args.count,
+                save_checkpoint.identities, save_checkpoint.start_task, email_lookup))
+            inserted = save_to_database(stats.track_tasks(task_results), job_posted_dates, args.db,
+                                        append=args.append, save_checkpoint=save_checkpoint,
+                                        email_lookup=email_lookup)
+    if progress is not None:
+        print(f"\n   ℹ️  The summary below covers the {stats.total} candidates generated after resuming")
+    
+    # Second applications for a share of the candidates (profile's multi_application_rate)
+    extra = int(round(inserted['candidates'] * profile['multi_application_rate']))
+    if extra:
+        print(f"\n➕ Adding a second application for {extra} candidates "
+              f"({profile['multi_application_rate']:.0%})...")
+        with instr.stage('multi_applications'):
+            inserted_extra = add_multiple_applications(args.db, extra, seed, writer)
+        for table, count in inserted_extra.items():
+            inserted[table] = inserted.get(table, 0) + count
+        print(f"   ✅ {inserted_extra['applications']} applications added")
+    
+    if probe is not None:
+        probe.stop()
+        probe.print_report()
     
     # Print summary
-    print_summary(candidates)
+    with instr.stage('print_summary'):
+        print_summary(stats)
+    
+    if instr.enabled:
+        instr.count('candidates', stats.total)
+        instr.count('eligible', stats.eligible)
+        for table, count in inserted.items():
+            instr.count(f'inserted.{table}', count)
+        if writer is not None:
+            for name, value in writer.report().items():
+                instr.count(f'live.{name}', value)
+        report_path = instr.write(args.instrument, args.trace_format)
+        instrumentation.disable()
+        print(f"\n🔬 Instrumentation report ({args.trace_format}): {report_path}")
     
     print("\n✅ Data generation complete!")
     print("   You can now view the candidates in your dashboard")
     print("\n💡 Next steps:")
-    print("   1. Restart your backend server")
-    print("   2. Refresh your dashboard")
-    print("   3. View the realistic candidate data")
+    if args.live:
+        print("   1. Refresh your dashboard (the backend kept serving; no restart needed)")
+        print("   2. View the realistic candidate data")
+    else:
+        print("   1. Restart your backend server")
+        print("   2. Refresh your dashboard")
+        print("   3. View the realistic candidate data")
 
 if __name__ == "__main__":
     main()
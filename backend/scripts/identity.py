@@ -0,0 +1,99 @@
+"""
+Identity Allocator
+- Unique emails and phone numbers in O(1) per candidate, with no set of
+  everything handed out so far
+- Emails: a counter per base address (e.g. sarah.johnson@gmail.com). The
+  first use gets the base, the n-th gets sarah.johnson{n}@gmail.com. Base
+  local parts are letters and dots only, so (base, n) -> address is
+  injective and addresses never collide. Memory is bounded by the number of
+  distinct bases (names x formats x domains), not by the population
+- Phones: sequence index k -> (A * k + B) mod M, a bijection over all
+  M = 800 x 800 x 9000 +1-AAA-EEE-NNNN numbers, so k < M never repeats
+- Names come from the name pools and repeat, as in a real population
+- Append runs prime the counters from the database (reserve()), one grouped
+  lookup per base the first time it shows up, so new addresses continue
+  after the ones already stored instead of probing for a free suffix
+"""
+
+# Phone number space: area code 200-999, exchange 200-999, line 1000-9999
+PHONE_AREA_CODES = 800
+PHONE_EXCHANGES = 800
+PHONE_LINES = 9000
+PHONE_SPACE = PHONE_AREA_CODES * PHONE_EXCHANGES * PHONE_LINES
+
+# Multiplier coprime to PHONE_SPACE (= 2^13 * 3^2 * 5^7), so the map is a bijection
+PHONE_MULTIPLIER = 2654435761
+PHONE_INCREMENT = 1234567
+
+def numbered_email(base_email, number):
+    """The number-th address of a base (the base itself is the first)"""
+    if number == 1:
+        return base_email
+    local, domain = base_email.split('@')
+    return f"{local}{number}@{domain}"
+
+def split_email(email):
+    """(base address, number) of an address made by numbered_email()"""
+    local, domain = email.split('@')
+    stem = local.rstrip('0123456789')
+    digits = local[len(stem):]
+    if not digits:
+        return email, 1
+    return f"{stem}@{domain}", int(digits)
+
+class IdentityAllocator:
+    """
+    Hands out unique emails and phones for one generation stream
+    `offset` continues the phone sequence (e.g. after the candidates already
+    in the database), so appended runs do not reuse numbers; `email_counts`
+    restores the counters of an interrupted run (see checkpoint.py)
+    """
+
+    def __init__(self, offset=0, email_counts=None):
+        self.email_counts = dict(email_counts or {})
+        self.sequence = offset
+        self.changed = set()
+
+    def email(self, base_email):
+        """Unique address for a base address without digits in its local part"""
+        count = self.email_counts.get(base_email, 0) + 1
+        self.email_counts[base_email] = count
+        self.changed.add(base_email)
+        if count > 1 and base_email.split('@')[0][-1:].isdigit():
+            raise ValueError(f"Base email local part must not end in a digit: {base_email}")
+        return numbered_email(base_email, count)
+
+    def unseen(self, base_emails):
+        """The bases this allocator has no counter for yet"""
+        return {base_email for base_email in base_emails if base_email not in self.email_counts}
+
+    def reserve(self, counts):
+        """
+        Skip addresses that exist elsewhere: {base: n} makes the next
+        address of each base number n + 1 (at least)
+        """
+        for base_email, count in counts.items():
+            current = self.email_counts.get(base_email)
+            if current is None or count > current:
+                self.email_counts[base_email] = max(count, current or 0)
+                self.changed.add(base_email)
+
+    def phone(self):
+        """Next phone number in the permuted sequence"""
+        if self.sequence >= PHONE_SPACE:
+            raise ValueError(f"Phone number space exhausted ({PHONE_SPACE:,} numbers)")
+        value = (PHONE_MULTIPLIER * self.sequence + PHONE_INCREMENT) % PHONE_SPACE
+        self.sequence += 1
+        value, line = divmod(value, PHONE_LINES)
+        area_code, exchange = divmod(value, PHONE_EXCHANGES)
+        return f"+1-{200 + area_code}-{200 + exchange}-{1000 + line}"
+
+    def allocate(self, base_email):
+        """(email, phone) for one candidate"""
+        return self.email(base_email), self.phone()
+
+    def take_changes(self):
+        """{base email: count} for the counters changed since the last call"""
+        changes = {base_email: self.email_counts[base_email] for base_email in self.changed}
+        self.changed = set()
+        return changes
@@ -0,0 +1,249 @@
+"""
+Seeding Instrumentation
+- Off by default: active() returns a no-op recorder whose stage() hands back
+  one shared null context manager, so instrumented code costs a method call
+- enable() installs a Recorder that keeps per-stage durations (stages nest),
+  counters, and optionally cProfile stats and tracemalloc memory per stage
+- Reports are written as structured JSON or as a Chrome trace file
+  (open in chrome://tracing or https://ui.perfetto.dev)
+"""
+
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+# Individual spans kept for the Chrome trace; aggregates are always complete
+MAX_TRACE_EVENTS = 100000
+
+PROFILE_TOP_N = 25
+MEMORY_TOP_N = 15
+
+_NULL_STAGE = contextlib.nullcontext()
+
+class NullRecorder:
+    """Disabled instrumentation: every hook is a no-op"""
+
+    enabled = False
+
+    def stage(self, name):
+        return _NULL_STAGE
+
+    def count(self, name, value=1):
+        pass
+
+    def timed_iter(self, name, iterable):
+        return iterable
+
+class Recorder:
+    """Collects stage timings, counters and optional profiles for one run"""
+
+    enabled = True
+
+    def __init__(self, profile=False, trace_memory=False):
+        self.start_ns = time.perf_counter_ns()
+        self.created_at = datetime.now()
+        self.stages = {}
+        self.counters = {}
+        self.events = []
+        self.dropped_events = 0
+        self.depth = 0
+        self.memory = {}
+        self.trace_memory = trace_memory
+        self.profiler = cProfile.Profile() if profile else None
+        self.end_ns = None
+
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.profiler is not None:
+            self.profiler.enable()
+
+    def _record(self, name, start_ns, duration_ns, calls=1):
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = {'calls': 0, 'total_ns': 0, 'min_ns': None, 'max_ns': 0}
+        stage['calls'] += calls
+        stage['total_ns'] += duration_ns
+        if stage['min_ns'] is None or duration_ns < stage['min_ns']:
+            stage['min_ns'] = duration_ns
+        stage['max_ns'] = max(stage['max_ns'], duration_ns)
+
+        if start_ns is not None:
+            if len(self.events) < MAX_TRACE_EVENTS:
+                self.events.append((name, start_ns - self.start_ns, duration_ns, self.depth))
+            else:
+                self.dropped_events += 1
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time a block; nested stages show up nested in the Chrome trace"""
+        self.depth += 1
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration_ns = time.perf_counter_ns() - start_ns
+            self.depth -= 1
+            self._record(name, start_ns, duration_ns)
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                memory = self.memory.setdefault(name, {'current_bytes': 0, 'peak_bytes': 0})
+                memory['current_bytes'] = current
+                memory['peak_bytes'] = max(memory['peak_bytes'], peak)
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def timed_iter(self, name, iterable):
+        """
+        Pass items through, accumulating the time spent producing them
+        (one aggregate stage: per-item spans would swamp the trace)
+        """
+        total_ns = 0
+        items = 0
+        iterator = iter(iterable)
+        first_ns = time.perf_counter_ns()
+        try:
+            while True:
+                start_ns = time.perf_counter_ns()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    total_ns += time.perf_counter_ns() - start_ns
+                    break
+                total_ns += time.perf_counter_ns() - start_ns
+                items += 1
+                yield item
+        finally:
+            self._record(name, None, total_ns)
+            self.stages[name]['items'] = items
+            self.stages[name]['span_ns'] = time.perf_counter_ns() - first_ns
+
+    def finish(self):
+        """Stop profilers; safe to call more than once"""
+        if self.end_ns is None:
+            self.end_ns = time.perf_counter_ns()
+            if self.profiler is not None:
+                self.profiler.disable()
+
+    def profile_summary(self):
+        """Top functions by cumulative time from cProfile"""
+        if self.profiler is None:
+            return None
+        stats = pstats.Stats(self.profiler, stream=io.StringIO())
+        stats.sort_stats('cumulative')
+        rows = []
+        for func in stats.fcn_list[:PROFILE_TOP_N]:
+            primitive_calls, calls, total_time, cumulative_time, _ = stats.stats[func]
+            filename, line, function = func
+            rows.append({
+                'function': f"{os.path.basename(filename)}:{line}({function})",
+                'calls': calls,
+                'total_seconds': round(total_time, 6),
+                'cumulative_seconds': round(cumulative_time, 6),
+            })
+        return rows
+
+    def memory_summary(self):
+        """Per-stage traced memory plus the top allocation sites"""
+        if not self.trace_memory or not tracemalloc.is_tracing():
+            return None
+        snapshot = tracemalloc.take_snapshot()
+        top = []
+        for stat in snapshot.statistics('lineno')[:MEMORY_TOP_N]:
+            frame = stat.traceback[0]
+            top.append({
+                'location': f"{os.path.basename(frame.filename)}:{frame.lineno}",
+                'size_bytes': stat.size,
+                'count': stat.count,
+            })
+        current, peak = tracemalloc.get_traced_memory()
+        return {'current_bytes': current, 'peak_bytes': peak, 'stages': self.memory, 'top_allocations': top}
+
+    def report(self):
+        """Structured report (durations in seconds)"""
+        self.finish()
+        stages = {}
+        for name, stage in self.stages.items():
+            entry = {
+                'calls': stage['calls'],
+                'total_seconds': round(stage['total_ns'] / 1e9, 6),
+                'min_seconds': round((stage['min_ns'] or 0) / 1e9, 6),
+                'max_seconds': round(stage['max_ns'] / 1e9, 6),
+            }
+            if 'items' in stage:
+                entry['items'] = stage['items']
+                entry['span_seconds'] = round(stage['span_ns'] / 1e9, 6)
+            stages[name] = entry
+
+        report = {
+            'created_at': self.created_at.isoformat(timespec='seconds'),
+            'wall_seconds': round((self.end_ns - self.start_ns) / 1e9, 6),
+            'stages': stages,
+            'counters': dict(self.counters),
+        }
+        if self.dropped_events:
+            report['dropped_trace_events'] = self.dropped_events
+        profile = self.profile_summary()
+        if profile is not None:
+            report['profile'] = profile
+        memory = self.memory_summary()
+        if memory is not None:
+            report['memory'] = memory
+        return report
+
+    def chrome_trace(self):
+        """Chrome trace event format: complete ('X') events plus final counters"""
+        report = self.report()
+        pid = os.getpid()
+        tid = threading.get_ident()
+        events = [
+            {'name': name, 'ph': 'X', 'ts': start_ns / 1000, 'dur': duration_ns / 1000,
+             'pid': pid, 'tid': tid, 'args': {'depth': depth}}
+            for name, start_ns, duration_ns, depth in self.events
+        ]
+        end_us = (self.end_ns - self.start_ns) / 1000
+        for name, value in self.counters.items():
+            events.append({'name': name, 'ph': 'C', 'ts': end_us, 'pid': pid, 'tid': tid,
+                           'args': {'value': value}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': report}
+
+    def write(self, path, fmt='json'):
+        """Write the report as 'json' or 'chrome'; returns the path"""
+        document = self.chrome_trace() if fmt == 'chrome' else self.report()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(document, f, indent=None if fmt == 'chrome' else 2)
+        os.replace(tmp_path, path)
+        if self.profiler is not None:
+            self.profiler.dump_stats(f"{os.path.splitext(path)[0]}.prof")
+        return path
+
+_active = NullRecorder()
+
+def active():
+    """The current recorder (a NullRecorder unless enable() was called)"""
+    return _active
+
+def enable(profile=False, trace_memory=False):
+    """Install and return a Recorder for this process"""
+    global _active
+    _active = Recorder(profile=profile, trace_memory=trace_memory)
+    return _active
+
+def disable():
+    """Stop recording; returns the recorder that was active"""
+    global _active
+    recorder = _active
+    if recorder.enabled:
+        recorder.finish()
+        if recorder.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+    _active = NullRecorder()
+    return recorder
@@ -0,0 +1,250 @@
+"""
+Live (WAL) Writer
+- Seeds while the Node backend keeps serving: the database is switched to
+  WAL (persistent), so readers never wait for the writer, and rows are
+  written in short transactions bounded by a time budget
+- Each transaction writes one chunk of candidates, sized adaptively so
+  that it takes about the budget; candidates are generated between
+  transactions, not while holding the lock
+- The writer holds the lock for at most `lock_share` of the wall time: after
+  each transaction it stays idle long enough for the backend's writes
+  (whose busy handler polls every ~100 ms) to get in
+- The write lock is taken with BEGIN IMMEDIATE; SQLITE_BUSY (another
+  writer, e.g. the backend) is retried with capped exponential backoff and
+  jitter instead of SQLite's blocking busy handler
+- Reports the lock time the writer caused (how long each transaction held
+  the write lock, which is what the backend's writes can queue behind) and
+  the time it spent waiting for the lock itself
+- ReadProbe: a thread that runs dashboard queries on its own connection
+  during the load and records their latency
+- Used by generate_candidates_v2.py --live
+"""
+
+import itertools
+import random
+import sqlite3
+import threading
+import time
+
+# Per-transaction time budget and the backoff cap for SQLITE_BUSY retries
+DEFAULT_BUDGET_MS = 50
+DEFAULT_MAX_BACKOFF_MS = 250
+# Largest share of wall time the writer may hold the write lock
+DEFAULT_LOCK_SHARE = 0.5
+BUSY_INITIAL_BACKOFF_MS = 5
+# A statement that stays busy this long is reported as an error
+BUSY_GIVE_UP_SECONDS = 30
+
+# Candidates per transaction: starts here and adapts so that writing one
+# chunk takes about the budget (generation happens outside the transaction)
+LIVE_INITIAL_CHUNK = 50
+LIVE_MIN_CHUNK = 5
+LIVE_MAX_CHUNK = 5000
+
+# Connection settings for the live load (journal_mode is set by connect()
+# and stays WAL afterwards; these are restored when the load ends)
+LIVE_PRAGMAS = {
+    'synchronous': 'NORMAL',
+    'cache_size': -65536,  # 64 MB page cache (negative = KiB)
+    'temp_store': 'MEMORY',
+}
+
+# Dashboard reads timed by ReadProbe: (name, sql)
+READ_PROBE_QUERIES = [
+    ('role_overview', "SELECT * FROM summary_role_overview"),
+    ('daily_applications', """
+        SELECT DATE(applied_at) AS date, COUNT(*) AS count
+        FROM applications
+        WHERE applied_at >= DATE('now', '-90 days')
+        GROUP BY DATE(applied_at)
+    """),
+    ('latest_applications', """
+        SELECT a.application_id, c.name, a.status, a.applied_at
+        FROM applications a JOIN candidates c ON c.candidate_id = a.candidate_id
+        ORDER BY a.application_id DESC LIMIT 50
+    """),
+]
+
+def is_busy(error):
+    """True for SQLITE_BUSY / SQLITE_LOCKED errors"""
+    message = str(error).lower()
+    return isinstance(error, sqlite3.OperationalError) and ('locked' in message or 'busy' in message)
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list (0 for an empty list)"""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class LiveWriter:
+    """
+    Short, time-bounded write transactions with SQLITE_BUSY backoff
+    connect() opens the writing connection (WAL, no built-in busy wait),
+    chunks() sizes the work per transaction and begin() / commit() bracket
+    each transaction
+    """
+
+    def __init__(self, budget_ms=DEFAULT_BUDGET_MS, max_backoff_ms=DEFAULT_MAX_BACKOFF_MS,
+                 lock_share=DEFAULT_LOCK_SHARE):
+        if budget_ms <= 0:
+            raise ValueError("Transaction budget must be positive")
+        if not 0 < lock_share <= 1:
+            raise ValueError("Lock share must be in (0, 1]")
+        self.budget = budget_ms / 1000
+        self.max_backoff = max_backoff_ms / 1000
+        self.lock_share = lock_share
+        self.conn = None
+        self.started = None
+        self.idle_until = None
+        self.idle_time = 0.0
+        self.hold_times = []
+        self.busy_retries = 0
+        self.busy_wait = 0.0
+        self.chunk_size = LIVE_INITIAL_CHUNK
+        # Jitter only; never touches the seeded generation RNGs
+        self.jitter = random.Random()
+
+    def connect(self, db_path):
+        """Autocommit connection in WAL mode that fails fast on SQLITE_BUSY"""
+        self.conn = sqlite3.connect(db_path, isolation_level=None, timeout=0)
+        mode = self.retry(lambda: self.conn.execute("PRAGMA journal_mode = WAL").fetchone()[0])
+        if mode.lower() != 'wal':
+            raise RuntimeError(f"Could not switch {db_path} to WAL (journal_mode is {mode})")
+        return self.conn
+
+    def retry(self, operation):
+        """Run operation(), backing off while the database is busy"""
+        delay = BUSY_INITIAL_BACKOFF_MS / 1000
+        waited = 0.0
+        while True:
+            try:
+                return operation()
+            except sqlite3.OperationalError as e:
+                if not is_busy(e) or waited >= BUSY_GIVE_UP_SECONDS:
+                    raise
+            pause = delay * self.jitter.uniform(0.5, 1.0)
+            time.sleep(pause)
+            waited += pause
+            self.busy_retries += 1
+            self.busy_wait += pause
+            delay = min(delay * 2, self.max_backoff)
+
+    def begin(self):
+        """
+        Take the write lock (BEGIN IMMEDIATE) and start the budget clock,
+        after idling out the rest of the previous transaction's lock share
+        """
+        if self.idle_until is not None:
+            pause = self.idle_until - time.perf_counter()
+            if pause > 0:
+                time.sleep(pause)
+                self.idle_time += pause
+        self.retry(lambda: self.conn.execute("BEGIN IMMEDIATE"))
+        self.started = time.perf_counter()
+
+    def commit(self):
+        """
+        Commit and record how long the write lock was held; the next chunk
+        is resized towards the budget (at most halved or doubled per step)
+        """
+        self.retry(lambda: self.conn.execute("COMMIT"))
+        released = time.perf_counter()
+        held = released - self.started
+        self.hold_times.append(held)
+        self.started = None
+        self.idle_until = released + held * (1 / self.lock_share - 1)
+        ratio = min(2.0, max(0.5, self.budget / max(held, 1e-6)))
+        self.chunk_size = min(LIVE_MAX_CHUNK, max(LIVE_MIN_CHUNK, int(self.chunk_size * ratio)))
+
+    def chunks(self, items):
+        """Lists of up to chunk_size items (re-read for every chunk)"""
+        iterator = iter(items)
+        while True:
+            chunk = list(itertools.islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def report(self):
+        """Lock statistics in milliseconds"""
+        return {
+            'transactions': len(self.hold_times),
+            'lock_hold_total_ms': sum(self.hold_times) * 1000,
+            'lock_hold_p50_ms': percentile(self.hold_times, 0.50) * 1000,
+            'lock_hold_p95_ms': percentile(self.hold_times, 0.95) * 1000,
+            'lock_hold_max_ms': max(self.hold_times, default=0) * 1000,
+            'busy_retries': self.busy_retries,
+            'busy_wait_ms': self.busy_wait * 1000,
+            'idle_ms': self.idle_time * 1000,
+        }
+
+    def print_report(self, title="Live writer"):
+        """Print report() for the run log"""
+        report = self.report()
+        print(f"\n🔒 {title}: {report['transactions']} transactions "
+              f"(budget {self.budget * 1000:.0f} ms)")
+        print(f"   Write lock held: {report['lock_hold_total_ms']:,.0f} ms total, "
+              f"p50 {report['lock_hold_p50_ms']:.1f} ms, p95 {report['lock_hold_p95_ms']:.1f} ms, "
+              f"max {report['lock_hold_max_ms']:.1f} ms")
+        print(f"   Waited for the lock: {report['busy_wait_ms']:,.0f} ms over {report['busy_retries']} "
+              f"SQLITE_BUSY retries; idled {report['idle_ms']:,.0f} ms to keep the lock share "
+              f"<= {self.lock_share:.0%}")
+
+class ReadProbe(threading.Thread):
+    """
+    Background reader: runs READ_PROBE_QUERIES every `interval_ms` on its
+    own connection and records each query's latency (and errors)
+    """
+
+    def __init__(self, db_path, interval_ms=250, queries=READ_PROBE_QUERIES):
+        super().__init__(daemon=True)
+        self.db_path = db_path
+        self.interval = interval_ms / 1000
+        self.queries = queries
+        self.latencies = {name: [] for name, _ in queries}
+        self.errors = 0
+        self.last_error = None
+        self.stopped = threading.Event()
+
+    def run(self):
+        conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, timeout=BUSY_GIVE_UP_SECONDS)
+        try:
+            while not self.stopped.is_set():
+                for name, sql in self.queries:
+                    start = time.perf_counter()
+                    try:
+                        conn.execute(sql).fetchall()
+                    except sqlite3.Error as e:
+                        self.errors += 1
+                        self.last_error = f"{name}: {e}"
+                        continue
+                    self.latencies[name].append(time.perf_counter() - start)
+                self.stopped.wait(self.interval)
+        finally:
+            conn.close()
+
+    def stop(self):
+        """Stop the probe and wait for the thread to finish"""
+        self.stopped.set()
+        self.join()
+
+    def report(self):
+        """Per-query latency statistics in milliseconds"""
+        return {
+            name: {
+                'reads': len(values),
+                'p50_ms': percentile(values, 0.50) * 1000,
+                'p95_ms': percentile(values, 0.95) * 1000,
+                'max_ms': max(values, default=0) * 1000,
+            }
+            for name, values in self.latencies.items()
+        }
+
+    def print_report(self):
+        """Print report() for the run log"""
+        failed = f"{self.errors} failed reads" + (f", last: {self.last_error}" if self.last_error else "")
+        print(f"\n📖 Read latency during the load ({failed}):")
+        for name, stats in self.report().items():
+            print(f"   {name:22} {stats['reads']:6} reads  p50 {stats['p50_ms']:7.1f} ms  "
+                  f"p95 {stats['p95_ms']:7.1f} ms  max {stats['max_ms']:7.1f} ms")
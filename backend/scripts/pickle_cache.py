@@ -0,0 +1,57 @@
+"""
+Pickle Cache for Parsed CSV Sources
+- Shared by scoring.py (role catalog) and question_bank.py (question bank)
+- One pickle per source file under backend/scripts/.cache/ (ignored), keyed
+  by a format version plus the source's path, mtime and size, so an edited
+  CSV or a layout change is rebuilt instead of read back stale
+- Best effort: unreadable or stale caches are ignored and a read-only
+  checkout just parses the CSV every run
+"""
+
+import os
+import pickle
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '.cache')
+
+def cache_path(source_path):
+    """Pickle path for a source file (named after it)"""
+    name = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(CACHE_DIR, f'{name}.pkl')
+
+def source_key(source_path, version):
+    stat = os.stat(source_path)
+    return (version, os.path.abspath(source_path), stat.st_mtime_ns, stat.st_size)
+
+def load_cached(path, key):
+    """Cached value, or None when missing, unreadable or stale"""
+    try:
+        with open(path, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(cached, dict) or cached.get('key') != key:
+        return None
+    return cached.get('value')
+
+def save_cached(path, key, value):
+    """Write through a temp file so concurrent readers never see a partial pickle"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'key': key, 'value': value}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+def load_or_build(source_path, version, build, use_cache=True):
+    """build(source_path) through the cache; use_cache=False always rebuilds and writes nothing"""
+    if not use_cache:
+        return build(source_path)
+    key = source_key(source_path, version)
+    path = cache_path(source_path)
+    value = load_cached(path, key)
+    if value is None:
+        value = build(source_path)
+        save_cached(path, key, value)
+    return value
@@ -0,0 +1,250 @@
+"""
+Generator Scale and Distribution Profiles
+- A profile sets the load shape of a seed run:
+    total_candidates        total volume (null: the hand-tuned ~1005 distribution)
+    role_distribution       "default", "uniform", {"zipf": s, "hot_roles": [...]}
+                            or {"weights": {"<role_id>": weight, ...}}
+    quality_mix             weights for excellent/good/average/poor
+    posted_days_ago         [min, max] age of the job postings (applications
+                            fall between the posting date and now)
+    multi_application_rate  share of candidates that also apply to one more role
+    time_series             null, or arrival-model settings (see traffic.py) to
+                            generate a multi-year stream instead of a fixed
+                            volume; the role mix and quality mix still apply
+- Built-in profiles: default, smoke, 1m, 10m-hot-roles, 3y-history (names are case-insensitive,
+  so "1M" works); JSON files (and YAML files when PyYAML is installed) can
+  define more, optionally starting from a built-in with "extends"
+- Used by generate_candidates_v2.py --data-profile NAME|PATH
+"""
+
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+
+import traffic
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None
+
+QUALITY_TIERS = ['excellent', 'good', 'average', 'poor']
+
+# Applications are spread over weeks 1, 2-3 and 4+ after posting, so postings
+# must be at least 22 days old (see generate_application_date)
+MIN_POSTED_DAYS_AGO = 22
+
+DEFAULT_PROFILE = {
+    'name': 'default',
+    'description': "Hand-tuned ~1005 candidates (get_candidate_distribution), postings 30-60 days old",
+    'total_candidates': None,
+    'role_distribution': 'default',
+    'quality_mix': {'excellent': 0.25, 'good': 0.50, 'average': 0.20, 'poor': 0.05},
+    'posted_days_ago': [30, 60],
+    'multi_application_rate': 0.0,
+    'time_series': None,
+}
+
+BUILTIN_PROFILES = {
+    'default': {},
+    'smoke': {
+        'description': "200 candidates for quick end-to-end checks",
+        'total_candidates': 200,
+        'multi_application_rate': 0.1,
+    },
+    '1m': {
+        'description': "1M candidates, default role mix, postings up to 6 months old",
+        'total_candidates': 1000000,
+        'posted_days_ago': [30, 180],
+        'multi_application_rate': 0.2,
+    },
+    '10m-hot-roles': {
+        'description': "10M candidates, Zipf skew towards a few hot roles, a year of postings",
+        'total_candidates': 10000000,
+        'role_distribution': {'zipf': 1.1, 'hot_roles': [1, 3, 6, 2]},
+        'quality_mix': {'excellent': 0.15, 'good': 0.45, 'average': 0.30, 'poor': 0.10},
+        'posted_days_ago': [30, 365],
+        'multi_application_rate': 0.15,
+    },
+    '3y-history': {
+        'description': "Three years of diurnal/weekly traffic with posting spikes, ~150 applications/day",
+        'role_distribution': {'zipf': 0.8, 'hot_roles': [1, 3, 6]},
+        'time_series': {'years': 3, 'applications_per_day': 150},
+    },
+}
+
+def require_yaml():
+    """Fail with an actionable message when PyYAML is not installed"""
+    if yaml is None:
+        raise ImportError("YAML profiles require PyYAML: pip install pyyaml (or use a .json profile)")
+
+def read_profile_file(path):
+    """Parse a .json, .yaml or .yml profile file into a dict"""
+    with open(path) as f:
+        if path.endswith(('.yaml', '.yml')):
+            require_yaml()
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: a profile must be a mapping")
+    data.setdefault('name', os.path.splitext(os.path.basename(path))[0])
+    data.setdefault('description', f"Profile file {path}")
+    return data
+
+def resolve_profile(data, seen=()):
+    """Merge a profile over its base ("extends", default: the default profile)"""
+    base_name = str(data.get('extends', 'default')).lower()
+    if base_name in seen:
+        raise ValueError(f"Profile inheritance cycle through '{base_name}'")
+    if base_name not in BUILTIN_PROFILES:
+        raise ValueError(f"Unknown base profile '{base_name}' (built-in: {', '.join(BUILTIN_PROFILES)})")
+    if base_name == 'default':
+        base = dict(DEFAULT_PROFILE)
+    else:
+        base = resolve_profile(dict(BUILTIN_PROFILES[base_name], name=base_name), seen + (base_name,))
+    profile = dict(base)
+    profile.update({key: value for key, value in data.items() if key != 'extends'})
+    return profile
+
+def load_profile(name_or_path='default'):
+    """
+    Built-in profile by name, or a profile file by path; returns the
+    validated profile with every key filled in
+    Raises ValueError for an unknown name or invalid settings
+    """
+    key = str(name_or_path).lower()
+    if key in BUILTIN_PROFILES:
+        data = dict(BUILTIN_PROFILES[key], name=key)
+        if key != 'default':
+            data.setdefault('extends', 'default')
+    elif os.path.exists(name_or_path):
+        data = read_profile_file(name_or_path)
+    else:
+        raise ValueError(f"Unknown profile '{name_or_path}' (built-in: {', '.join(BUILTIN_PROFILES)}, "
+                         f"or a path to a .json/.yaml file)")
+    profile = resolve_profile(data)
+    validate_profile(profile)
+    return profile
+
+def validate_profile(profile):
+    """Raise ValueError describing the first invalid setting"""
+    unknown = set(profile) - set(DEFAULT_PROFILE)
+    if unknown:
+        raise ValueError(f"Unknown profile keys: {', '.join(sorted(unknown))}")
+
+    total = profile['total_candidates']
+    if total is not None and (not isinstance(total, int) or total < 0):
+        raise ValueError(f"total_candidates must be a non-negative integer or null, got {total!r}")
+
+    distribution = profile['role_distribution']
+    if isinstance(distribution, dict):
+        if 'zipf' in distribution:
+            if not isinstance(distribution['zipf'], (int, float)) or distribution['zipf'] < 0:
+                raise ValueError("role_distribution.zipf must be a non-negative exponent")
+            if not all(isinstance(role_id, int) for role_id in distribution.get('hot_roles', [])):
+                raise ValueError("role_distribution.hot_roles must be a list of role ids")
+        elif 'weights' in distribution:
+            weights = distribution['weights']
+            if not isinstance(weights, dict) or any(
+                    not isinstance(w, (int, float)) or w < 0 for w in weights.values()):
+                raise ValueError("role_distribution.weights must map role ids to non-negative numbers")
+        else:
+            raise ValueError("role_distribution must have 'zipf' or 'weights'")
+    elif distribution not in ('default', 'uniform'):
+        raise ValueError(f"role_distribution must be 'default', 'uniform' or a mapping, got {distribution!r}")
+
+    mix = profile['quality_mix']
+    if (not isinstance(mix, dict) or set(mix) - set(QUALITY_TIERS)
+            or any(not isinstance(w, (int, float)) or w < 0 for w in mix.values())
+            or sum(mix.values()) <= 0):
+        raise ValueError(f"quality_mix must give non-negative weights for {', '.join(QUALITY_TIERS)}")
+
+    posted = profile['posted_days_ago']
+    if (not isinstance(posted, (list, tuple)) or len(posted) != 2
+            or not all(isinstance(days, int) for days in posted)
+            or not MIN_POSTED_DAYS_AGO <= posted[0] <= posted[1]):
+        raise ValueError(f"posted_days_ago must be [min, max] days with {MIN_POSTED_DAYS_AGO} <= min <= max")
+
+    rate = profile['multi_application_rate']
+    if not isinstance(rate, (int, float)) or not 0 <= rate <= 1:
+        raise ValueError("multi_application_rate must be between 0 and 1")
+
+    if profile['time_series'] is not None:
+        profile['time_series'] = traffic.resolve_time_series(profile['time_series'])
+
+def quality_weights(profile):
+    """Weights in QUALITY_TIERS order"""
+    return [profile['quality_mix'].get(tier, 0) for tier in QUALITY_TIERS]
+
+def role_weights(profile, role_ids, base_distribution):
+    """
+    Relative weight per role id (strings, like get_candidate_distribution())
+    Zipf ranks the hot roles first (in the order given), then the rest by
+    their default popularity; rank k gets weight 1 / k**s
+    """
+    distribution = profile['role_distribution']
+    if distribution == 'default':
+        return {role_id: base_distribution.get(role_id, 0) for role_id in role_ids}
+    if distribution == 'uniform':
+        return {role_id: 1 for role_id in role_ids}
+    if 'weights' in distribution:
+        weights = {str(role_id): weight for role_id, weight in distribution['weights'].items()}
+        return {role_id: weights.get(role_id, 0) for role_id in role_ids}
+
+    hot = [str(role_id) for role_id in distribution.get('hot_roles', []) if str(role_id) in role_ids]
+    rest = sorted((role_id for role_id in role_ids if role_id not in hot),
+                  key=lambda role_id: (-base_distribution.get(role_id, 0), int(role_id)))
+    exponent = distribution['zipf']
+    return {role_id: 1 / (rank ** exponent) for rank, role_id in enumerate(hot + rest, start=1)}
+
+def apportion(total, weights):
+    """
+    Split total into integer counts proportional to weights (largest
+    remainder, ties broken by key order) so the counts sum to total exactly
+    """
+    weight_sum = sum(weights.values())
+    if weight_sum <= 0:
+        raise ValueError("Role weights sum to zero")
+    exact = {key: total * weight / weight_sum for key, weight in weights.items()}
+    counts = {key: int(value) for key, value in exact.items()}
+    remainders = sorted(weights, key=lambda key: -(exact[key] - counts[key]))
+    for key in remainders[:total - sum(counts.values())]:
+        counts[key] += 1
+    return counts
+
+def role_counts(profile, role_ids, base_distribution, total=None):
+    """
+    Candidates per role id for a profile
+    total overrides the profile's total_candidates; with neither, the
+    default distribution is returned unchanged
+    """
+    total = total if total is not None else profile['total_candidates']
+    if total is None and profile['role_distribution'] == 'default':
+        return {role_id: base_distribution.get(role_id, 0) for role_id in role_ids}
+    weights = role_weights(profile, role_ids, base_distribution)
+    if total is None:
+        total = sum(base_distribution.get(role_id, 0) for role_id in role_ids)
+    return apportion(total, weights)
+
+def describe_profile(profile):
+    """One-line summary for logs"""
+    total = profile['total_candidates']
+    distribution = profile['role_distribution']
+    if isinstance(distribution, dict):
+        distribution = (f"zipf s={distribution['zipf']}" if 'zipf' in distribution else "custom weights")
+    low, high = profile['posted_days_ago']
+    time_series = profile['time_series']
+    if time_series is not None:
+        volume = (f"{time_series['years']:g}-year stream at ~{time_series['applications_per_day']:g} "
+                  f"applications/day, {distribution} roles")
+    else:
+        volume = (f"{f'{total:,}' if total is not None else '~1005 (hand-tuned)'} candidates, "
+                  f"{distribution} roles, postings {low}-{high} days old")
+    return f"{profile['name']}: {volume}, {profile['multi_application_rate']:.0%} multi-application"
+
+def list_profiles():
+    """(name, profile) for every built-in profile"""
+    return [(name, load_profile(name)) for name in BUILTIN_PROFILES]
@@ -0,0 +1,207 @@
+"""
+Question Bank
+- The test questions of backend/data/csv/7_test_questions.csv (the same bank
+  as backend/data/testQuestions.js), loaded once per process into an index:
+    by_category      question indexes per test category, in CSV order
+    by_skill         question indexes per (category, normalized skill)
+    by_skill_key     inverted index: normalized validates_skills entry ->
+                     question indexes across all categories
+    category_points  points available per category
+    skill_masks      per question, a bitmask of its skills within its category
+- Question indexes are positions in `questions`; questions[i]['id'] is the
+  questionId the backend uses (numbered per category, as in testQuestions.js)
+- Each question: id, category, question, options, correct (option index),
+  points, skills (validates_skills, split on "|"); skill_keys holds the
+  normalized skills per question
+- The built bank is pickled under backend/scripts/.cache/, keyed by the CSV's
+  path, mtime and size (pickle_cache.py, shared with scoring.py's role catalog)
+- select_questions() mirrors getTestForJobTitle() in testQuestions.js with the
+  question counts of config/testConfig.js; select_covering() picks N
+  questions that cover a set of skills (greedy set cover on the bitmasks)
+"""
+
+import csv
+import os
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+
+import pickle_cache
+from skill_index import normalize_skill
+
+QUESTION_BANK_CSV = os.path.join(os.path.dirname(__file__), '../data/csv/7_test_questions.csv')
+
+# Bump when the QuestionBank layout changes so stale caches are ignored
+QUESTION_BANK_VERSION = 1
+
+OPTION_COLUMNS = ('option_1', 'option_2', 'option_3', 'option_4')
+
+# config/testConfig.js: questions per test, with role-specific overrides
+DEFAULT_MAX_QUESTIONS = 10
+ROLE_MAX_QUESTIONS = {
+    'Incident Response Analyst': 15,
+    'Digital Forensics Investigator': 15,
+    'Cybersecurity Architect': 12,
+    'Junior Security Control Assessor': 8,
+}
+
+_banks = {}
+
+def parse_question_row(row):
+    """Question dict for one CSV row"""
+    return {
+        'id': int(row['question_id']),
+        'category': row['test_category'],
+        'question': row['question'],
+        'options': [row[column] for column in OPTION_COLUMNS if row.get(column)],
+        'correct': int(row['correct_answer_index']),
+        'points': int(row['points']),
+        'skills': [skill.strip() for skill in row['validates_skills'].split('|') if skill.strip()],
+    }
+
+class QuestionBank:
+    """Questions plus their category and skill indexes (read-only)"""
+
+    def __init__(self, questions):
+        self.questions = questions
+        by_category = {}
+        by_skill = {}
+        by_skill_key = {}
+        skill_bits = {}
+        # Normalized validates_skills per question, for matching candidate skills
+        self.skill_keys = []
+        self.skill_masks = []
+        for index, question in enumerate(questions):
+            category = question['category']
+            keys = frozenset(normalize_skill(skill) for skill in question['skills'])
+            bits = skill_bits.setdefault(category, {})
+            mask = 0
+            for key in keys:
+                mask |= bits.setdefault(key, 1 << len(bits))
+                by_skill.setdefault((category, key), []).append(index)
+                by_skill_key.setdefault(key, []).append(index)
+            self.skill_keys.append(keys)
+            self.skill_masks.append(mask)
+            by_category.setdefault(category, []).append(index)
+
+        self.by_category = {category: tuple(indexes) for category, indexes in by_category.items()}
+        self.by_skill = {key: tuple(indexes) for key, indexes in by_skill.items()}
+        self.by_skill_key = {key: tuple(indexes) for key, indexes in by_skill_key.items()}
+        self.skill_bits = skill_bits
+        self.category_points = {
+            category: sum(questions[index]['points'] for index in indexes)
+            for category, indexes in self.by_category.items()
+        }
+        # Questions grouped by primary skill (validatesSkills[0]), groups in first-seen order
+        self.primary_groups = {}
+        for category, indexes in self.by_category.items():
+            groups = {}
+            for index in indexes:
+                groups.setdefault(questions[index]['skills'][0], []).append(index)
+            self.primary_groups[category] = tuple(tuple(group) for group in groups.values())
+
+    def category_questions(self, category):
+        """Question indexes of a test category (empty for an unknown one)"""
+        return self.by_category.get(category, ())
+
+    def skill_questions(self, skill, category=None):
+        """Question indexes that validate `skill`, in one category or all of them"""
+        key = normalize_skill(skill)
+        if category is None:
+            return self.by_skill_key.get(key, ())
+        return self.by_skill.get((category, key), ())
+
+    def points_total(self, question_indexes):
+        """Points available in a set of questions"""
+        return sum(self.questions[index]['points'] for index in question_indexes)
+
+    def skills_mask(self, category, skills):
+        """Bitmask of the given skills that the category's questions validate"""
+        bits = self.skill_bits.get(category, {})
+        mask = 0
+        for skill in skills:
+            mask |= bits.get(normalize_skill(skill), 0)
+        return mask
+
+    def select_covering(self, category, skills, count, rng=None):
+        """
+        Up to `count` question indexes of a category covering as many of
+        `skills` as possible: greedy set cover (each pick validates the most
+        still-uncovered skills), then topped up with other questions on the
+        requested skills and finally the rest of the category
+        Ties are broken in CSV order, or randomly with `rng` (a random.Random).
+        Skills the category never tests are ignored
+        """
+        masks = self.skill_masks
+        wanted = self.skills_mask(category, skills)
+        remaining = list(self.category_questions(category))
+        if rng is not None:
+            rng.shuffle(remaining)
+
+        selected = []
+        uncovered = wanted
+        while uncovered and len(selected) < count:
+            best = max(remaining, key=lambda index: (masks[index] & uncovered).bit_count())
+            if not masks[best] & uncovered:
+                break
+            selected.append(best)
+            remaining.remove(best)
+            uncovered &= ~masks[best]
+
+        if len(selected) < count:
+            remaining.sort(key=lambda index: not masks[index] & wanted)
+            selected.extend(remaining[:count - len(selected)])
+        return selected
+
+    def select_questions(self, category, max_questions=DEFAULT_MAX_QUESTIONS, rng=None):
+        """
+        Question indexes for one test, as getTestForJobTitle() picks them:
+        the whole category when it fits, otherwise max(1, max // skills)
+        questions per primary skill, topped up from the rest and trimmed
+        Shuffles with `rng` (a random.Random); without one the picks are in
+        CSV order (randomize: false)
+        """
+        indexes = self.category_questions(category)
+        if len(indexes) <= max_questions:
+            return list(indexes)
+
+        groups = self.primary_groups[category]
+        per_skill = max(1, max_questions // len(groups))
+
+        selected = []
+        for group in groups:
+            group = list(group)
+            if rng is not None:
+                rng.shuffle(group)
+            selected.extend(group[:per_skill])
+        if len(selected) < max_questions:
+            chosen = set(selected)
+            remaining = [index for index in indexes if index not in chosen]
+            if rng is not None:
+                rng.shuffle(remaining)
+            selected.extend(remaining[:max_questions - len(selected)])
+        return selected[:max_questions]
+
+def read_question_csv(path=QUESTION_BANK_CSV):
+    """Parse every question in the bank CSV"""
+    with open(path, newline='', encoding='utf-8') as f:
+        return [parse_question_row(row) for row in csv.DictReader(f)]
+
+def build_question_bank(path=QUESTION_BANK_CSV):
+    """Parse and index the bank CSV"""
+    return QuestionBank(read_question_csv(path))
+
+def load_question_bank(path=QUESTION_BANK_CSV, use_cache=True):
+    """
+    The indexed question bank, built once per process; across processes the
+    pickle cache is reused until the CSV changes. Shared - treat as read-only
+    """
+    bank = _banks.get(path)
+    if bank is None:
+        bank = _banks[path] = pickle_cache.load_or_build(
+            path, QUESTION_BANK_VERSION, build_question_bank, use_cache)
+    return bank
+
+def max_questions_for(job_title):
+    """Questions per test for a role title (testConfig.js)"""
+    return ROLE_MAX_QUESTIONS.get(job_title, DEFAULT_MAX_QUESTIONS)
@@ -0,0 +1,287 @@
+"""
+Shared Scoring Library
+- One role catalog for every script, loaded from
+  backend/data/csv/8_job_roles_detailed.csv (or the job_roles table) once per process
+- Each role is compiled up front: float weights plus a weightVector tuple
+  and its SkillIndex (see skill_index.py)
+- The compiled catalog is pickled under backend/scripts/.cache/ (pickle_cache.py),
+  keyed by the CSV's path, mtime and size, so later runs skip CSV parsing entirely
+- calculate_ai_score() and calculate_composite_score() live here;
+  generate_candidates_v2.py and add_multiple_applications.py both import them
+"""
+
+import csv
+import json
+import os
+import re
+import sys
+
+sys.path.append(os.path.dirname(__file__))
+
+import pickle_cache
+from skill_index import compile_role
+
+ROLE_CATALOG_CSV = os.path.join(os.path.dirname(__file__), '../data/csv/8_job_roles_detailed.csv')
+
+# Bump when the compiled role layout changes so stale caches are ignored
+CATALOG_VERSION = 3
+
+WEIGHT_KEYS = ('skills', 'knowledge', 'tasks', 'certifications', 'education')
+
+# Composite score weights per experience level
+COMPOSITE_WEIGHTS = {
+    'entry': {'ai': 0.4, 'test': 0.6},   # Test matters more for juniors
+    'mid': {'ai': 0.5, 'test': 0.5},     # Balanced
+    'senior': {'ai': 0.6, 'test': 0.4}   # Experience matters more
+}
+
+# Fallbacks for job_roles rows that are not in the catalog
+DEFAULT_WEIGHTS = {
+    'skills': 0.40,
+    'knowledge': 0.25,
+    'tasks': 0.20,
+    'certifications': 0.10,
+    'education': 0.05
+}
+DEFAULT_THRESHOLD = 60
+
+# Advisory notes in the CSV's certification names, e.g. "CSSLP (optional)",
+# "ISACA CISM (for governance alignment)" or vendor lists like
+# "(AWS/Azure/Google)"; acronyms like "(GCFA)" are kept
+CERT_NOTE_RE = re.compile(
+    r'\s*\((?:optional|preferred|desirable|nice-to-have|helpful|for |toward|formerly|e\.g\.|\w+/)[^)]*\)$',
+    re.IGNORECASE,
+)
+# Long certification names spelled the way every other role lists them
+CERT_ALIASES = {
+    'CompTIA Cybersecurity Analyst (CySA+)': 'CompTIA CySA+',
+}
+
+# The CSV's education cells end in an open-ended clause (", or a related
+# field.", ", or equivalent experience.") and carry notes like "(with cyber
+# focus)"; both are dropped and apostrophes straightened, as in the seeded
+# job_roles requirements
+EDUCATION_TAIL_RE = re.compile(r',?\s+or (?:a |an )?(?:related|equivalent)\b.*$', re.IGNORECASE)
+EDUCATION_NOTE_RE = re.compile(r'\s*\(with [^)]*\)', re.IGNORECASE)
+
+# Values the catalog CSV lacks, carried over from the get_job_roles() literal
+# this catalog replaced: roles 2-4 have blank weight_*, thresholdScore and
+# testCategory cells, roles 15/20 a truncated education ("Associate"), and
+# roles 6-10 list more education fields than the seeded requirements did
+ROLE_OVERRIDES = {
+    '2': {'weight_skills': '0.40', 'weight_knowledge': '0.30', 'weight_tasks': '0.20',
+          'weight_certifications': '0.05', 'weight_education': '0.05',
+          'thresholdScore': '60', 'testCategory': 'threat_analysis'},
+    '3': {'weight_skills': '0.45', 'weight_knowledge': '0.30', 'weight_tasks': '0.15',
+          'weight_certifications': '0.05', 'weight_education': '0.05',
+          'thresholdScore': '60', 'testCategory': 'defensive_cybersecurity'},
+    '4': {'weight_skills': '0.40', 'weight_knowledge': '0.30', 'weight_tasks': '0.20',
+          'weight_certifications': '0.05', 'weight_education': '0.05',
+          'thresholdScore': '65', 'testCategory': 'digital_forensics'},
+    '6': {'education': "Bachelor's degree in Cybersecurity, Computer Science, Information Technology"},
+    '7': {'education': "Bachelor's degree in Information Security, IT Management, Business Administration"},
+    '8': {'education': "Bachelor's degree in Information Security, Privacy Management, Law"},
+    '9': {'education': "Associate's or Bachelor's degree in Cybersecurity, Information Systems"},
+    '10': {'education': "Bachelor's degree in Cybersecurity, Computer Science, Information Technology"},
+    '15': {'education': "Associate's or Bachelor's degree in Information Technology, Networking, Cybersecurity"},
+    '20': {'education': "Associate's or Bachelor's degree in Digital Forensics, Cybersecurity, "
+                        "Information Technology"},
+}
+
+REQUIRED_COLUMNS = (
+    'id', 'title', 'skillKeywords', 'certifications', 'education',
+    'experienceMin', 'experienceMax', 'thresholdScore', 'testCategory',
+) + tuple(f'weight_{key}' for key in WEIGHT_KEYS)
+
+_catalogs = {}
+
+def split_list(value):
+    """Split a " | "-separated CSV cell into a list"""
+    return [item.strip() for item in value.split('|') if item.strip()]
+
+def clean_certification(name):
+    name = CERT_NOTE_RE.sub('', name)
+    return CERT_ALIASES.get(name, name)
+
+def clean_education(value):
+    value = value.strip().replace('\u2019', "'")
+    return EDUCATION_TAIL_RE.sub('', EDUCATION_NOTE_RE.sub('', value))
+
+def compile_catalog_role(role):
+    """Attach the precomputed weight vector and skill index to a role dict"""
+    role['weightVector'] = tuple(role['weights'][key] for key in WEIGHT_KEYS)
+    compile_role(role)
+    return role
+
+def parse_role_row(row):
+    """Convert one 8_job_roles_detailed.csv row (plus its ROLE_OVERRIDES) into a role dict"""
+    row = {**row, **ROLE_OVERRIDES.get(row.get('id'), {})}
+    missing = [column for column in REQUIRED_COLUMNS if not (row.get(column) or '').strip()]
+    if missing:
+        raise ValueError(f"Job role {row.get('id', '?')} is missing: {', '.join(missing)}")
+
+    return compile_catalog_role({
+        'id': row['id'],
+        'title': row['title'],
+        'skillKeywords': split_list(row['skillKeywords']),
+        'certifications': [clean_certification(c) for c in split_list(row['certifications'])],
+        'education': clean_education(row['education']),
+        'experienceRange': {'min': int(row['experienceMin']), 'max': int(row['experienceMax'])},
+        'weights': {key: float(row[f'weight_{key}']) for key in WEIGHT_KEYS},
+        'thresholdScore': int(row['thresholdScore']),
+        'testCategory': row['testCategory'],
+    })
+
+def read_role_csv(path=ROLE_CATALOG_CSV):
+    """Parse and compile every role in the catalog CSV"""
+    with open(path, newline='', encoding='utf-8') as f:
+        return [parse_role_row(row) for row in csv.DictReader(f)]
+
+def load_role_catalog(path=ROLE_CATALOG_CSV, use_cache=True):
+    """
+    Compiled role catalog (list of role dicts, in CSV order)
+    Loaded once per process; across processes the pickle cache is reused
+    until the CSV changes. Role dicts are shared - treat them as read-only
+    """
+    key = pickle_cache.source_key(path, CATALOG_VERSION)
+    roles = _catalogs.get(key)
+    if roles is None:
+        roles = _catalogs[key] = pickle_cache.load_or_build(path, CATALOG_VERSION, read_role_csv, use_cache)
+    return list(roles)
+
+def role_from_db_row(row, catalog=None):
+    """
+    Compiled role dict for a job_roles row
+    Skills, certifications, education and experience come from the row's
+    requirements JSON; weights and testCategory (not stored in the database)
+    come from the catalog; the threshold comes from min_ai_threshold
+    """
+    if catalog is None:
+        catalog = {role['id']: role for role in load_role_catalog()}
+    requirements = json.loads(row['requirements']) if row['requirements'] else {}
+    reference = catalog.get(str(row['role_id']), {})
+    return compile_catalog_role({
+        'id': str(row['role_id']),
+        'role_id': row['role_id'],
+        'title': row['title'],
+        'skillKeywords': requirements.get('skills', reference.get('skillKeywords', [])),
+        'certifications': requirements.get('certifications', reference.get('certifications', [])),
+        'education': requirements.get('education', reference.get('education', '')),
+        'experienceRange': requirements.get('experience', reference.get('experienceRange', {'min': 0, 'max': 50})),
+        'weights': reference.get('weights', DEFAULT_WEIGHTS),
+        'thresholdScore': row['min_ai_threshold'] or reference.get('thresholdScore', DEFAULT_THRESHOLD),
+        'testCategory': reference.get('testCategory'),
+    })
+
+def load_role_catalog_from_db(cursor):
+    """Compiled roles for every job_roles row: {role_id: role}"""
+    catalog = {role['id']: role for role in load_role_catalog()}
+    cursor.execute("SELECT * FROM job_roles ORDER BY role_id")
+    return {row['role_id']: role_from_db_row(row, catalog) for row in cursor.fetchall()}
+
+def check_education_match(candidate_education, job_education):
+    """Check if candidate education matches job requirement"""
+    # Simple matching - in production, use more sophisticated logic
+    candidate_lower = candidate_education.lower()
+    job_lower = job_education.lower()
+    
+    # Check for degree level match
+    if "bachelor" in job_lower and "bachelor" in candidate_lower:
+        return True
+    if "master" in job_lower and "master" in candidate_lower:
+        return True
+    if "associate" in job_lower and ("associate" in candidate_lower or "bachelor" in candidate_lower):
+        return True
+    
+    # Check for field match
+    fields = ["cybersecurity", "computer science", "information", "technology", "security"]
+    for field in fields:
+        if field in job_lower and field in candidate_lower:
+            return True
+    
+    return False
+
+def calculate_experience_match(candidate_years, job_range):
+    """Calculate how well candidate experience matches job requirements"""
+    min_years = job_range['min']
+    max_years = job_range['max']
+    
+    if min_years <= candidate_years <= max_years:
+        return 1.0  # Perfect match
+    elif candidate_years < min_years:
+        # Under-qualified
+        diff = min_years - candidate_years
+        return max(0.5, 1.0 - (diff * 0.15))
+    else:
+        # Over-qualified (not as bad as under-qualified)
+        diff = candidate_years - max_years
+        return max(0.7, 1.0 - (diff * 0.10))
+
+def estimate_task_capability(matched_skills, required_skills, experience_match, cert_match):
+    """
+    Estimate candidate's ability to perform job tasks
+    Based on: skills (50%), experience (30%), certifications (20%)
+    """
+    skill_factor = len(matched_skills) / max(len(required_skills), 1)
+    
+    task_capability = (
+        skill_factor * 0.5 +
+        experience_match * 0.3 +
+        cert_match * 0.2
+    )
+    
+    return task_capability
+
+def calculate_ai_score(candidate, job_role):
+    """
+    Calculate AI score using job-specific weights
+    Matches the exact logic from jobRoles.js
+    """
+    weights = job_role['weights']
+    required_skills = job_role['skillKeywords']
+    required_certs = job_role.get('certifications', [])
+    skill_index = compile_role(job_role)
+    
+    # 1. Skills match (using job's skills weight) - bitmask over the compiled role index
+    skill_mask = skill_index.mask(candidate['skills'])
+    matched_skills, missing_skills = skill_index.split(skill_mask)
+    skill_match = skill_index.matched_count(skill_mask) / max(len(required_skills), 1)
+    skill_score = skill_match * 100 * weights['skills']
+    
+    # 2. Experience/Knowledge match (using job's knowledge weight)
+    exp_match = calculate_experience_match(candidate['experience_years'], job_role['experienceRange'])
+    knowledge_score = exp_match * 100 * weights['knowledge']
+    
+    # 3. Tasks capability (using job's tasks weight)
+    cert_match = len(candidate['certifications']) / max(len(required_certs), 1) if required_certs else 0.5
+    task_capability = estimate_task_capability(matched_skills, required_skills, exp_match, cert_match)
+    task_score = task_capability * 100 * weights['tasks']
+    
+    # 4. Certifications match (using job's certifications weight)
+    cert_score = cert_match * 100 * weights['certifications']
+    
+    # 5. Education match (using job's education weight)
+    edu_match = 1.0 if check_education_match(candidate['education'], job_role['education']) else 0.5
+    edu_score = edu_match * 100 * weights['education']
+    
+    # Total AI score
+    ai_score = skill_score + knowledge_score + task_score + cert_score + edu_score
+    
+    # Store matched skills for later use
+    candidate['matched_skills'] = matched_skills
+    candidate['missing_skills'] = missing_skills
+    
+    return round(ai_score, 1)
+
+def composite_weights(experience_level):
+    """AI/test weights for an experience level (mid when unknown)"""
+    return COMPOSITE_WEIGHTS.get(experience_level, COMPOSITE_WEIGHTS['mid'])
+
+def calculate_composite_score(ai_score, test_score, experience_level):
+    """
+    Calculate composite score with experience-based weighting
+    """
+    w = composite_weights(experience_level)
+    composite = (ai_score * w['ai']) + (test_score * w['test'])
+    
+    return round(composite, 1)
@@ -0,0 +1,111 @@
+"""
+Compiled Per-Role Skill Index
+- Built once per job role from get_job_roles() (or any role dict with skillKeywords)
+- Frozensets of required skills/certifications, a skill -> bit index and a
+  case-normalized lookup ("Log Analysis" == "log analysis" == "Log analysis")
+- Skill matching becomes a bitmask OR + popcount instead of list scans
+- Matched/missing skill lists are derived from the mask and memoized per role
+"""
+
+from functools import lru_cache, reduce
+from operator import or_
+
+def normalize_skill(skill):
+    """Case- and whitespace-insensitive key for a skill name"""
+    return ' '.join(skill.lower().split())
+
+class _SkillBits(dict):
+    """
+    skill name -> bit lookup
+    Unknown spellings are normalized once and memoized (0 when the skill is
+    not required), so repeat lookups are a single dict hit
+    """
+
+    def __missing__(self, skill):
+        bit = self[skill] = self.get(normalize_skill(skill), 0)
+        return bit
+
+class SkillIndex:
+    """Compiled skill lookup for a single job role"""
+
+    __slots__ = ('role_id', 'required_skills', 'required_set', 'required_certs',
+                 'bits', 'full_mask', '_split_cache')
+
+    def __init__(self, role_id, required_skills, required_certs=()):
+        self.role_id = role_id
+        self.required_skills = tuple(required_skills)
+        self.required_set = frozenset(self.required_skills)
+        self.required_certs = frozenset(required_certs)
+
+        # Normalized skill name -> bit; duplicates (after normalization) share a bit
+        self.bits = _SkillBits()
+        for skill in self.required_skills:
+            key = normalize_skill(skill)
+            if key not in self.bits:
+                self.bits[key] = 1 << len(self.bits)
+        self.full_mask = (1 << len(self.bits)) - 1
+        for skill in self.required_skills:
+            self.bits[skill] = self.bits[normalize_skill(skill)]
+        self._split_cache = {}
+
+    def __len__(self):
+        return len(self.required_skills)
+
+    def __getstate__(self):
+        return (self.role_id, self.required_skills, tuple(self.required_certs))
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def mask(self, skills):
+        """Bitmask of the role's required skills present in `skills`"""
+        return reduce(or_, map(self.bits.__getitem__, skills), 0)
+
+    def matched_count(self, mask):
+        """Number of required skills matched by a mask (popcount)"""
+        return mask.bit_count()
+
+    def split(self, mask):
+        """
+        (matched, missing) required-skill lists for a mask, in role order
+        using the role's own spelling of each skill
+        """
+        result = self._split_cache.get(mask)
+        if result is None:
+            bits = self.bits
+            matched = []
+            missing = []
+            for skill in self.required_skills:
+                if mask & bits[skill]:
+                    matched.append(skill)
+                else:
+                    missing.append(skill)
+            result = self._split_cache[mask] = (tuple(matched), tuple(missing))
+        return list(result[0]), list(result[1])
+
+    def cert_count(self, certifications):
+        """Number of held certifications that the role lists"""
+        return len(self.required_certs.intersection(certifications))
+
+@lru_cache(maxsize=None)
+def _compile(role_id, required_skills, required_certs):
+    return SkillIndex(role_id, required_skills, required_certs)
+
+def compile_role(job_role):
+    """
+    Compiled SkillIndex for a role dict
+    The index is memoized on the dict under '_skill_index' (and shared
+    between copies of the same role by the module-level cache)
+    """
+    index = job_role.get('_skill_index')
+    if index is None:
+        index = job_role['_skill_index'] = _compile(
+            job_role.get('id', job_role.get('role_id')),
+            tuple(job_role.get('skillKeywords', [])),
+            tuple(job_role.get('certifications', [])),
+        )
+    return index
+
+def compile_roles(job_roles):
+    """Compile every role; returns {role_id: SkillIndex}"""
+    return {str(role.get('id', role.get('role_id'))): compile_role(role) for role in job_roles}
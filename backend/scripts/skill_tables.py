@@ -0,0 +1,356 @@
+"""
+Normalized Skill Tables
+- skills: one row per distinct skill (case/whitespace-insensitive skill_key
+  plus the first spelling seen)
+- application_skills: (application, skill) with status matched/gap/tested and
+  the verified level and percentage from the application's test
+- application_certifications: one row per certification on an application
+- Indexed on skill and certification, so skill-gap analytics are joins
+  instead of json_each() scans over ai_analysis
+- generate_candidates_v2.py and add_multiple_applications.py write these
+  tables alongside the JSON columns; run this script to backfill existing
+  data in batches (one short transaction per batch, safe to re-run)
+
+Usage:
+    python backend/scripts/skill_tables.py --db backend/database/recruitment.db
+    python backend/scripts/skill_tables.py --full --report
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.append(os.path.dirname(__file__))
+
+from skill_index import normalize_skill
+
+DB_PATH = os.path.join(os.path.dirname(__file__), '../database/recruitment.db')
+
+BACKFILL_BATCH_SIZE = 5000
+
+SKILL_TABLES = ['skills', 'application_skills', 'application_certifications']
+
+SKILL_SCHEMA_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS skills (
+        skill_id INTEGER PRIMARY KEY,
+        skill_key TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS application_skills (
+        application_id INTEGER NOT NULL,
+        skill_id INTEGER NOT NULL,
+        status TEXT NOT NULL CHECK(status IN ('matched', 'gap', 'tested')),
+        verified_level TEXT CHECK(verified_level IN ('strong', 'moderate', 'weak')),
+        test_percentage REAL,
+        PRIMARY KEY (application_id, skill_id),
+        FOREIGN KEY (application_id) REFERENCES applications(application_id) ON DELETE CASCADE,
+        FOREIGN KEY (skill_id) REFERENCES skills(skill_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS application_certifications (
+        application_id INTEGER NOT NULL,
+        certification TEXT NOT NULL,
+        PRIMARY KEY (application_id, certification),
+        FOREIGN KEY (application_id) REFERENCES applications(application_id) ON DELETE CASCADE
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_application_skills_skill ON application_skills(skill_id, status, verified_level)",
+    "CREATE INDEX IF NOT EXISTS idx_application_certifications_name ON application_certifications(certification)",
+]
+
+INSERT_SKILL_SQL = "INSERT INTO skills (skill_id, skill_key, name) VALUES (?, ?, ?)"
+
+INSERT_APPLICATION_SKILL_SQL = """
+    INSERT INTO application_skills (application_id, skill_id, status, verified_level, test_percentage)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+INSERT_APPLICATION_CERT_SQL = """
+    INSERT INTO application_certifications (application_id, certification)
+    VALUES (?, ?)
+"""
+
+# Latest analysis per batch row with the application's latest test
+BACKFILL_SELECT_SQL = """
+    SELECT a.analysis_id, a.application_id, a.skills_matched, a.skill_gaps, a.certifications,
+           (SELECT t.verification_details FROM tests t
+            WHERE t.application_id = a.application_id
+            ORDER BY t.test_id DESC LIMIT 1) AS verification_details
+    FROM ai_analysis a
+    WHERE a.analysis_id > ? {missing_only}
+    ORDER BY a.analysis_id
+    LIMIT ?
+"""
+
+MISSING_ONLY_SQL = """
+      AND NOT EXISTS (SELECT 1 FROM application_skills s WHERE s.application_id = a.application_id)
+      AND NOT EXISTS (SELECT 1 FROM application_certifications c WHERE c.application_id = a.application_id)
+"""
+
+TOP_SKILL_GAPS_SQL = """
+    SELECT s.name, COUNT(*) AS gaps,
+           SUM(x.verified_level = 'weak') AS weak_on_test
+    FROM application_skills x
+    JOIN skills s ON s.skill_id = x.skill_id
+    {role_join}
+    WHERE x.status = 'gap' {role_filter}
+    GROUP BY x.skill_id
+    ORDER BY gaps DESC, s.name
+    LIMIT ?
+"""
+
+def skill_tables_exist(cursor):
+    cursor.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' "
+        f"AND name IN ({','.join('?' * len(SKILL_TABLES))})", SKILL_TABLES)
+    return cursor.fetchone()[0] == len(SKILL_TABLES)
+
+def ensure_skill_tables(cursor):
+    """
+    Create the normalized tables and their indexes when they are missing
+    Returns True when they were created. Existing tables are left alone, so
+    a reseed that copied the schema keeps its deferred index creation
+    """
+    if skill_tables_exist(cursor):
+        return False
+    for sql in SKILL_SCHEMA_SQL:
+        cursor.execute(sql)
+    return True
+
+class SkillRegistry:
+    """
+    skill name -> skill_id, loaded once from the skills table
+    New skills get the next id and are inserted on the caller's cursor
+    (inside its transaction); spellings are normalized with normalize_skill()
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.ids = {}
+        cursor.execute("SELECT skill_id, skill_key FROM skills")
+        for skill_id, skill_key in cursor.fetchall():
+            self.ids[skill_key] = skill_id
+        self.next_id = max(self.ids.values(), default=0) + 1
+        self.created = 0
+
+    def id_for(self, name):
+        key = normalize_skill(name)
+        skill_id = self.ids.get(key)
+        if skill_id is None:
+            skill_id = self.ids[key] = self.next_id
+            self.cursor.execute(INSERT_SKILL_SQL, (skill_id, key, ' '.join(name.split())))
+            self.next_id += 1
+            self.created += 1
+        return skill_id
+
+def application_skill_rows(application_id, matched, gaps, performance, registry):
+    """
+    application_skills rows for one application
+    performance is the test's per-skill breakdown ({skill: {'level', 'percentage', ...}});
+    tested skills outside matched/gaps get status 'tested'. Duplicate
+    spellings collapse to one row, matched taking precedence over gap
+    """
+    statuses = {}
+    for status, skills in (('matched', matched), ('gap', gaps), ('tested', performance or {})):
+        for skill in skills:
+            if isinstance(skill, str) and skill.strip():
+                statuses.setdefault(registry.id_for(skill), status)
+
+    levels = {}
+    for skill, result in (performance or {}).items():
+        if isinstance(skill, str) and skill.strip() and isinstance(result, dict):
+            levels[registry.id_for(skill)] = (result.get('level'), result.get('percentage'))
+
+    return [
+        (application_id, skill_id, status) + levels.get(skill_id, (None, None))
+        for skill_id, status in statuses.items()
+    ]
+
+def application_certification_rows(application_id, certifications):
+    """application_certifications rows for one application (duplicates dropped)"""
+    names = dict.fromkeys(cert.strip() for cert in certifications if isinstance(cert, str) and cert.strip())
+    return [(application_id, name) for name in names]
+
+def parse_json(text, default):
+    try:
+        return json.loads(text) if text else default
+    except (TypeError, ValueError):
+        return default
+
+def parse_skill_list(text):
+    """A JSON skill list; the backend's {"skills": [...], ...} gap objects give their skills list"""
+    value = parse_json(text, [])
+    if isinstance(value, dict):
+        value = value.get('skills') or []
+    return value if isinstance(value, list) else []
+
+def backfill_batch(cursor, registry, records):
+    """
+    Replace the normalized rows for a batch of
+    (application_id, skills_matched, skill_gaps, certifications, verification_details) JSON records
+    Returns (skill rows, certification rows) inserted
+    """
+    latest = {}
+    for application_id, matched, gaps, certifications, details in records:
+        latest[application_id] = (matched, gaps, certifications, details)  # Later analyses win
+
+    skill_rows = []
+    cert_rows = []
+    for application_id, (matched, gaps, certifications, details) in latest.items():
+        performance = parse_json(details, {})
+        if not isinstance(performance, dict):
+            performance = {}
+        skill_rows.extend(application_skill_rows(
+            application_id, parse_skill_list(matched), parse_skill_list(gaps), performance, registry))
+        cert_rows.extend(application_certification_rows(application_id, parse_skill_list(certifications)))
+
+    application_ids = [(application_id,) for application_id in latest]
+    cursor.executemany("DELETE FROM application_skills WHERE application_id = ?", application_ids)
+    cursor.executemany("DELETE FROM application_certifications WHERE application_id = ?", application_ids)
+    cursor.executemany(INSERT_APPLICATION_SKILL_SQL, skill_rows)
+    cursor.executemany(INSERT_APPLICATION_CERT_SQL, cert_rows)
+    return len(skill_rows), len(cert_rows)
+
+def backfill_in_transaction(cursor, full=False, batch_size=BACKFILL_BATCH_SIZE):
+    """
+    backfill() on the caller's cursor and transaction, for bulk writers
+    that replace ai_analysis/tests (e.g. csv_dataset.py import): full=True
+    clears and rebuilds every normalized row, otherwise only applications
+    without rows are filled in. Returns the same totals as backfill()
+    """
+    ensure_skill_tables(cursor)
+    if full:
+        cursor.execute("DELETE FROM application_skills")
+        cursor.execute("DELETE FROM application_certifications")
+    registry = SkillRegistry(cursor)
+    sql = BACKFILL_SELECT_SQL.format(missing_only='' if full else MISSING_ONLY_SQL)
+    totals = {'applications': 0, 'application_skills': 0, 'application_certifications': 0, 'skills': 0}
+    last_id = 0
+    while True:
+        cursor.execute(sql, (last_id, batch_size))
+        batch = cursor.fetchall()
+        if not batch:
+            break
+        skill_rows, cert_rows = backfill_batch(cursor, registry, [row[1:] for row in batch])
+        last_id = batch[-1][0]
+        totals['applications'] += len({row[1] for row in batch})
+        totals['application_skills'] += skill_rows
+        totals['application_certifications'] += cert_rows
+    totals['skills'] = registry.created
+    return totals
+
+def backfill(db_path=DB_PATH, batch_size=BACKFILL_BATCH_SIZE, full=False):
+    """
+    Populate the normalized tables from ai_analysis/tests JSON
+    Walks ai_analysis by analysis_id in batches, committing after each one,
+    so the database stays writable for other connections in between.
+    By default only applications without normalized rows are processed
+    (an interrupted run resumes where it stopped); full=True rebuilds all.
+    Returns {'applications', 'application_skills', 'application_certifications', 'skills'}
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    cursor = conn.cursor()
+    totals = {'applications': 0, 'application_skills': 0, 'application_certifications': 0, 'skills': 0}
+    start_time = time.perf_counter()
+    try:
+        cursor.execute("BEGIN")
+        if ensure_skill_tables(cursor):
+            print("   ✅ Created skills, application_skills, application_certifications")
+        if full:
+            cursor.execute("DELETE FROM application_skills")
+            cursor.execute("DELETE FROM application_certifications")
+            print("   🗑️  Cleared normalized rows (full rebuild)")
+        cursor.execute("COMMIT")
+
+        sql = BACKFILL_SELECT_SQL.format(missing_only='' if full else MISSING_ONLY_SQL)
+        last_id = 0
+        while True:
+            cursor.execute("BEGIN")
+            registry = SkillRegistry(cursor)
+            cursor.execute(sql, (last_id, batch_size))
+            batch = cursor.fetchall()
+            if not batch:
+                cursor.execute("COMMIT")
+                break
+            skill_rows, cert_rows = backfill_batch(cursor, registry, [row[1:] for row in batch])
+            cursor.execute("COMMIT")
+
+            last_id = batch[-1][0]
+            totals['applications'] += len({row[1] for row in batch})
+            totals['application_skills'] += skill_rows
+            totals['application_certifications'] += cert_rows
+            totals['skills'] += registry.created
+            elapsed = max(time.perf_counter() - start_time, 1e-9)
+            print(f"   Progress: analysis_id ≤ {last_id}, {totals['applications']} applications "
+                  f"({totals['applications'] / elapsed:,.0f} applications/sec)")
+    except Exception as e:
+        print(f"\n❌ Backfill failed: {e}")
+        if conn.in_transaction:
+            cursor.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    return totals
+
+def top_skill_gaps(cursor, role_id=None, limit=10):
+    """Most frequent skill gaps, optionally for one role: [(skill, gaps, weak_on_test)]"""
+    if role_id is None:
+        sql = TOP_SKILL_GAPS_SQL.format(role_join='', role_filter='')
+        params = (limit,)
+    else:
+        sql = TOP_SKILL_GAPS_SQL.format(
+            role_join='JOIN applications a ON a.application_id = x.application_id',
+            role_filter='AND a.role_id = ?')
+        params = (role_id, limit)
+    cursor.execute(sql, params)
+    return cursor.fetchall()
+
+def print_report(db_path, role_id=None, limit=10):
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        cursor = conn.cursor()
+        scope = f"role {role_id}" if role_id is not None else "all roles"
+        start = time.perf_counter()
+        rows = top_skill_gaps(cursor, role_id, limit)
+        elapsed = time.perf_counter() - start
+        print(f"\n📊 Top skill gaps ({scope}, {elapsed * 1000:.1f} ms):")
+        for name, gaps, weak in rows:
+            print(f"   {name:40} {gaps:8} gaps, {weak or 0:8} weak on test")
+    finally:
+        conn.close()
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Backfill the normalized skill tables from the JSON columns")
+    parser.add_argument('--db', default=DB_PATH, help="SQLite database path")
+    parser.add_argument('--batch-size', type=int, default=BACKFILL_BATCH_SIZE,
+                        help="ai_analysis rows per batch (one transaction each)")
+    parser.add_argument('--full', action='store_true',
+                        help="Rebuild every application (default: only those without normalized rows)")
+    parser.add_argument('--report', action='store_true', help="Print the top skill gaps afterwards")
+    parser.add_argument('--role-id', type=int, default=None, help="Limit --report to one job role")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print(f"🧩 Backfilling normalized skill tables in {args.db} "
+          f"({'full rebuild' if args.full else 'missing applications only'}, batches of {args.batch_size})")
+    start = time.perf_counter()
+    totals = backfill(args.db, args.batch_size, args.full)
+    print(f"\n✅ {totals['applications']} applications → {totals['application_skills']} skill rows, "
+          f"{totals['application_certifications']} certification rows, {totals['skills']} new skills "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    if args.report:
+        print_report(args.db, args.role_id)
+
+if __name__ == "__main__":
+    main()
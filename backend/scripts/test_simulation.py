@@ -0,0 +1,415 @@
+"""
+Skill Test Simulation
+- Simulates candidates answering real questions from the question bank
+  (question_bank.py) instead of inventing a score
+- Ability model: theta = (ai_score - 60) / 15 + noise; each question adds
+  a three-state skill effect: +SKILL_EFFECT when the candidate has one of
+  the role's required skills it validates, else -SKILL_EFFECT when they
+  lack one, else 0 (it only validates skills the role does not require).
+  Both paths below use this model. P(correct) =
+  GUESS_RATE + (1 - GUESS_RATE) x sigmoid(theta + effect); a wrong answer
+  picks one of the other options at random
+- Grading mirrors POST /api/tests/submit (routes/tests.js): score = points
+  earned / points available (0-100, rounded), per-skill correct/total/
+  percentage with level 'strong' at >= 50% and 'weak' below
+- simulate_test(): one session with random.Random (used by the seed
+  generators, deterministic per candidate)
+- simulate_sessions(): many sessions of one role at once with numpy
+  (optional dependency: pip install numpy), for load-test payloads of the
+  scoring and verification endpoints
+- --check-agreement simulates each role both ways and compares the mean
+  scores (z-test), so the two paths cannot drift apart
+
+Usage:
+    python backend/scripts/test_simulation.py --sessions 1000000
+    python backend/scripts/test_simulation.py --sessions 100000 --role-id 4 --output sessions.jsonl
+    python backend/scripts/test_simulation.py --sessions 20000 --check-agreement
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(__file__))
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from question_bank import load_question_bank, max_questions_for
+from scoring import load_role_catalog
+from skill_index import normalize_skill
+
+# Four options per question: a blind guess is right a quarter of the time
+GUESS_RATE = 0.25
+# Ability shift on questions for skills the candidate has / lacks
+SKILL_EFFECT = 0.8
+# Ability scale: an AI score of ABILITY_CENTER is average, ABILITY_SCALE points is one unit
+ABILITY_CENTER = 60
+ABILITY_SCALE = 15
+# Day-to-day spread of test performance around the resume-based ability
+ABILITY_NOISE = 0.6
+# Level threshold of the submit endpoint (percentage of a skill's questions)
+STRONG_PERCENTAGE = 50
+
+# simulate_sessions() without AI scores draws them from N(mean, sd), clipped to 0-100
+SESSION_AI_MEAN = 72
+SESSION_AI_SD = 12
+# Sessions per numpy batch in the CLI (bounds memory)
+SESSION_BATCH = 100000
+# --check-agreement fails a role when its mean scores differ by more than this many standard errors
+AGREEMENT_Z = 4
+
+def require_numpy():
+    """Fail with an actionable message when numpy is not installed"""
+    if np is None:
+        raise ImportError("simulate_sessions requires numpy: pip install numpy")
+
+def js_round_percentage(part, whole):
+    """Math.round(part / whole * 100) for non-negative integers (halves round up)"""
+    return (200 * part + whole) // (2 * whole)
+
+def correct_probability(theta):
+    """P(correct answer) at ability theta"""
+    return GUESS_RATE + (1 - GUESS_RATE) / (1 + math.exp(-theta))
+
+def grade_answers(bank, question_indexes, answers):
+    """
+    (score, verification details) for answers to the given questions,
+    computed as routes/tests.js does on submission
+    """
+    selected = {answer['questionId']: answer['selectedOption'] for answer in answers}
+    earned = 0
+    available = 0
+    counts = {}
+    for index in question_indexes:
+        question = bank.questions[index]
+        available += question['points']
+        is_correct = selected.get(question['id']) == question['correct']
+        if is_correct:
+            earned += question['points']
+        for skill in question['skills']:
+            count = counts.setdefault(skill, [0, 0])
+            count[1] += 1
+            if is_correct:
+                count[0] += 1
+
+    details = {}
+    for skill, (correct, total) in counts.items():
+        percentage = js_round_percentage(correct, total)
+        details[skill] = {
+            'correct': correct,
+            'total': total,
+            'percentage': percentage,
+            'level': 'strong' if percentage >= STRONG_PERCENTAGE else 'weak',
+        }
+    return js_round_percentage(earned, available), details
+
+def test_questions_for(job_role, bank, rng=None):
+    """Question indexes of one test for a role (ValueError when it has none)"""
+    category = job_role.get('testCategory')
+    indexes = bank.select_questions(category, max_questions_for(job_role['title']), rng)
+    if not indexes:
+        raise ValueError(f"No test questions for {job_role['title']} (category: {category})")
+    return indexes
+
+def skill_effect(keys, matched, missing):
+    """Three-state skill effect of a question with normalized skills `keys`"""
+    if keys & matched:
+        return SKILL_EFFECT
+    if keys & missing:
+        return -SKILL_EFFECT
+    return 0
+
+def simulate_test(candidate, job_role, rng=random, bank=None):
+    """
+    One test session for an eligible candidate
+    Returns (score, verification details, answers) - answers in the submit
+    payload format [{questionId, selectedOption}]
+    """
+    if bank is None:
+        bank = load_question_bank()
+    question_indexes = test_questions_for(job_role, bank, rng)
+
+    theta = (candidate['ai_score'] - ABILITY_CENTER) / ABILITY_SCALE + rng.gauss(0, ABILITY_NOISE)
+    matched = {normalize_skill(skill) for skill in candidate['matched_skills']}
+    missing = {normalize_skill(skill) for skill in candidate['missing_skills']}
+
+    answers = []
+    for index in question_indexes:
+        question = bank.questions[index]
+        option = question['correct']
+        effect = skill_effect(bank.skill_keys[index], matched, missing)
+        if rng.random() >= correct_probability(theta + effect):
+            options = len(question['options'])
+            option = (option + rng.randint(1, options - 1)) % options
+        answers.append({'questionId': question['id'], 'selectedOption': option})
+
+    score, details = grade_answers(bank, question_indexes, answers)
+    return score, details, answers
+
+class RoleTestModel:
+    """
+    numpy view of one role's question pool for simulate_sessions():
+    per-question ids, points, correct options, option counts, primary skill
+    group, a question x skill matrix (skills in first-seen order) and a
+    question x required-skill matrix (the role's normalized skillKeywords
+    the pool validates) for the skill effect
+    """
+
+    def __init__(self, job_role, bank=None):
+        require_numpy()
+        if bank is None:
+            bank = load_question_bank()
+        self.job_role = job_role
+        self.indexes = bank.category_questions(job_role.get('testCategory'))
+        if not self.indexes:
+            raise ValueError(f"No test questions for {job_role['title']} "
+                             f"(category: {job_role.get('testCategory')})")
+        self.max_questions = min(max_questions_for(job_role['title']), len(self.indexes))
+        questions = [bank.questions[index] for index in self.indexes]
+
+        self.ids = np.array([q['id'] for q in questions])
+        self.points = np.array([q['points'] for q in questions])
+        self.correct = np.array([q['correct'] for q in questions])
+        self.options = np.array([len(q['options']) for q in questions])
+
+        primaries = list(dict.fromkeys(q['skills'][0] for q in questions))
+        self.group = np.array([primaries.index(q['skills'][0]) for q in questions])
+        self.groups = len(primaries)
+        # Position of each group's first question once sorted by group
+        self.group_starts = np.concatenate(([0], np.cumsum(np.bincount(self.group))[:-1]))
+
+        self.skills = list(dict.fromkeys(skill for q in questions for skill in q['skills']))
+        self.skill_matrix = np.zeros((len(questions), len(self.skills)), dtype=np.int64)
+        for row, question in enumerate(questions):
+            for skill in question['skills']:
+                self.skill_matrix[row, self.skills.index(skill)] = 1
+
+        keys = [bank.skill_keys[index] for index in self.indexes]
+        tested = set().union(*keys)
+        self.required_keys = [key for key in dict.fromkeys(map(normalize_skill, job_role.get('skillKeywords', ())))
+                              if key in tested]
+        self.required_matrix = np.zeros((len(questions), len(self.required_keys)), dtype=np.int64)
+        for row, question_keys in enumerate(keys):
+            for column, key in enumerate(self.required_keys):
+                if key in question_keys:
+                    self.required_matrix[row, column] = 1
+
+    def select(self, rng, count):
+        """
+        (count, max_questions) question positions per session, in the order
+        getTestForJobTitle() returns them: per_skill picks from each primary
+        skill group (groups in first-seen order), then random top-up
+        """
+        size = len(self.indexes)
+        if size <= self.max_questions:
+            return np.broadcast_to(np.arange(size), (count, size))
+        per_skill = max(1, self.max_questions // self.groups)
+        keys = rng.random((count, size))
+        # Rank of each question within its group under the random keys
+        order = np.lexsort((keys, np.broadcast_to(self.group, (count, size))), axis=1)
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, np.arange(size) - self.group_starts[self.group[order]], axis=1)
+        # First-pass picks in JS order, then the rest by their random keys
+        priority = np.where(rank < per_skill, self.group * per_skill + rank, self.groups * per_skill + keys)
+        return np.argsort(priority, axis=1)[:, :self.max_questions]
+
+def simulate_sessions(job_role, count, seed=None, ai_scores=None, skill_rate=None, bank=None, model=None):
+    """
+    `count` test sessions for one role, vectorized with numpy
+    ai_scores: per-session AI scores (drawn from N(SESSION_AI_MEAN,
+    SESSION_AI_SD) when omitted); skill_rate: per-session probability of
+    having each of the role's required skills (ai_score / 100 when omitted)
+    Returns a dict of arrays: question_ids and selected_options (count x
+    questions), score (count), skill_correct / skill_total (count x skills)
+    plus the skill names in column order
+    """
+    if model is None:
+        model = RoleTestModel(job_role, bank)
+    rng = np.random.default_rng(seed)
+    if ai_scores is None:
+        ai_scores = np.clip(rng.normal(SESSION_AI_MEAN, SESSION_AI_SD, count), 0, 100)
+    ai_scores = np.asarray(ai_scores, dtype=float)
+    if skill_rate is None:
+        skill_rate = ai_scores / 100
+    skill_rate = np.broadcast_to(np.asarray(skill_rate, dtype=float), (count,))
+
+    positions = model.select(rng, count)
+    theta = (ai_scores - ABILITY_CENTER) / ABILITY_SCALE + rng.normal(0, ABILITY_NOISE, count)
+    has_skill = rng.random((count, len(model.required_keys))) < skill_rate[:, None]
+    # Three-state effect per (session, question), as skill_effect(): + when a
+    # validated required skill is held, else - when one is lacking, else 0
+    rows = np.arange(count)[:, None]
+    holds = (has_skill.astype(np.int64) @ model.required_matrix.T)[rows, positions] > 0
+    lacks = ((~has_skill).astype(np.int64) @ model.required_matrix.T)[rows, positions] > 0
+    effect = np.where(holds, SKILL_EFFECT, np.where(lacks, -SKILL_EFFECT, 0))
+    probability = GUESS_RATE + (1 - GUESS_RATE) / (1 + np.exp(-(theta[:, None] + effect)))
+    is_correct = rng.random(positions.shape) < probability
+
+    correct_options = model.correct[positions]
+    options = model.options[positions]
+    shift = np.floor(rng.random(positions.shape) * (options - 1)).astype(np.int64) + 1
+    selected = np.where(is_correct, correct_options, (correct_options + shift) % options)
+
+    points = model.points[positions]
+    score = js_round_percentage((points * is_correct).sum(axis=1), points.sum(axis=1))
+
+    asked = np.zeros((count, len(model.indexes)), dtype=np.int64)
+    right = np.zeros_like(asked)
+    asked[rows, positions] = 1
+    right[rows, positions] = is_correct
+    return {
+        'question_ids': model.ids[positions],
+        'selected_options': selected,
+        'score': score,
+        'skill_correct': right @ model.skill_matrix,
+        'skill_total': asked @ model.skill_matrix,
+        'skills': model.skills,
+    }
+
+def check_agreement(job_role, count, seed=None, bank=None, model=None):
+    """
+    Simulate `count` sessions of a role with simulate_sessions() and with
+    simulate_test() on the same input distribution (AI score from
+    N(SESSION_AI_MEAN, SESSION_AI_SD), each required skill held with
+    probability ai_score / 100)
+    Returns (vectorized mean score, scalar mean score, z of the difference)
+    """
+    if bank is None:
+        bank = load_question_bank()
+    vector_scores = simulate_sessions(job_role, count, seed, bank=bank, model=model)['score']
+
+    rng = random.Random(seed)
+    required = list(dict.fromkeys(job_role.get('skillKeywords', ())))
+    scalar_scores = []
+    for _ in range(count):
+        ai_score = min(max(rng.gauss(SESSION_AI_MEAN, SESSION_AI_SD), 0), 100)
+        held = [rng.random() < ai_score / 100 for _ in required]
+        candidate = {
+            'ai_score': ai_score,
+            'matched_skills': [skill for skill, has in zip(required, held) if has],
+            'missing_skills': [skill for skill, has in zip(required, held) if not has],
+        }
+        scalar_scores.append(simulate_test(candidate, job_role, rng, bank)[0])
+    scalar_scores = np.array(scalar_scores, dtype=float)
+
+    standard_error = math.sqrt(vector_scores.var(ddof=1) / count + scalar_scores.var(ddof=1) / count)
+    difference = vector_scores.mean() - scalar_scores.mean()
+    z = difference / standard_error if standard_error else 0.0
+    return float(vector_scores.mean()), float(scalar_scores.mean()), float(z)
+
+def run_agreement_check(models, count, seed=None, bank=None):
+    """Print check_agreement() per role; returns the number of roles that disagree"""
+    print(f"🔍 Comparing simulate_sessions() with simulate_test() ({count:,} sessions per role)...")
+    failed = 0
+    for model in models:
+        vector_mean, scalar_mean, z = check_agreement(model.job_role, count, seed, bank, model)
+        ok = abs(z) <= AGREEMENT_Z
+        failed += not ok
+        print(f"   {'✅' if ok else '❌'} {model.job_role['title']}: vectorized {vector_mean:.2f} | "
+              f"scalar {scalar_mean:.2f} | z = {z:+.2f}")
+    if failed:
+        print(f"❌ {failed} role(s) differ by more than {AGREEMENT_Z} standard errors")
+    else:
+        print("✅ Both simulation paths agree")
+    return failed
+
+def session_payloads(sessions):
+    """
+    Per session: the submit payload ({answers}) and the response the
+    endpoint should compute for it (score, verification details, verified /
+    unverified skills), for replaying against the backend
+    """
+    skills = sessions['skills']
+    for question_ids, selected, score, correct_row, total_row in zip(
+            sessions['question_ids'].tolist(), sessions['selected_options'].tolist(),
+            sessions['score'].tolist(), sessions['skill_correct'].tolist(),
+            sessions['skill_total'].tolist()):
+        details = {}
+        for skill, correct, total in zip(skills, correct_row, total_row):
+            if total:
+                percentage = js_round_percentage(correct, total)
+                details[skill] = {
+                    'correct': correct,
+                    'total': total,
+                    'percentage': percentage,
+                    'level': 'strong' if percentage >= STRONG_PERCENTAGE else 'weak',
+                }
+        yield {
+            'answers': [{'questionId': q, 'selectedOption': o} for q, o in zip(question_ids, selected)],
+            'expected': {
+                'score': score,
+                'verification_details': details,
+                'verified_skills': [s for s, d in details.items() if d['level'] != 'weak'],
+                'unverified_skills': [s for s, d in details.items() if d['level'] == 'weak'],
+            },
+        }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate skill test sessions against the question bank")
+    parser.add_argument('--sessions', type=int, default=100000, help="Sessions to simulate (default: 100000)")
+    parser.add_argument('--role-id', type=str, default=None,
+                        help="Role id from the catalog (default: spread sessions over every role)")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible sessions")
+    parser.add_argument('--output', type=str, default=None,
+                        help="Write submit payloads and expected results as JSON lines")
+    parser.add_argument('--check-agreement', action='store_true',
+                        help="Compare the vectorized and per-candidate simulations instead (--sessions per role)")
+    args = parser.parse_args(argv)
+    if args.sessions < 1:
+        parser.error("--sessions must be at least 1")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    require_numpy()
+    roles = load_role_catalog()
+    if args.role_id is not None:
+        roles = [role for role in roles if role['id'] == args.role_id]
+        if not roles:
+            print(f"❌ Unknown role id: {args.role_id}")
+            return 1
+
+    bank = load_question_bank()
+    models = [RoleTestModel(role, bank) for role in roles]
+    if args.check_agreement:
+        return 1 if run_agreement_check(models, args.sessions, args.seed, bank) else 0
+
+    seeds = np.random.SeedSequence(args.seed)
+    print(f"🧪 Simulating {args.sessions:,} test sessions over {len(models)} role(s)...")
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else None
+    start = time.perf_counter()
+    simulated = 0
+    score_sum = 0
+    try:
+        per_role = [args.sessions // len(models) + (i < args.sessions % len(models)) for i in range(len(models))]
+        for model, role_sessions in zip(models, per_role):
+            for batch_start in range(0, role_sessions, SESSION_BATCH):
+                count = min(SESSION_BATCH, role_sessions - batch_start)
+                sessions = simulate_sessions(model.job_role, count, seeds.spawn(1)[0], model=model)
+                simulated += count
+                score_sum += int(sessions['score'].sum())
+                if output is not None:
+                    for payload in session_payloads(sessions):
+                        payload['role_id'] = model.job_role['id']
+                        output.write(json.dumps(payload) + '\n')
+    finally:
+        if output is not None:
+            output.close()
+    seconds = time.perf_counter() - start
+
+    print(f"✅ {simulated:,} sessions in {seconds:.2f}s ({simulated / seconds:,.0f} sessions/s)")
+    print(f"   Average score: {score_sum / simulated:.1f}")
+    if args.output:
+        print(f"   Payloads written to {args.output}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Time-Series Application Traffic
+- Arrival model for multi-year application streams:
+    rate(role, t) = applications_per_day x role share x yearly growth
+                    x weekday weight x posting spike(role, t)
+  with arrivals per (day, role) drawn from a Poisson distribution and
+  times of day drawn from a diurnal (hour-of-day) profile
+- Roles are re-posted every repost_days [min, max]; each posting adds a
+  spike that decays exponentially (spike_boost, spike_decay_days)
+- Pure model code: generate_candidates_v2.py turns the arrivals into
+  candidates, one day at a time and in timestamp order
+- Configured through a profile's "time_series" section (see profiles.py)
+"""
+
+import bisect
+import math
+from datetime import timedelta
+
+DEFAULT_TIME_SERIES = {
+    'years': 3,
+    'applications_per_day': 150,
+    # Relative arrivals per hour of day (0-23): business hours with an evening tail
+    'diurnal': [1.0, 0.5, 0.3, 0.3, 0.3, 0.5, 1.0, 2.0, 4.0, 6.0, 7.0, 7.0,
+                6.0, 6.0, 7.0, 7.0, 6.0, 5.0, 4.0, 4.0, 3.5, 3.0, 2.0, 1.5],
+    # Relative arrivals per weekday, Monday first
+    'weekly': [1.2, 1.15, 1.1, 1.0, 0.85, 0.45, 0.5],
+    # Traffic growth per year (0.15 = 15% more applications each year)
+    'yearly_growth': 0.15,
+    'repost_days': [60, 120],
+    'spike_boost': 3.0,
+    'spike_decay_days': 7.0,
+}
+
+# Poisson draws switch from exact sampling to a normal approximation here
+POISSON_NORMAL_THRESHOLD = 60
+
+def resolve_time_series(config):
+    """Time-series settings merged over DEFAULT_TIME_SERIES and validated (ValueError)"""
+    if not isinstance(config, dict):
+        raise ValueError("time_series must be a mapping")
+    unknown = set(config) - set(DEFAULT_TIME_SERIES)
+    if unknown:
+        raise ValueError(f"Unknown time_series keys: {', '.join(sorted(unknown))}")
+    resolved = dict(DEFAULT_TIME_SERIES, **config)
+
+    def number(key, minimum=0):
+        value = resolved[key]
+        if not isinstance(value, (int, float)) or value < minimum:
+            raise ValueError(f"time_series.{key} must be a number >= {minimum}")
+
+    number('years')
+    number('applications_per_day')
+    number('yearly_growth', -0.99)
+    number('spike_boost')
+    if resolved['years'] <= 0:
+        raise ValueError("time_series.years must be positive")
+    if not isinstance(resolved['spike_decay_days'], (int, float)) or resolved['spike_decay_days'] <= 0:
+        raise ValueError("time_series.spike_decay_days must be positive")
+    for key, length in (('diurnal', 24), ('weekly', 7)):
+        weights = resolved[key]
+        if (not isinstance(weights, list) or len(weights) != length
+                or any(not isinstance(w, (int, float)) or w < 0 for w in weights) or sum(weights) <= 0):
+            raise ValueError(f"time_series.{key} must be {length} non-negative weights")
+    repost = resolved['repost_days']
+    if (not isinstance(repost, list) or len(repost) != 2
+            or not all(isinstance(days, int) for days in repost) or not 1 <= repost[0] <= repost[1]):
+        raise ValueError("time_series.repost_days must be [min, max] days with 1 <= min <= max")
+    return resolved
+
+def timeline(config, now):
+    """(first day, number of days) covered by the stream, ending today"""
+    days = max(1, int(round(config['years'] * 365)))
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=days - 1), days
+
+def posting_schedule(role_ids, start, now, config, rng):
+    """
+    Posting dates per role: the first one up to one repost interval before
+    the stream starts, then every repost_days [min, max] until now
+    """
+    low, high = config['repost_days']
+    postings = {}
+    for role_id in role_ids:
+        posted = start - timedelta(days=rng.randint(0, high), hours=rng.randint(8, 17))
+        dates = []
+        while posted <= now:
+            dates.append(posted)
+            posted += timedelta(days=rng.randint(low, high))
+        postings[role_id] = dates
+    return postings
+
+def latest_posting(dates, when):
+    """Most recent posting at or before `when` (the first one if none)"""
+    index = bisect.bisect_right(dates, when)
+    return dates[max(index - 1, 0)]
+
+def spike_factor(dates, day, config):
+    """1 + decaying boost from the latest posting before the end of `day`"""
+    posted = latest_posting(dates, day + timedelta(days=1))
+    age_days = (day - posted).total_seconds() / 86400
+    return 1.0 + config['spike_boost'] * math.exp(-max(age_days, 0) / config['spike_decay_days'])
+
+def daily_rates(day, start, role_share, postings, config):
+    """Expected applications per role on `day`"""
+    weekly = config['weekly']
+    weekday_weight = weekly[day.weekday()] / (sum(weekly) / len(weekly))
+    growth = (1 + config['yearly_growth']) ** ((day - start).days / 365)
+    base = config['applications_per_day'] * growth * weekday_weight
+    return {role_id: base * share * spike_factor(postings[role_id], day, config)
+            for role_id, share in role_share.items()}
+
+def poisson(rng, lam):
+    """Poisson draw from a random.Random (normal approximation for large means)"""
+    if lam <= 0:
+        return 0
+    if lam >= POISSON_NORMAL_THRESHOLD:
+        return max(0, int(round(rng.gauss(lam, math.sqrt(lam)))))
+    # Knuth: multiply uniforms until the product drops below e^-lambda
+    limit = math.exp(-lam)
+    count = 0
+    product = rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+def day_arrivals(day, start, role_share, postings, config, rng, now=None):
+    """
+    Sorted [(timestamp, role_id)] for one day
+    Roles are drawn in role_share order so the draws are reproducible;
+    arrivals after `now` (later today) are dropped
+    """
+    hours = range(24)
+    arrivals = []
+    for role_id, rate in daily_rates(day, start, role_share, postings, config).items():
+        count = poisson(rng, rate)
+        for hour in rng.choices(hours, weights=config['diurnal'], k=count):
+            arrivals.append((day + timedelta(hours=hour, minutes=rng.randint(0, 59),
+                                             seconds=rng.randint(0, 59)), role_id))
+    arrivals.sort()
+    if now is not None:
+        arrivals = [arrival for arrival in arrivals if arrival[0] <= now]
+    return arrivals
+
+def expected_total(start, days, role_share, postings, config):
+    """Expected number of applications over the whole stream"""
+    return sum(
+        sum(daily_rates(start + timedelta(days=offset), start, role_share, postings, config).values())
+        for offset in range(days)
+    )